@@ -2,23 +2,56 @@ from flask import Flask, Blueprint
 from config import Config
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
+import logging
 import os # Import os for secret key generation
+from .riddle_cache import RiddleRepository
+from .logs import setup_logging
 
 db = SQLAlchemy()
 migrate = Migrate()
+riddle_repository = RiddleRepository() # In-memory riddles for today (see riddle_cache.py)
 main = Blueprint('main', __name__) # Define the blueprint object
+logger = logging.getLogger(__name__)
 
 def create_app(config_class=Config):
     app = Flask(__name__)
     app.config.from_object(config_class)
+    setup_logging(app) # JSON logs written off the request thread (see logs.py)
 
     # Ensure SECRET_KEY is set for flash messages
     if not app.config.get('SECRET_KEY'):
         app.config['SECRET_KEY'] = os.urandom(24)
-        print("Warning: SECRET_KEY not set in config, using a temporary random key.")
+        logger.warning("SECRET_KEY not set in config, using a temporary random key.")
 
     db.init_app(app)
     migrate = Migrate(app, db) # Initialize Migrate here
+    riddle_repository.init_app(app)
+
+    from . import game_state
+    game_state.init_app(app) # Where per-player game state lives (cookie / memory / sql)
+
+    from .stats import stats_writer
+    stats_writer.init_app(app) # Only active with STATS_WRITE_BEHIND = True
+
+    from . import deploy
+    deploy.init_app(app) # DEPLOY_VERSION, part of the game page ETags
+
+    from .page_cache import page_cache
+    page_cache.init_app(app) # Rendered game / more_games pages, per day
+
+    from .assets import assets
+    assets.init_app(app) # asset_urls() for the templates: built CSS/JS bundles, or their sources
+
+    from .pixelation import pixelator
+    pixelator.init_app(app) # Server-rendered Pixelated mode images (needs Pillow + an emoji font)
+
+    from .metrics import metrics
+    metrics.init_app(app) # Request latency / SQL / template / cookie size histograms at /metrics
+
+    if app.config.get('SESSION_SERIALIZER') == 'compact':
+        from .session_codec import CompactSessionInterface
+        from .models import AVAILABLE_MODES
+        app.session_interface = CompactSessionInterface(AVAILABLE_MODES, window_days=app.config.get('SESSION_STATE_WINDOW_DAYS', 3))
 
     # Import and register the blueprint
     from .routes import main as main_blueprint
@@ -0,0 +1,95 @@
+"""
+Precomputed answer data for a riddle name.
+
+Guesses are single letters a-z, so a set of guesses fits in a 26-bit mask
+(bit 0 = 'a', bit 25 = 'z'). The profile stores the answer's required letters as
+such a mask, where each letter appears in the name and the masked display template,
+so evaluating a guess is a couple of bit operations instead of rescanning the name.
+"""
+from functools import lru_cache
+
+LETTER_BITS = {chr(ord('a') + i): 1 << i for i in range(26)}
+ALL_LETTERS_MASK = (1 << 26) - 1
+_LETTERS = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def letter_bit(letter):
+    """Bit for a single lowercase letter, 0 if it isn't a-z."""
+    return LETTER_BITS.get(letter, 0)
+
+
+def guesses_to_mask(guesses):
+    mask = 0
+    for letter in guesses:
+        mask |= LETTER_BITS.get(letter, 0)
+    return mask
+
+
+def mask_to_letters(mask):
+    """Letters set in mask, in alphabetical order."""
+    letters = []
+    mask &= ALL_LETTERS_MASK
+    while mask:
+        lowest = mask & -mask
+        letters.append(_LETTERS[lowest.bit_length() - 1])
+        mask ^= lowest
+    return letters
+
+
+def _popcount(value):
+    return bin(value).count('1')
+
+
+class AnswerProfile:
+    __slots__ = ('name', 'required_mask', 'positions', 'template', 'solved_display')
+
+    def __init__(self, name):
+        self.name = name
+        required_mask = 0
+        positions = {}
+        template = []
+        for index, char in enumerate(name):
+            bit = LETTER_BITS.get(char.lower(), 0)
+            if bit:
+                required_mask |= bit
+                positions.setdefault(char.lower(), []).append(index)
+                template.append('_')
+            else:
+                template.append(char) # Spaces, hyphens, digits... are shown as-is
+        self.required_mask = required_mask
+        self.positions = {letter: tuple(indexes) for letter, indexes in positions.items()}
+        self.template = ''.join(template)
+        # What the player sees once the game is over: every letter revealed, the other
+        # characters shown as-is, as in the template
+        self.solved_display = name
+
+    def is_correct(self, letter):
+        return bool(self.required_mask & letter_bit(letter))
+
+    def is_solved(self, guess_mask):
+        return not (self.required_mask & ~guess_mask)
+
+    def incorrect_count(self, guess_mask):
+        return _popcount(guess_mask & ~self.required_mask)
+
+    def revealed_positions(self, letter):
+        return self.positions.get(letter, ())
+
+    def display(self, guess_mask):
+        """The answer with unguessed letters replaced by '_'."""
+        hits = guess_mask & self.required_mask
+        if not hits:
+            return self.template
+        chars = list(self.template)
+        name = self.name
+        for letter, indexes in self.positions.items():
+            if hits & LETTER_BITS[letter]:
+                for index in indexes:
+                    chars[index] = name[index]
+        return ''.join(chars)
+
+
+@lru_cache(maxsize=4096)
+def answer_profile_for(name):
+    """Shared profile per riddle name (the same name is used on many days/modes)."""
+    return AnswerProfile(name)
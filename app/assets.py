@@ -0,0 +1,345 @@
+"""
+Fingerprinted, precompressed CSS/JS bundles.
+
+The page styles and scripts live as source files under app/static (css/, js/). BUNDLES
+lists which sources make up each file a page links to; 'flask main build-assets'
+concatenates them, drops repeated CSS rules, minifies, and writes
+app/static/dist/<name>.<content hash>.<ext> plus .gz (and .br if the optional 'brotli'
+package is installed) variants and a manifest.json. Those are served from /assets/ with
+a one-year immutable Cache-Control: a changed file gets a new name, so browsers never
+have to revalidate them.
+
+Templates link bundles with asset_urls('<bundle>'), which gives the hashed URL when a
+build matches the current sources, and otherwise the plain /static/ URLs of the source
+files (so a checkout works without building, and an outdated build is never served).
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+
+from flask import url_for
+
+try:
+    import brotli
+except ImportError: # Optional: without it only the .gz variants are written
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+BUNDLES = {
+    'style.css': ['css/style.css'],
+    'classic_game.css': ['css/game.css', 'css/classic_game.css'],
+    'pixelated_game.css': ['css/game.css', 'css/pixelated_game.css'],
+    'more_games.css': ['css/more_games.css'],
+    'classic_game.js': ['js/theme.js', 'js/emoji_renderer.js', 'js/classic_game.js'],
+    'pixelated_game.js': ['js/theme.js', 'js/emoji_renderer.js', 'js/pixelated_game.js'],
+    'more_games.js': ['js/theme.js'],
+    'emoji_renderer.js': ['js/emoji_renderer.js'], # Also the pixelation Web Worker script
+}
+
+DIST_DIRNAME = 'dist'
+MANIFEST_NAME = 'manifest.json'
+HASH_LENGTH = 12
+# Variants written next to each bundle, in order of preference: (Content-Encoding, suffix)
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+# --- Minifiers ---
+# Deliberately conservative: they only drop comments and whitespace, so they can't change
+# what the code does. Compression does the rest.
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_SPACE_AROUND = re.compile(r'\s*([{};,>])\s*')
+_CSS_SPACE_AFTER_COLON = re.compile(r':\s+')
+
+
+def minify_css(source):
+    css = _CSS_COMMENT.sub('', source)
+    css = re.sub(r'\s+', ' ', css)
+    css = _CSS_SPACE_AROUND.sub(r'\1', css)
+    css = _CSS_SPACE_AFTER_COLON.sub(':', css) # Only after ':' ("a :hover" != "a:hover")
+    css = css.replace(';}', '}')
+    return css.strip()
+
+
+def split_css_rules(css):
+    """Top-level rules (including whole @media blocks) of minified CSS, in order."""
+    rules, depth, start = [], 0, 0
+    for i, char in enumerate(css):
+        if char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif char == ';' and depth == 0: # @import / @charset
+            rules.append(css[start:i + 1])
+            start = i + 1
+    if css[start:].strip():
+        rules.append(css[start:])
+    return rules
+
+
+def dedupe_css_rules(css):
+    """Drops exact repeats of a rule, keeping the last copy (so the cascade is unchanged)."""
+    rules = split_css_rules(css)
+    last_index = {rule: i for i, rule in enumerate(rules)}
+    return ''.join(rule for i, rule in enumerate(rules) if last_index[rule] == i and not rule.endswith('{}'))
+
+
+_HTML_INDENT = re.compile(r'\n\s+')
+_HTML_PRESERVED = re.compile(r'<(pre|textarea)[\s>]', re.I)
+
+
+def minify_html(html):
+    """Drops indentation and blank lines (the templates' loops repeat a lot of it)."""
+    if _HTML_PRESERVED.search(html):
+        return html # Whitespace matters in there, leave the page alone
+    return _HTML_INDENT.sub('\n', html)
+
+
+# After one of these (or at the start) a '/' starts a regex literal, otherwise it's a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = re.compile(r'(?:^|[^\w$])(?:return|typeof|case|do|else|in|of|new|delete|void|throw|instanceof|yield|await)$')
+
+
+def minify_js(source):
+    """Removes comments and indentation / blank lines; strings, template literals and regex literals are kept as they are."""
+    out = []
+    i, n = 0, len(source)
+    last_significant = ''
+    template_depths = [] # Brace depth at each `${` we're inside of
+    brace_depth = 0
+    pending_space = ''
+
+    def emit(text):
+        nonlocal pending_space, last_significant
+        if pending_space and out:
+            out.append(pending_space)
+        pending_space = ''
+        out.append(text)
+        last_significant = text[-1]
+
+    def read_template(i):
+        """Copies a template literal chunk from i (just after ` or }) up to the closing ` or a ${."""
+        start = i
+        while i < n:
+            if source[i] == '\\':
+                i += 2
+                continue
+            if source[i] == '`':
+                return i + 1, source[start:i + 1], False
+            if source.startswith('${', i):
+                return i + 2, source[start:i + 2], True
+            i += 1
+        return n, source[start:], False
+
+    while i < n:
+        char = source[i]
+        if char in ' \t\r\n':
+            j = i
+            while j < n and source[j] in ' \t\r\n':
+                j += 1
+            # Newlines are kept (statements may rely on them), other whitespace becomes one space
+            if '\n' in source[i:j]:
+                pending_space = '\n'
+            elif pending_space != '\n':
+                pending_space = ' '
+            i = j
+        elif source.startswith('//', i):
+            j = source.find('\n', i)
+            i = n if j == -1 else j
+        elif source.startswith('/*', i):
+            j = source.find('*/', i + 2)
+            i = n if j == -1 else j + 2
+            if pending_space != '\n':
+                pending_space = ' '
+        elif char in '"\'':
+            j = i + 1
+            while j < n and source[j] != char:
+                j += 2 if source[j] == '\\' else 1
+            emit(source[i:j + 1])
+            i = j + 1
+        elif char == '`':
+            i, chunk, opened = read_template(i + 1)
+            emit('`' + chunk)
+            if opened:
+                template_depths.append(brace_depth)
+        elif char == '/' and (not last_significant or last_significant in _REGEX_PRECEDERS
+                              or _REGEX_KEYWORDS.search(''.join(out[-12:]))):
+            j, in_class = i + 1, False
+            while j < n and (in_class or source[j] != '/'):
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '[':
+                    in_class = True
+                elif source[j] == ']':
+                    in_class = False
+                j += 1
+            j += 1
+            while j < n and (source[j].isalnum()): # Flags
+                j += 1
+            emit(source[i:j])
+            i = j
+        elif char == '}' and template_depths and template_depths[-1] == brace_depth:
+            template_depths.pop()
+            i, chunk, opened = read_template(i + 1)
+            pending_space = ''
+            emit('}' + chunk)
+            if opened:
+                template_depths.append(brace_depth)
+        else:
+            if char == '{':
+                brace_depth += 1
+            elif char == '}':
+                brace_depth -= 1
+            emit(char)
+            i += 1
+    return ''.join(out).strip() + '\n'
+
+
+
+# --- Building ---
+
+def sources_digest(static_folder, bundles=BUNDLES):
+    """Hash of every bundle's source files, stored in the manifest to detect an outdated build."""
+    digest = hashlib.sha1()
+    for name in sorted(bundles):
+        digest.update(name.encode('utf-8'))
+        for source in bundles[name]:
+            digest.update(source.encode('utf-8'))
+            with open(os.path.join(static_folder, source), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def bundle_contents(static_folder, name, sources):
+    ext = os.path.splitext(name)[1]
+    parts = []
+    for source in sources:
+        with open(os.path.join(static_folder, source), encoding='utf-8') as f:
+            parts.append(f.read())
+    if ext == '.css':
+        return dedupe_css_rules(minify_css('\n'.join(parts)))
+    # ';' keeps one file's last statement from running into the next file's first
+    return ';\n'.join(minify_js(part) for part in parts)
+
+
+def hashed_name(name, data):
+    stem, ext = os.path.splitext(name)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def compress(data, encoding):
+    if encoding == 'gzip':
+        return gzip.compress(data, compresslevel=9, mtime=0) # mtime=0: same input, same bytes
+    if encoding == 'br':
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unknown encoding {encoding!r}")
+
+
+def build_assets(static_folder, bundles=BUNDLES, out_dir=None):
+    """
+    Writes every bundle (minified, hashed, with compressed variants) and the manifest.
+    Files in out_dir that aren't part of this build are removed. Returns the manifest dict.
+    """
+    out_dir = out_dir or os.path.join(static_folder, DIST_DIRNAME)
+    os.makedirs(out_dir, exist_ok=True)
+    encodings = [(encoding, suffix) for encoding, suffix in ENCODINGS if encoding != 'br' or brotli is not None]
+
+    files, sizes, written = {}, {}, {MANIFEST_NAME}
+    for name, sources in bundles.items():
+        data = bundle_contents(static_folder, name, sources).encode('utf-8')
+        filename = hashed_name(name, data)
+        variants = {'': data}
+        for encoding, suffix in encodings:
+            variants[suffix] = compress(data, encoding)
+        for suffix, payload in variants.items():
+            with open(os.path.join(out_dir, filename + suffix), 'wb') as f:
+                f.write(payload)
+            written.add(filename + suffix)
+        files[name] = filename
+        sizes[name] = {'source': sum(os.path.getsize(os.path.join(static_folder, s)) for s in sources),
+                       **{suffix or 'minified': len(payload) for suffix, payload in variants.items()}}
+
+    manifest = {'sources': sources_digest(static_folder, bundles), 'files': files, 'sizes': sizes}
+    with open(os.path.join(out_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    for filename in os.listdir(out_dir):
+        if filename not in written:
+            os.remove(os.path.join(out_dir, filename)) # From an older build
+    return manifest
+
+
+# --- Serving ---
+
+class AssetManifest:
+    """Maps bundle names to their built files; registered as the asset_urls() template global."""
+
+    def __init__(self, bundles=BUNDLES):
+        self.bundles = bundles
+        self.dist_folder = None
+        self.static_folder = None
+        self._files = {}     # bundle name -> hashed filename
+        self._served = set() # hashed filenames the /assets/ route may send
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.static_folder = app.static_folder
+        self.dist_folder = os.path.join(app.static_folder, DIST_DIRNAME)
+        app.add_template_global(self.urls, 'asset_urls')
+        if app.config.get('ASSETS_USE_BUILD', True):
+            self.load()
+        else:
+            self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._files = {}
+            self._served = set()
+
+    def load(self):
+        """Reads dist/manifest.json; an outdated or missing build means the source files are linked."""
+        self.reset()
+        path = os.path.join(self.dist_folder, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return False
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        try:
+            current = sources_digest(self.static_folder, self.bundles)
+        except FileNotFoundError:
+            current = None
+        if manifest.get('sources') != current:
+            logger.warning("assets: static/dist is older than the CSS/JS sources, serving the sources. Run 'flask main build-assets'.")
+            return False
+        with self._lock:
+            self._files = dict(manifest.get('files', {}))
+            self._served = set(self._files.values())
+        return True
+
+    @property
+    def built(self):
+        return bool(self._files)
+
+    def urls(self, bundle):
+        """URLs to link for the bundle: its hashed file, or its source files when not built."""
+        filename = self._files.get(bundle)
+        if filename:
+            return [url_for('main.asset', filename=filename)]
+        return [url_for('static', filename=source) for source in self.bundles[bundle]]
+
+    def path_for(self, filename):
+        """Path of a built file, or None if it isn't one (nothing else is served from /assets/)."""
+        if filename not in self._served:
+            return None
+        return os.path.join(self.dist_folder, filename)
+
+
+assets = AssetManifest()
@@ -0,0 +1,163 @@
+"""
+The emoji catalog (the pool riddles are drawn from).
+
+It lives in app/data/emojis.jsonl, one {"emoji", "name", "category"} object per line, and
+is only loaded the first time something asks for it (init-db / extend-schedule, or
+RIDDLE_SOURCE = 'schedule'), so web workers serving riddles from the table never pay
+for it. The file is read through mmap and kept column-oriented: one tuple of emojis,
+one of names and a byte per entry for the category, instead of a dict per emoji.
+
+The catalog behaves like a read-only list of {"emoji", "name", "category"} dicts (the
+dicts are built on access), which is what the code used to get from
+models.initial_emojis. The order of the file is the order the scheduler uses, so only
+ever append to it.
+
+Lookups are indexed when the catalog is built: by emoji (ignoring the U+FE0F emoji
+presentation selector, so "❤" finds "❤️"), by codepoint sequence, by normalized name
+and by category. An entry whose emoji or normalized name is already in the catalog is
+left out and recorded in `duplicates` (see `flask main check-catalog`).
+"""
+import json
+import mmap
+import os
+import re
+import threading
+from array import array
+from collections import namedtuple
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), 'data', 'emojis.jsonl')
+
+EMOJI_PRESENTATION_SELECTOR = '\ufe0f'
+
+# An entry left out of the catalog: its position in the source, the entry itself, the
+# index of the entry it clashes with and why ('emoji' or 'name')
+Duplicate = namedtuple('Duplicate', ['source_index', 'entry', 'kept_index', 'reason'])
+
+
+def emoji_key(emoji):
+    """The emoji without presentation selectors, '❤️' and '❤' are the same emoji."""
+    return emoji.replace(EMOJI_PRESENTATION_SELECTOR, '')
+
+
+def codepoints_key(codepoints):
+    """emoji_key for a codepoint sequence: ints, or hex strings like '1F469 200D 1F52C' / 'U+2764'."""
+    if isinstance(codepoints, str):
+        codepoints = codepoints.replace('U+', ' ').replace('u+', ' ').split()
+    return emoji_key(''.join(chr(int(code, 16) if isinstance(code, str) else code) for code in codepoints))
+
+
+def normalize_name(name):
+    """'Fleur-de-lis', 'fleur de  lis' and 'FLEUR DE LIS' all become 'fleur de lis'."""
+    return ' '.join(re.sub(r'[^0-9a-z]+', ' ', name.casefold()).split())
+
+
+class EmojiCatalog:
+    __slots__ = ('emojis', 'names', 'categories', 'category_indexes', 'duplicates',
+                 '_by_emoji', '_by_name', '_by_category')
+
+    def __init__(self, emojis, names, categories, category_indexes, duplicates=()):
+        self.emojis = emojis # tuple of str
+        self.names = names # tuple of str
+        self.categories = categories # tuple of the distinct category names
+        self.category_indexes = category_indexes # array('B'), index into categories per entry
+        self.duplicates = tuple(duplicates) # Entries left out, see Duplicate
+        self._by_emoji = {emoji_key(emoji): index for index, emoji in enumerate(emojis)}
+        self._by_name = {normalize_name(name): index for index, name in enumerate(names)}
+        by_category = [[] for _ in categories]
+        for index, category_index in enumerate(category_indexes):
+            by_category[category_index].append(index)
+        self._by_category = {category: tuple(indexes) for category, indexes in zip(categories, by_category)}
+
+    @classmethod
+    def from_entries(cls, entries):
+        emojis, names, category_indexes = [], [], array('B')
+        categories = {}
+        seen_emojis, seen_names = {}, {}
+        duplicates = []
+        for source_index, entry in enumerate(entries):
+            key, name_key = emoji_key(entry['emoji']), normalize_name(entry['name'])
+            if key in seen_emojis:
+                duplicates.append(Duplicate(source_index, entry, seen_emojis[key], 'emoji'))
+                continue
+            if name_key in seen_names:
+                duplicates.append(Duplicate(source_index, entry, seen_names[name_key], 'name'))
+                continue
+            seen_emojis[key] = seen_names[name_key] = len(emojis)
+            emojis.append(entry['emoji'])
+            names.append(entry['name'])
+            category_indexes.append(categories.setdefault(entry['category'], len(categories)))
+        return cls(tuple(emojis), tuple(names), tuple(categories), category_indexes, duplicates)
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOG_PATH):
+        return cls.from_entries(iter_catalog_file(path))
+
+    def __len__(self):
+        return len(self.emojis)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            'emoji': self.emojis[index],
+            'name': self.names[index],
+            'category': self.categories[self.category_indexes[index]],
+        }
+
+    def __iter__(self):
+        categories = self.categories
+        for emoji, name, category_index in zip(self.emojis, self.names, self.category_indexes):
+            yield {'emoji': emoji, 'name': name, 'category': categories[category_index]}
+
+    def category_of(self, index):
+        return self.categories[self.category_indexes[index]]
+
+    # --- Lookups (index into the catalog, None when it isn't there) ---
+
+    def index_of_emoji(self, emoji):
+        return self._by_emoji.get(emoji_key(emoji))
+
+    def index_of_codepoints(self, codepoints):
+        return self._by_emoji.get(codepoints_key(codepoints))
+
+    def index_of_name(self, name):
+        return self._by_name.get(normalize_name(name))
+
+    def indexes_in_category(self, category):
+        return self._by_category.get(category, ())
+
+    def __contains__(self, emoji):
+        return emoji_key(emoji) in self._by_emoji
+
+
+def iter_catalog_file(path=DEFAULT_CATALOG_PATH):
+    """Entries of a catalog file, in order (blank lines are skipped)."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b''):
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog():
+    """The catalog from DEFAULT_CATALOG_PATH, loaded on first use."""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = EmojiCatalog.load()
+    return _catalog
+
+
+def reset_catalog():
+    """Forget the loaded catalog, the next get_catalog() reads the file again."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
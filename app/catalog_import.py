@@ -0,0 +1,114 @@
+"""
+Importing emojis into the catalog from Unicode's emoji-test.txt.
+
+The file (https://unicode.org/Public/emoji/latest/emoji-test.txt) is read line by line:
+
+    # group: Smileys & Emotion
+    1F600 ; fully-qualified # 😀 E1.0 grinning face
+
+Only fully-qualified emojis are taken. Unicode groups are mapped onto the categories the
+catalog already uses, the names are turned into something a player can guess (ASCII
+letters, title case) and entries that don't fit the Riddle columns or are already in
+the catalog are skipped. New entries are appended to the catalog file in batches, so
+memory stays bounded by the batch size plus the keys needed to spot duplicates.
+"""
+import json
+import re
+import unicodedata
+
+from .catalog import emoji_key, normalize_name
+
+# Unicode emoji group -> catalog category (None: skip the group)
+GROUP_CATEGORIES = {
+    'Smileys & Emotion': 'Smileys & People',
+    'People & Body': 'People & Body',
+    'Component': None, # Bare skin tones / hair styles
+    'Animals & Nature': 'Animals & Nature',
+    'Food & Drink': 'Food & Drink',
+    'Travel & Places': 'Travel & Places',
+    'Activities': 'Activities',
+    'Objects': 'Objects',
+    'Symbols': 'Symbols',
+    'Flags': 'Symbols',
+}
+
+SKIN_TONE_MODIFIERS = frozenset(range(0x1F3FB, 0x1F400))
+
+_VERSION = re.compile(r'E\d+\.\d+$')
+_NOT_ALLOWED_IN_NAME = re.compile(r"[^A-Za-z0-9 '!&-]+")
+
+
+def clean_name(name):
+    """
+    The Unicode name as a riddle answer: accents stripped, punctuation the game can't
+    show dropped, title case. 'flag: Côte d’Ivoire' -> "Flag Cote D'Ivoire".
+    None if nothing guessable is left.
+    """
+    name = name.replace('’', "'").replace('“', '').replace('”', '')
+    name = unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+    name = ' '.join(_NOT_ALLOWED_IN_NAME.sub(' ', name).split())
+    if not any(char.isalpha() for char in name):
+        return None
+    return ' '.join(word[:1].upper() + word[1:] for word in name.split(' '))
+
+
+def iter_emoji_test(lines, include_skin_tones=False):
+    """
+    (emoji, unicode_name, category) for every usable fully-qualified line of emoji-test.txt.
+    """
+    category = None
+    for line in lines:
+        if line.startswith('#'):
+            if line.startswith('# group:'):
+                group = line[len('# group:'):].strip()
+                category = GROUP_CATEGORIES.get(group, 'Symbols')
+            continue
+        if category is None:
+            continue
+        data, _, comment = line.partition('#')
+        codepoints, _, status = data.partition(';')
+        if status.strip() != 'fully-qualified':
+            continue
+        codes = [int(code, 16) for code in codepoints.split()]
+        if not include_skin_tones and SKIN_TONE_MODIFIERS.intersection(codes):
+            continue
+        # Comment: "<emoji> E<version> <name>"
+        parts = comment.strip().split(' ', 2)
+        if len(parts) < 3 or not _VERSION.match(parts[1]):
+            continue
+        yield ''.join(map(chr, codes)), parts[2], category
+
+
+def import_emoji_test(lines, catalog, output, max_emoji_length, max_name_length,
+                      include_skin_tones=False, batch_size=500):
+    """
+    Append the new entries of an emoji-test.txt to `output` (a text file opened for
+    appending), `batch_size` lines per write. Returns a dict of counters.
+    """
+    seen_emojis = {emoji_key(emoji) for emoji in catalog.emojis}
+    seen_names = {normalize_name(name) for name in catalog.names}
+    counts = {'added': 0, 'existing': 0, 'too_long': 0, 'unusable_name': 0}
+    batch = []
+    for emoji, unicode_name, category in iter_emoji_test(lines, include_skin_tones):
+        name = clean_name(unicode_name)
+        if name is None:
+            counts['unusable_name'] += 1
+            continue
+        if len(emoji) > max_emoji_length or len(name) > max_name_length:
+            counts['too_long'] += 1
+            continue
+        key, name_key = emoji_key(emoji), normalize_name(name)
+        if key in seen_emojis or name_key in seen_names:
+            counts['existing'] += 1
+            continue
+        seen_emojis.add(key)
+        seen_names.add(name_key)
+        batch.append(json.dumps({'emoji': emoji, 'name': name, 'category': category}, ensure_ascii=False) + '\n')
+        if len(batch) >= batch_size:
+            output.write(''.join(batch))
+            counts['added'] += len(batch)
+            batch = []
+    if batch:
+        output.write(''.join(batch))
+        counts['added'] += len(batch)
+    return counts
@@ -0,0 +1,26 @@
+from datetime import date, datetime, timedelta, timezone
+
+# Define the epoch date (adjust if needed, e.g., your launch date)
+# EPOCH_DATE = date(2024, 1, 1) # Example: January 1st, 2024
+EPOCH_DATE = date(2025, 5, 5) # Set to today as per your last change
+
+
+def utc_today():
+    """The calendar day the game is currently on. Days roll over at UTC midnight."""
+    return datetime.now(timezone.utc).date()
+
+
+def day_number_for(game_date):
+    """Number of days between EPOCH_DATE and game_date (day 0 is the epoch)."""
+    return (game_date - EPOCH_DATE).days
+
+
+def current_day_number():
+    return day_number_for(utc_today())
+
+
+def next_utc_midnight(now_utc=None):
+    """The moment today's puzzle expires (start of the next UTC day)."""
+    now_utc = now_utc or datetime.now(timezone.utc)
+    midnight_today_utc = datetime(now_utc.year, now_utc.month, now_utc.day, tzinfo=timezone.utc)
+    return midnight_today_utc + timedelta(days=1)
@@ -0,0 +1,34 @@
+"""
+A short version string for the running deploy.
+
+Cached pages and their ETags include it, so a browser or proxy copy of a game page is
+never reused after the templates or static files change. Set DEPLOY_VERSION (e.g. to
+the git commit) to skip hashing the files at startup.
+"""
+import hashlib
+import os
+
+
+def hash_directories(*directories):
+    """sha1 over the relative paths and contents of every file below the directories."""
+    digest = hashlib.sha1()
+    for directory in directories:
+        if not directory or not os.path.isdir(directory):
+            continue
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                digest.update(os.path.relpath(path, directory).encode('utf-8'))
+                with open(path, 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()
+
+
+def init_app(app):
+    version = app.config.get('DEPLOY_VERSION')
+    if not version:
+        template_folder = os.path.join(app.root_path, app.template_folder) if app.template_folder else None
+        version = hash_directories(template_folder, app.static_folder)[:12]
+    app.config['DEPLOY_VERSION'] = version
+    return version
@@ -0,0 +1,147 @@
+"""
+Pluggable storage for per-player game state.
+
+A game state is the small dict the routes work with:
+    {'riddle_id': 12, 'guesses': ['e', 'x'], 'game_over': False, 'is_win': False}
+and is stored per (player_uuid, date_iso, game_mode). Pick the backend with
+GAME_STATE_BACKEND:
+
+- 'cookie': the legacy nested session['game_states_by_day_mode'] dict. Days older than
+  GAME_STATE_TTL_DAYS are pruned from it on every save.
+- 'memory': a dict in this process. Fine for development / a single worker only.
+- 'sql': the game_state table. The cookie only carries the player_uuid.
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from flask import current_app, session
+
+from .days import utc_today
+
+
+class GameStateStore:
+    def __init__(self, ttl_days=2):
+        self.ttl_days = ttl_days
+
+    def load(self, player_uuid, date_iso, game_mode):
+        """Return a copy of the stored state (safe to mutate) or None."""
+        raise NotImplementedError
+
+    def save(self, player_uuid, date_iso, game_mode, state):
+        raise NotImplementedError
+
+    def prune(self):
+        """Drop states for days that are too old to still be played."""
+
+    def cutoff_iso(self):
+        """States for dates before this one are expired."""
+        return (utc_today() - timedelta(days=self.ttl_days)).isoformat()
+
+
+def _copy_state(state):
+    copied = dict(state)
+    copied['guesses'] = list(state.get('guesses', []))
+    return copied
+
+
+class CookieGameStateStore(GameStateStore):
+    def load(self, player_uuid, date_iso, game_mode):
+        state = session.get('game_states_by_day_mode', {}).get(date_iso, {}).get(game_mode)
+        return _copy_state(state) if state else None
+
+    def save(self, player_uuid, date_iso, game_mode, state):
+        states_by_day = session.setdefault('game_states_by_day_mode', {})
+        states_by_day.setdefault(date_iso, {})[game_mode] = _copy_state(state)
+        cutoff = self.cutoff_iso()
+        for old_date_iso in [d for d in states_by_day if d < cutoff]:
+            del states_by_day[old_date_iso]
+        session.modified = True
+
+
+class MemoryGameStateStore(GameStateStore):
+    def __init__(self, ttl_days=2):
+        super().__init__(ttl_days)
+        self._lock = threading.Lock()
+        self._states_by_day = {}  # date_iso -> {(player_uuid, game_mode): state}
+
+    def load(self, player_uuid, date_iso, game_mode):
+        state = self._states_by_day.get(date_iso, {}).get((player_uuid, game_mode))
+        return _copy_state(state) if state else None
+
+    def save(self, player_uuid, date_iso, game_mode, state):
+        with self._lock:
+            if date_iso not in self._states_by_day:
+                self._prune_locked() # A new day started, a good moment to forget old ones
+                self._states_by_day[date_iso] = {}
+            self._states_by_day[date_iso][(player_uuid, game_mode)] = _copy_state(state)
+
+    def prune(self):
+        with self._lock:
+            self._prune_locked()
+
+    def _prune_locked(self):
+        cutoff = self.cutoff_iso()
+        for old_date_iso in [d for d in self._states_by_day if d < cutoff]:
+            del self._states_by_day[old_date_iso]
+
+
+class SQLGameStateStore(GameStateStore):
+    def __init__(self, ttl_days=2, prune_interval_seconds=3600):
+        super().__init__(ttl_days)
+        self.prune_interval_seconds = prune_interval_seconds
+        self._last_prune = time.monotonic() # monotonic() counts from boot: 0.0 would prune on the first save
+
+    def load(self, player_uuid, date_iso, game_mode):
+        from .models import db, GameState
+        row = db.session.get(GameState, (player_uuid, date_iso, game_mode))
+        if row is None:
+            return None
+        return {
+            'riddle_id': row.riddle_id,
+            'guesses': list(row.guesses),
+            'game_over': row.game_over,
+            'is_win': row.is_win,
+        }
+
+    def save(self, player_uuid, date_iso, game_mode, state):
+        from .models import db, GameState
+        db.session.merge(GameState(
+            player_uuid=player_uuid,
+            date_iso=date_iso,
+            game_mode=game_mode,
+            riddle_id=state['riddle_id'],
+            guesses=''.join(state.get('guesses', [])),
+            game_over=state.get('game_over', False),
+            is_win=state.get('is_win', False),
+            updated_at=datetime.now(timezone.utc),
+        ))
+        db.session.commit()
+        if time.monotonic() - self._last_prune >= self.prune_interval_seconds:
+            self.prune()
+
+    def prune(self):
+        from .models import db, GameState
+        self._last_prune = time.monotonic()
+        GameState.query.filter(GameState.date_iso < self.cutoff_iso()).delete(synchronize_session=False)
+        db.session.commit()
+
+
+GAME_STATE_BACKENDS = {
+    'cookie': CookieGameStateStore,
+    'memory': MemoryGameStateStore,
+    'sql': SQLGameStateStore,
+}
+
+
+def init_app(app):
+    backend = app.config.get('GAME_STATE_BACKEND', 'cookie')
+    if backend not in GAME_STATE_BACKENDS:
+        raise ValueError(f"Unknown GAME_STATE_BACKEND '{backend}', expected one of {', '.join(GAME_STATE_BACKENDS)}")
+    store = GAME_STATE_BACKENDS[backend](ttl_days=app.config.get('GAME_STATE_TTL_DAYS', 2))
+    app.extensions['game_state_store'] = store
+    return store
+
+
+def get_game_state_store():
+    return current_app.extensions['game_state_store']
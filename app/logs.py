@@ -0,0 +1,174 @@
+"""
+Logging for the app: structured (JSON) records, written off the request thread.
+
+Modules log through `logging.getLogger(__name__)` (the 'app' logger tree). setup_logging,
+called first thing in create_app, gives the 'app' logger a QueueHandler: a request only
+formats its message and puts the record on a queue, and a QueueListener thread encodes
+it as one JSON object per line and writes it to stdout. Records are level-gated before
+any of that (LOG_LEVEL for the tree, LOG_LEVELS per logger, e.g. "app.routes=DEBUG"),
+and DEBUG records can be sampled with LOG_DEBUG_SAMPLE_RATE (0.01 keeps 1 in 100 of each
+message) so debug logging can stay on under load.
+
+Keyword fields go in `extra`, and come out as keys of the JSON object:
+
+    logger.debug("index: rendering", extra={'mode': selected_mode, 'day_number': day_number})
+
+The flask CLI commands print their output through the 'app.cli' logger, which echoes plain
+messages with click directly (there's no request to keep fast).
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+
+import click
+
+APP_LOGGER = 'app'
+CLI_LOGGER = 'app.cli'
+
+# LogRecord attributes that aren't 'extra' fields
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord('', 0, '', 0, '', None, None))) | {'message', 'asctime', 'sampled'}
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith('_'):
+                entry[key] = value
+        if getattr(record, 'sampled', 1) != 1:
+            entry['sampled'] = record.sampled # One of every `sampled` such records was logged
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        elif record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DebugSampler(logging.Filter):
+    """Lets through one in every `every` DEBUG records per (logger, message template); other levels always pass."""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.every == 1:
+            return True
+        if self.every == 0:
+            return False
+        key = (record.name, record.msg)
+        with self._lock:
+            count = self._counts.get(key, 0)
+            self._counts[key] = count + 1
+        if count % self.every:
+            return False
+        record.sampled = self.every
+        return True
+
+
+class _ClickHandler(logging.Handler):
+    """Plain messages for the CLI commands, on whatever click's stdout is at the time."""
+
+    def emit(self, record):
+        try:
+            click.echo(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        """
+        Merges the args and formats the traceback here (they may not outlive the request), leaving
+        the JSON to the listener. The record isn't copied: no other handler sees it (propagate=False).
+        """
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener = None
+
+
+def setup_logging(app):
+    """(Re)configures the 'app' loggers from the app config. Safe to call for every create_app."""
+    global _listener
+    stop_logging()
+
+    app_logger = logging.getLogger(APP_LOGGER)
+    for handler in list(app_logger.handlers):
+        app_logger.removeHandler(handler)
+    app_logger.setLevel(app.config.get('LOG_LEVEL', 'INFO'))
+    app_logger.propagate = False
+
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith(APP_LOGGER + '.') and name != CLI_LOGGER:
+            logging.getLogger(name).setLevel(logging.NOTSET) # Levels from a previous setup
+    for name, level in parse_levels(app.config.get('LOG_LEVELS')).items():
+        logging.getLogger(name).setLevel(level)
+
+    output = logging.StreamHandler(app.config.get('LOG_STREAM') or sys.stdout) # LOG_STREAM: for the tests
+    output.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    handler = _QueueHandler(log_queue)
+    handler.addFilter(DebugSampler(app.config.get('LOG_DEBUG_SAMPLE_RATE', 1.0)))
+    app_logger.addHandler(handler)
+    _listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+
+    cli_logger = logging.getLogger(CLI_LOGGER)
+    for old in list(cli_logger.handlers):
+        cli_logger.removeHandler(old)
+    cli_logger.addHandler(_ClickHandler())
+    cli_logger.setLevel(logging.INFO)
+    cli_logger.propagate = False
+
+
+def stop_logging():
+    """Writes out everything still queued and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _restart_after_fork():
+    """A forked worker (gunicorn --preload) doesn't inherit the listener thread, so it starts its own."""
+    if _listener is not None:
+        _listener._thread = None
+        _listener.start()
+
+
+atexit.register(stop_logging)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_restart_after_fork)
+
+
+def parse_levels(levels):
+    """{'app.routes': 'DEBUG'} from a dict, or from a "app.routes=DEBUG,app.stats=WARNING" string."""
+    if not levels:
+        return {}
+    if isinstance(levels, dict):
+        return {name: str(level).upper() for name, level in levels.items()}
+    parsed = {}
+    for item in levels.split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            parsed[name.strip()] = level.strip().upper()
+    return parsed
@@ -0,0 +1,229 @@
+"""
+Per-request metrics, served at /metrics in the Prometheus text format.
+
+For every request: the latency per endpoint (main.index, main.make_guess, ...), the
+number of SQL statements and the time spent in them (SQLAlchemy engine events), the
+size of the session cookie the browser sent, and per template the render time (only
+cache misses render, see page_cache.py). Each is a fixed-bucket histogram, so recording
+a request is a few dict updates under one lock; it is meant to stay on in production.
+The page cache hit/miss counters are reported as well.
+
+The numbers are per process: with several gunicorn workers each one keeps its own, and
+a scrape sees whichever worker answers. METRICS_ENABLED = False turns it all off.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from flask import current_app, request, Response
+from flask.signals import before_render_template, template_rendered
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+COOKIE_SIZE_BUCKETS = (0, 64, 128, 256, 512, 1024, 2048, 4096)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# The RequestMetrics of the request being handled (a ContextVar rather than flask.g: the SQL
+# events fire on every statement, and this skips the context-local proxy lookups)
+_current_request = ContextVar('emojile_request_metrics', default=None)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(label_names, label_values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_number(value):
+    if isinstance(value, float):
+        return repr(value) if value != int(value) else str(int(value))
+    return str(value)
+
+
+class Histogram:
+    def __init__(self, name, help, buckets, label_names=()):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.label_names = tuple(label_names)
+        self.series = {} # Label values -> [per-bucket counts (last one is +Inf), sum]
+
+    def observe(self, value, *label_values):
+        """Not locked: Metrics calls it with its lock held."""
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = [[0] * (len(self.buckets) + 1), 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def render(self, lines):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} histogram')
+        for label_values, (counts, total) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += count
+                le = f'le="{_format_number(float(bound)) if bound != "+Inf" else bound}"'
+                lines.append(f'{self.name}_bucket{_labels(self.label_names, label_values, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.label_names, label_values)} {_format_number(total)}')
+            lines.append(f'{self.name}_count{_labels(self.label_names, label_values)} {cumulative}')
+
+
+class Counter:
+    def __init__(self, name, help, label_names=()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(label_names)
+        self.series = {}
+
+    def inc(self, *label_values, amount=1):
+        self.series[label_values] = self.series.get(label_values, 0) + amount
+
+    def render(self, lines):
+        lines.append(f'# HELP {self.name} {self.help}')
+        lines.append(f'# TYPE {self.name} counter')
+        for label_values, value in sorted(self.series.items()):
+            lines.append(f'{self.name}{_labels(self.label_names, label_values)} {_format_number(value)}')
+
+
+class RequestMetrics:
+    """What one request has used so far, kept in _current_request while it runs."""
+    __slots__ = ('started', 'queries', 'query_seconds', 'template_started')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.query_seconds = 0.0
+        self.template_started = None
+
+
+class Metrics:
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.request_seconds = Histogram('emojile_request_duration_seconds', 'Time to handle a request, by endpoint.',
+                                         LATENCY_BUCKETS, ('endpoint',))
+        self.requests = Counter('emojile_requests_total', 'Requests handled, by endpoint and status code.', ('endpoint', 'status'))
+        self.request_queries = Histogram('emojile_request_sql_queries', 'SQL statements executed per request, by endpoint.',
+                                         QUERY_COUNT_BUCKETS, ('endpoint',))
+        self.request_query_seconds = Histogram('emojile_request_sql_duration_seconds', 'Time spent in SQL per request, by endpoint.',
+                                               LATENCY_BUCKETS, ('endpoint',))
+        self.template_seconds = Histogram('emojile_template_render_seconds', 'Time to render a template.',
+                                          LATENCY_BUCKETS, ('template',))
+        self.session_cookie_bytes = Histogram('emojile_session_cookie_bytes', 'Size of the session cookie sent with a request.',
+                                              COOKIE_SIZE_BUCKETS)
+        self._collectors = [self.request_seconds, self.requests, self.request_queries, self.request_query_seconds,
+                            self.template_seconds, self.session_cookie_bytes]
+
+    def init_app(self, app):
+        self.enabled = app.config.get('METRICS_ENABLED', True)
+        self.reset()
+        if not self.enabled:
+            return
+        app.before_request(self._start_request)
+        app.after_request(self._finish_request)
+        app.teardown_request(self._clear_request) # Also after an unhandled exception
+        before_render_template.connect(self._template_started, app)
+        template_rendered.connect(self._template_rendered, app)
+        _listen_to_sql()
+        app.add_url_rule('/metrics', 'metrics', self.view)
+
+    def reset(self):
+        with self._lock:
+            for collector in self._collectors:
+                collector.series.clear()
+
+    # --- Recording ---
+    def _start_request(self):
+        _current_request.set(RequestMetrics())
+
+    def _clear_request(self, exception=None):
+        _current_request.set(None)
+
+    def _finish_request(self, response):
+        current = _current_request.get()
+        _current_request.set(None)
+        req = request._get_current_object()
+        if current is None or req.endpoint == 'metrics':
+            return response
+        elapsed = time.perf_counter() - current.started
+        endpoint = req.endpoint or 'none' # 'none': no route matched (404s)
+        cookie = req.cookies.get(current_app.config['SESSION_COOKIE_NAME'])
+        with self._lock:
+            self.request_seconds.observe(elapsed, endpoint)
+            self.requests.inc(endpoint, str(response.status_code))
+            self.request_queries.observe(current.queries, endpoint)
+            self.request_query_seconds.observe(current.query_seconds, endpoint)
+            self.session_cookie_bytes.observe(len(cookie) if cookie else 0)
+        return response
+
+    def _template_started(self, sender, template, context, **extra):
+        current = _current_request.get()
+        if current is not None:
+            current.template_started = time.perf_counter()
+
+    def _template_rendered(self, sender, template, context, **extra):
+        current = _current_request.get()
+        if current is None or current.template_started is None:
+            return
+        elapsed = time.perf_counter() - current.template_started
+        current.template_started = None
+        with self._lock:
+            self.template_seconds.observe(elapsed, template.name or 'string')
+
+    def record_query(self, seconds):
+        """Called from the engine events; statements outside a request (CLI, background flushes) aren't counted."""
+        current = _current_request.get()
+        if current is not None:
+            current.queries += 1
+            current.query_seconds += seconds
+
+    # --- Exposition ---
+    def render(self):
+        lines = []
+        with self._lock:
+            for collector in self._collectors:
+                collector.render(lines)
+        from .page_cache import page_cache
+        lines.append('# HELP emojile_page_cache_requests_total Game / more_games page cache lookups.')
+        lines.append('# TYPE emojile_page_cache_requests_total counter')
+        lines.append(f'emojile_page_cache_requests_total{{result="hit"}} {page_cache.hits}')
+        lines.append(f'emojile_page_cache_requests_total{{result="miss"}} {page_cache.misses}')
+        return '\n'.join(lines) + '\n'
+
+    def view(self):
+        response = Response(self.render(), content_type=CONTENT_TYPE)
+        response.cache_control.no_store = True
+        return response
+
+
+metrics = Metrics()
+
+
+_sql_listening = False
+
+def _listen_to_sql():
+    """Engine events for every engine (each app creates its own), registered once per process."""
+    global _sql_listening
+    if _sql_listening:
+        return
+    _sql_listening = True
+
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('_metrics_query_started', []).append(time.perf_counter())
+
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info.get('_metrics_query_started')
+        if started:
+            metrics.record_query(time.perf_counter() - started.pop())
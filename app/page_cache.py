@@ -0,0 +1,68 @@
+"""
+In-memory cache of rendered pages.
+
+The game pages are the same for every player (the player's state comes from
+/api/state), so each (mode, day_number, riddle, deploy) page is rendered once per worker
+and served from memory afterwards; the same goes for the no-riddle page and
+more_games.html. Keys contain the day number and everything cached belongs to the
+current UTC day: the first request after midnight drops the whole cache.
+
+Entries are kept in LRU order, at most PAGE_CACHE_MAX_ENTRIES of them. Set
+PAGE_CACHE_ENABLED = False to render on every request (e.g. while editing templates).
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+from .days import current_day_number
+
+CachedPage = namedtuple('CachedPage', ['body', 'etag'])
+
+
+class PageCache:
+    def __init__(self, max_entries=64, enabled=True):
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._pages = OrderedDict()
+        self._day_number = None
+        self.hits = 0
+        self.misses = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get('PAGE_CACHE_ENABLED', True)
+        self.max_entries = app.config.get('PAGE_CACHE_MAX_ENTRIES', self.max_entries)
+        self.clear()
+        self.hits = self.misses = 0
+
+    def clear(self):
+        with self._lock:
+            self._pages.clear()
+            self._day_number = None
+
+    def get_or_render(self, key, etag, render):
+        """The cached page for key, or render() (a str) cached under key with the given etag."""
+        if not self.enabled:
+            return CachedPage(render(), etag)
+        day_number = current_day_number()
+        with self._lock:
+            if day_number != self._day_number:
+                self._pages.clear() # A new day, nothing cached is current any more
+                self._day_number = day_number
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                self.hits += 1
+                return page
+            self.misses += 1
+
+        # Rendered outside the lock; two requests racing for the same page both render it once
+        page = CachedPage(render(), etag)
+        with self._lock:
+            if self._day_number == day_number:
+                self._pages[key] = page
+                while len(self._pages) > self.max_entries:
+                    self._pages.popitem(last=False)
+        return page
+
+
+page_cache = PageCache()
@@ -0,0 +1,191 @@
+"""
+Server-rendered pixelation levels for Pixelated mode.
+
+Each Pixelated riddle is shown at four levels: 8x8, 16x16 and 32x32 blocks while the
+player still has guesses left (one level per incorrect guess), then the full 128px
+emoji. Instead of every browser drawing the emoji with its own font and pixelating it
+on a canvas, the server renders the emoji once with a color emoji font and block
+averages it down to each level, giving tiny PNGs (the browser scales them up without
+smoothing). The page then never needs the emoji character itself.
+
+The PNGs are kept in a content-addressed disk cache: the file name is a hash of the
+emoji, the level, the font and RENDERER_VERSION, so a riddle id always maps to the same
+file and a changed font or renderer never serves stale images.
+
+Pillow and a color emoji font (PIXELATED_EMOJI_FONT, or one of EMOJI_FONT_CANDIDATES)
+are needed; NumPy makes the block averaging faster. Both are in requirements.txt, but
+an install without them still works: `available` is False (no Pillow or no font) and
+the page falls back to drawing on the canvas.
+"""
+import hashlib
+import io
+import logging
+import os
+import tempfile
+import threading
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError: # Optional
+    Image = ImageDraw = ImageFont = None
+
+try:
+    import numpy
+except ImportError: # Optional: Pillow's reduce() does the same averaging, more slowly
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+LEVEL_SIZES = (8, 16, 32, 128) # Blocks per side at 0, 1, 2 incorrect guesses, then the full emoji
+FULL_LEVEL = len(LEVEL_SIZES) - 1
+SOURCE_SIZE = 256 # The emoji is drawn at this size, every level size divides it
+EMOJI_SCALE = 0.82 # Share of the source square the emoji fills (as the canvas version did)
+RENDERER_VERSION = 1 # Bump when the rendering changes, so cached files aren't reused
+
+EMOJI_FONT_CANDIDATES = (
+    '/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf',
+    '/usr/share/fonts/noto/NotoColorEmoji.ttf',
+    '/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf',
+    '/System/Library/Fonts/Apple Color Emoji.ttc',
+    'C:\\Windows\\Fonts\\seguiemj.ttf',
+)
+# Bitmap emoji fonts only load at the sizes they have strikes for (Noto: 109, Apple: 160, 96, ...)
+EMOJI_FONT_SIZES = (109, 160, 96, 64, 137, 128)
+
+
+def level_for(incorrect_guesses, game_over, max_guesses):
+    """The finest level a player may see: one level per incorrect guess, the full emoji once the game is over."""
+    if game_over or incorrect_guesses >= max_guesses:
+        return FULL_LEVEL
+    return min(max(incorrect_guesses, 0), FULL_LEVEL - 1)
+
+
+def find_emoji_font():
+    for path in EMOJI_FONT_CANDIDATES:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_emoji_font(path):
+    for size in EMOJI_FONT_SIZES:
+        try:
+            return ImageFont.truetype(path, size)
+        except OSError: # Not a size this (bitmap) font has
+            continue
+    raise OSError(f"Could not load {path} at any of the sizes {EMOJI_FONT_SIZES}")
+
+
+def block_average(image, size):
+    """Averages an RGBA image down to size x size (each output pixel is the mean of its block)."""
+    factor = image.width // size
+    if numpy is not None:
+        pixels = numpy.asarray(image, dtype=numpy.float64).reshape(size, factor, size, factor, 4)
+        alpha = pixels[..., 3:4]
+        # Weighted by alpha, so transparent (black) pixels don't darken the edges
+        alpha_sum = alpha.sum(axis=(1, 3))
+        rgb = (pixels[..., :3] * alpha).sum(axis=(1, 3)) / numpy.maximum(alpha_sum, 1e-9)
+        averaged = numpy.floor(numpy.concatenate([rgb, alpha_sum / (factor * factor)], axis=-1) + 0.5).clip(0, 255)
+        averaged[averaged[..., 3] == 0] = 0 # Fully transparent is (0, 0, 0, 0), as with Pillow
+        return Image.fromarray(averaged.astype(numpy.uint8), 'RGBA')
+    return image.convert('RGBa').reduce(factor).convert('RGBA')
+
+
+class EmojiPixelator:
+    def __init__(self, cache_dir=None, font=None, font_id=None):
+        self.cache_dir = cache_dir
+        self.font = font
+        self.font_id = font_id
+        self.enabled = True
+        self._lock = threading.Lock()
+        self.renders = 0
+
+    def init_app(self, app):
+        self.enabled = app.config.get('PIXELATED_SERVER_RENDER', True)
+        self.cache_dir = app.config.get('PIXELATED_CACHE_DIR') or os.path.join(app.instance_path, 'pixelated')
+        self.font = self.font_id = None
+        font_path = app.config.get('PIXELATED_EMOJI_FONT') or find_emoji_font()
+        if not self.enabled or Image is None or not font_path:
+            return
+        try:
+            self.use_font(load_emoji_font(font_path), font_path)
+        except OSError as e:
+            logger.warning("pixelation: %s; Pixelated mode draws the emoji in the browser.", e, extra={'font_path': font_path})
+
+    def use_font(self, font, font_path=None, font_id=None):
+        """Font id: a hash of the font file, so replacing the font changes every cache key."""
+        if font_id is None:
+            digest = hashlib.sha1()
+            with open(font_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+            font_id = digest.hexdigest()[:16]
+        self.font, self.font_id = font, font_id
+
+    @property
+    def available(self):
+        return self.enabled and self.font is not None and Image is not None
+
+    def cache_key(self, emoji, level):
+        return hashlib.sha256(f"{RENDERER_VERSION}:{self.font_id}:{level}:{emoji}".encode('utf-8')).hexdigest()
+
+    def cache_path(self, key):
+        return os.path.join(self.cache_dir, key[:2], key[2:] + '.png')
+
+    def get_png(self, emoji, level):
+        """(png bytes, cache key) of the emoji at a level, rendered on the first request."""
+        key = self.cache_key(emoji, level)
+        path = self.cache_path(key)
+        try:
+            with open(path, 'rb') as f:
+                return f.read(), key
+        except FileNotFoundError:
+            pass
+        png = self.render_levels(emoji)[level]
+        return png, key
+
+    def render_levels(self, emoji):
+        """Renders every level of the emoji (they share the source image) and caches them."""
+        source = self.render_source(emoji)
+        pngs = []
+        for level, size in enumerate(LEVEL_SIZES):
+            png = encode_png(block_average(source, size))
+            self._write(self.cache_path(self.cache_key(emoji, level)), png)
+            pngs.append(png)
+        self.renders += 1
+        return pngs
+
+    def render_source(self, emoji):
+        """The emoji centered on a transparent SOURCE_SIZE square."""
+        with self._lock: # FreeType faces aren't safe to share between threads
+            left, top, right, bottom = self.font.getbbox(emoji)
+            glyph = Image.new('RGBA', (max(right - left, 1), max(bottom - top, 1)), (0, 0, 0, 0))
+            ImageDraw.Draw(glyph).text((-left, -top), emoji, font=self.font, embedded_color=True)
+        box = int(SOURCE_SIZE * EMOJI_SCALE)
+        scale = box / max(glyph.width, glyph.height)
+        glyph = glyph.resize((max(round(glyph.width * scale), 1), max(round(glyph.height * scale), 1)), Image.LANCZOS)
+        source = Image.new('RGBA', (SOURCE_SIZE, SOURCE_SIZE), (0, 0, 0, 0))
+        source.alpha_composite(glyph, ((SOURCE_SIZE - glyph.width) // 2, (SOURCE_SIZE - glyph.height) // 2))
+        return source
+
+    def _write(self, path, data):
+        """Atomic (write + rename), so concurrent workers never read half a file."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+
+def encode_png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, 'PNG', optimize=True)
+    return buffer.getvalue()
+
+
+pixelator = EmojiPixelator()
@@ -0,0 +1,195 @@
+"""
+In-process riddle repository.
+
+The daily riddle only changes once a day, so instead of querying the Riddle table on
+every page view / guess / emoji fetch we keep today's riddles for every mode in memory.
+Today's block is keyed both by game_mode and by id and is dropped at the next UTC
+midnight. Lookups for other days (archive, stale sessions) go through a small LRU.
+
+Entries are plain immutable records, not ORM objects, so they are safe to share between
+requests and threads. Each one carries the riddle's AnswerProfile, computed when it is loaded.
+
+With RIDDLE_SOURCE = 'schedule' riddles are not read from the table at all but computed by
+the deterministic scheduler (scheduler.py) from the emoji catalog, so no query is needed.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from datetime import datetime, timezone
+
+from .answer_profile import answer_profile_for
+from .days import current_day_number, next_utc_midnight
+from .scheduler import emoji_index, scheduled_riddle_id, slot_for_riddle_id
+
+CachedRiddle = namedtuple('CachedRiddle', ['id', 'emoji', 'name', 'category', 'day_number', 'game_mode', 'profile'])
+
+
+def _snapshot(riddle):
+    return CachedRiddle(
+        id=riddle.id,
+        emoji=riddle.emoji,
+        name=riddle.name,
+        category=riddle.category,
+        day_number=riddle.day_number,
+        game_mode=riddle.game_mode,
+        profile=answer_profile_for(riddle.name),
+    )
+
+
+class RiddleRepository:
+    """Holds today's riddles for all modes plus a bounded LRU of other days."""
+
+    def __init__(self, archive_size=512, miss_recheck_seconds=60, source='table', seed=''):
+        self.archive_size = archive_size
+        self.miss_recheck_seconds = miss_recheck_seconds
+        self.source = source
+        self.seed = seed
+        self._lock = threading.Lock()
+        self.clear()
+
+    def init_app(self, app):
+        self.archive_size = app.config.get('RIDDLE_CACHE_ARCHIVE_SIZE', self.archive_size)
+        self.miss_recheck_seconds = app.config.get('RIDDLE_CACHE_MISS_RECHECK_SECONDS', self.miss_recheck_seconds)
+        self.source = app.config.get('RIDDLE_SOURCE', self.source)
+        self.seed = app.config.get('SCHEDULE_SEED', self.seed)
+        self.clear()
+        app.extensions['riddle_repository'] = self
+
+    def clear(self):
+        """Forget everything (call after the Riddle table was rewritten, e.g. by init-db)."""
+        with self._lock:
+            self._today_day = None
+            self._today_by_mode = {}
+            self._today_by_id = {}
+            self._today_loaded_at = 0.0
+            self._expires_at = None
+            self._archive = OrderedDict()  # riddle id -> CachedRiddle, most recently used last
+            self._archive_keys = {}  # (game_mode, day_number) -> riddle id
+
+    # --- Public lookups ---
+
+    def get_for_day(self, game_mode, day_number):
+        """Riddle for (game_mode, day_number) or None if there is no such riddle."""
+        if day_number == self._current_day():
+            today = self._today_by_mode.get(game_mode)
+            if today is None and self._should_recheck_today():
+                self._load_today(day_number)
+                today = self._today_by_mode.get(game_mode)
+            return today
+
+        with self._lock:
+            riddle_id = self._archive_keys.get((game_mode, day_number))
+            if riddle_id is not None:
+                self._archive.move_to_end(riddle_id)
+                return self._archive[riddle_id]
+
+        if self.source == 'schedule':
+            from .models import AVAILABLE_MODES
+            if game_mode not in AVAILABLE_MODES:
+                return None
+            cached = self._scheduled(AVAILABLE_MODES.index(game_mode), day_number)
+        else:
+            from .models import Riddle
+            riddle = Riddle.query.filter_by(day_number=day_number, game_mode=game_mode).first()
+            if riddle is None:
+                return None
+            cached = _snapshot(riddle)
+        self._remember(cached)
+        return cached
+
+    def get_by_id(self, riddle_id):
+        """Riddle with the given primary key or None."""
+        self._current_day()  # Makes sure today's block is loaded / not expired
+        cached = self._today_by_id.get(riddle_id)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            cached = self._archive.get(riddle_id)
+            if cached is not None:
+                self._archive.move_to_end(riddle_id)
+                return cached
+
+        if self.source == 'schedule':
+            from .models import AVAILABLE_MODES
+            mode_index, day_number = slot_for_riddle_id(riddle_id)
+            if riddle_id < 1 or mode_index >= len(AVAILABLE_MODES):
+                return None
+            cached = self._scheduled(mode_index, day_number)
+        else:
+            from .models import db, Riddle
+            riddle = db.session.get(Riddle, riddle_id)
+            if riddle is None:
+                return None
+            cached = _snapshot(riddle)
+        self._remember(cached)
+        return cached
+
+    # --- Internals ---
+
+    def _current_day(self):
+        """Today's day_number, (re)loading today's block if it expired."""
+        day_number = current_day_number()
+        expires_at = self._expires_at
+        if expires_at is None or self._today_day != day_number or datetime.now(timezone.utc) >= expires_at:
+            self._load_today(day_number)
+        return day_number
+
+    def _should_recheck_today(self):
+        return time.monotonic() - self._today_loaded_at >= self.miss_recheck_seconds
+
+    def _scheduled(self, mode_index, day_number):
+        """Riddle the scheduler assigns to this slot, no DB involved."""
+        from .catalog import get_catalog
+        from .models import AVAILABLE_MODES
+        catalog = get_catalog()
+        entry = catalog[emoji_index(mode_index, day_number, self.seed, len(catalog), len(AVAILABLE_MODES))]
+        return CachedRiddle(
+            id=scheduled_riddle_id(mode_index, day_number),
+            emoji=entry['emoji'],
+            name=entry['name'],
+            category=entry['category'],
+            day_number=day_number,
+            game_mode=AVAILABLE_MODES[mode_index],
+            profile=answer_profile_for(entry['name']),
+        )
+
+    def _load_today(self, day_number):
+        from .models import Riddle, AVAILABLE_MODES
+        by_mode = {}
+        if self.source == 'schedule':
+            for mode_index, mode in enumerate(AVAILABLE_MODES):
+                by_mode[mode] = self._scheduled(mode_index, day_number)
+        else:
+            rows = Riddle.query.filter(
+                Riddle.day_number == day_number,
+                Riddle.game_mode.in_(AVAILABLE_MODES),
+            ).all()
+            for row in rows:
+                cached = _snapshot(row)
+                by_mode[cached.game_mode] = cached
+
+        with self._lock:
+            # Yesterday's riddles stay useful for players finishing an old game, keep them in the LRU
+            previous = list(self._today_by_mode.values()) if self._today_day != day_number else []
+            self._today_day = day_number
+            self._today_by_mode = by_mode
+            self._today_by_id = {cached.id: cached for cached in by_mode.values()}
+            self._today_loaded_at = time.monotonic()
+            self._expires_at = next_utc_midnight()
+            for cached in previous:
+                self._remember_locked(cached)
+
+    def _remember(self, cached):
+        with self._lock:
+            self._remember_locked(cached)
+
+    def _remember_locked(self, cached):
+        self._archive[cached.id] = cached
+        self._archive.move_to_end(cached.id)
+        self._archive_keys[(cached.game_mode, cached.day_number)] = cached.id
+        while len(self._archive) > self.archive_size:
+            _, evicted = self._archive.popitem(last=False)
+            key = (evicted.game_mode, evicted.day_number)
+            if self._archive_keys.get(key) == evicted.id:
+                del self._archive_keys[key]
@@ -1,15 +1,30 @@
-from flask import render_template, session, redirect, url_for, flash, request, jsonify, make_response
+from flask import render_template, session, redirect, url_for, flash, request, jsonify, make_response, current_app, send_file, abort
 from . import main 
-from . import db
-from .models import Riddle, PlayerStats, db, initial_emojis, AVAILABLE_MODES # Ensure initial_emojis is imported
+from . import db, riddle_repository
+from .page_cache import page_cache
+from .assets import assets, build_assets, minify_html, ENCODINGS
+from .models import Riddle, PlayerStats, db, AVAILABLE_MODES
+from .catalog import get_catalog, reset_catalog, EmojiCatalog, DEFAULT_CATALOG_PATH
+from .catalog_import import import_emoji_test
+from .days import EPOCH_DATE, utc_today, day_number_for, current_day_number, next_utc_midnight
+from .answer_profile import letter_bit, guesses_to_mask
+from .game_state import get_game_state_store
+from .stats import upsert_player_stats, stats_to_dict, stats_writer
+from .scheduler import schedule_rows
+from .pixelation import pixelator, level_for, LEVEL_SIZES, FULL_LEVEL
 from datetime import datetime, timedelta, date, timezone # Ensure timezone is imported
 import uuid
-from sqlalchemy import func # Import func for max()
-import random
-
-# Define the epoch date (adjust if needed, e.g., your launch date)
-# EPOCH_DATE = date(2024, 1, 1) # Example: January 1st, 2024
-EPOCH_DATE = date(2025, 5, 5) # Set to today as per your last change
+from sqlalchemy import func, insert # Import func for max()
+import click
+import hashlib
+import hmac
+import logging
+import mimetypes
+import os
+import time
+
+logger = logging.getLogger(__name__)
+cli_logger = logging.getLogger('app.cli') # Output of the flask CLI commands (plain text, see logs.py)
 
 # Define constants (if not already defined elsewhere)
 MAX_GUESSES = 3
@@ -27,182 +42,255 @@ def get_or_create_player_uuid():
     if 'player_uuid' not in session:
         # Generate a new UUID and store it in the session
         session['player_uuid'] = str(uuid.uuid4())
-        print(f"[INFO] Created new player UUID: {session['player_uuid']}")
+        logger.info("Created new player UUID", extra={'player_uuid': session['player_uuid']})
     return session['player_uuid']
 
 @main.route('/')
 def index():
-    player_uuid = get_or_create_player_uuid()
-    selected_mode = request.args.get('mode', 'Classic') 
-
-    today_date = date.today()
-    day_number = (today_date - EPOCH_DATE).days
-    print(f"[DEBUG] index: Mode '{selected_mode}', Day_number = {day_number}")
-
-    riddle = Riddle.query.filter_by(day_number=day_number, game_mode=selected_mode).first()
-    template_name = 'pixelated_game.html' if selected_mode == 'Pixelated' else 'classic_game.html'
-
-    # Set current game context for make_guess
-    session['active_state_mode'] = selected_mode
-    session['active_state_date_iso'] = today_date.isoformat()
+    """
+    The game page for a mode. It holds nothing player specific (the page loads the player's
+    guesses and stats from /api/state), so it is the same for everyone for the whole UTC day:
+    it's rendered once per worker (see page_cache.py), sent with an ETag and may be cached by
+    browsers and proxies until midnight.
+    The session isn't touched here, so no cookie is set and nothing varies on it.
+    """
+    selected_mode = request.args.get('mode', 'Classic')
 
-    if not riddle:
-        # ... (existing no riddle logic - it's mostly fine, ensure it uses template_name)
-        # ... (ensure game_config_data is also populated for error page if JS relies on it)
-        print(f"[ERROR] index: No riddle found for mode '{selected_mode}', day_number {day_number}.")
-        stats = get_player_stats_dict(player_uuid, selected_mode)
-        avg_incorrect_val = stats.get('avg_incorrect', 0.0)
-        now_utc = datetime.now(timezone.utc)
-        midnight_today_utc = datetime(now_utc.year, now_utc.month, now_utc.day, tzinfo=timezone.utc)
-        next_midnight_utc = midnight_today_utc + timedelta(days=1)
-        next_midnight_iso_val = next_midnight_utc.isoformat()
-        
-        # Simplified game_config_data for error/no-riddle page
-        error_game_config_data = {
-            "nextMidnightISO": next_midnight_iso_val,
-            "isGameOverOnLoad": True, # No game to play
-            "isWinOnLoad": False,
-            "dayNumberOnLoad": day_number,
-            "incorrectGuessesOnLoad": 0,
-            "maxGuessesOnLoad": MAX_GUESSES,
-            "MAX_GUESSES": MAX_GUESSES,
-            "initialRiddleId": None,
-            "initialGameMode": selected_mode,
-            "answerDisplay": "",
-            "makeGuessUrl": url_for('main.make_guess'),
-            "getEmojiUrl": None
-        }
+    today_date = utc_today()
+    day_number = day_number_for(today_date)
+    logger.debug("index", extra={'mode': selected_mode, 'day_number': day_number})
 
-        return render_template(
-            template_name,
-            stats=stats,
-            selected_mode=selected_mode,
-            max_guesses=MAX_GUESSES,
-            avg_incorrect=avg_incorrect_val,
-            incorrect_guesses=0,
-            current_riddle_id=None,
-            category="N/A",
-            game_over=True, 
-            is_win=False,
-            answer_display="",
-            guessed_letters=[],
-            alphabet=list(ALPHABET),
-            next_midnight_iso=next_midnight_iso_val,
-            current_year=datetime.now().year,
-            day_number_on_load=day_number,
-            is_game_over_on_load=True,
-            is_win_on_load=False,
-            incorrect_guesses_on_load=0,
-            max_guesses_on_load=MAX_GUESSES,
-            error_message=f"No riddle available today for {selected_mode} mode. Please check back tomorrow or run 'flask init-db'.",
-            game_config_data=error_game_config_data
-        )
+    riddle = riddle_repository.get_for_day(selected_mode, day_number)
+    next_midnight = next_utc_midnight()
 
-    today_iso = today_date.isoformat()
+    etag = game_page_etag(selected_mode, day_number, riddle.id if riddle else None)
+    if etag in request.if_none_match: # Skip rendering, the client has this page already
+        return cacheable_response(make_response('', 304), etag, next_midnight)
 
-    # Initialize new session structure if not present
-    if 'game_states_by_day_mode' not in session:
-        session['game_states_by_day_mode'] = {}
-    if today_iso not in session['game_states_by_day_mode']:
-        session['game_states_by_day_mode'][today_iso] = {}
-
-    game_state_for_current_mode = session['game_states_by_day_mode'][today_iso].get(selected_mode)
-
-    load_this_game_from_session = False
-    if game_state_for_current_mode and game_state_for_current_mode.get('riddle_id') == riddle.id:
-        load_this_game_from_session = True
-
-    if load_this_game_from_session:
-        print(f"[DEBUG] index: Loading existing game state from session for day {day_number}, mode {selected_mode}")
-        current_guesses = game_state_for_current_mode.get('guesses', [])
-        game_is_over = game_state_for_current_mode.get('game_over', False)
-        player_has_won = game_state_for_current_mode.get('is_win', False)
-        
-        incorrect_count = len([g for g in current_guesses if g not in riddle.name.lower()])
-        if game_is_over:
-            current_answer_display = ''.join(char if char.isalpha() else ' ' for char in riddle.name)
-        else:
-            current_answer_display = ''.join(char if char.lower() in current_guesses else '_' if char.isalpha() else ' ' for char in riddle.name)
+    render = lambda: render_game_page(selected_mode, day_number, riddle, next_midnight)
+    if selected_mode in AVAILABLE_MODES:
+        cache_key = ('game', request.script_root, selected_mode, day_number, riddle.id if riddle else None)
+        body = page_cache.get_or_render(cache_key, etag, render).body
     else:
-        print(f"[DEBUG] index: Initializing new game state for day {day_number}, mode {selected_mode}")
-        new_game_state = {
-            'riddle_id': riddle.id,
-            'guesses': [],
-            'game_over': False,
-            'is_win': False
-        }
-        session['game_states_by_day_mode'][today_iso][selected_mode] = new_game_state
-        session.modified = True 
-
-        current_guesses = []
-        game_is_over = False
-        player_has_won = False
-        incorrect_count = 0
-        current_answer_display = ''.join('_' if char.isalpha() else ' ' for char in riddle.name)
-
-    stats = get_player_stats_dict(player_uuid, selected_mode)
-    avg_incorrect_val = stats.get('avg_incorrect', 0.0)
-    
-    now_utc = datetime.now(timezone.utc)
-    midnight_today_utc = datetime(now_utc.year, now_utc.month, now_utc.day, tzinfo=timezone.utc)
-    next_midnight_utc = midnight_today_utc + timedelta(days=1)
-    next_midnight_iso_val = next_midnight_utc.isoformat()
+        body = render() # Don't let made-up modes push the real pages out of the cache
+    return cacheable_response(make_response(body), etag, next_midnight)
+
+def render_game_page(selected_mode, day_number, riddle, next_midnight):
+    template_name = 'pixelated_game.html' if selected_mode == 'Pixelated' else 'classic_game.html'
+    next_midnight_iso_val = next_midnight.isoformat()
 
     game_config_data = {
         "nextMidnightISO": next_midnight_iso_val,
-        "isGameOverOnLoad": game_is_over,
-        "isWinOnLoad": player_has_won,
+        "isGameOverOnLoad": riddle is None, # The player's real state comes from stateUrl
+        "isWinOnLoad": False,
         "dayNumberOnLoad": day_number,
-        "incorrectGuessesOnLoad": incorrect_count,
+        "incorrectGuessesOnLoad": 0,
         "maxGuessesOnLoad": MAX_GUESSES,
         "MAX_GUESSES": MAX_GUESSES,
-        "initialRiddleId": riddle.id,
+        "initialRiddleId": riddle.id if riddle else None,
         "initialGameMode": selected_mode,
-        "answerDisplay": current_answer_display,
+        "answerDisplay": riddle.profile.template if riddle else "",
+        "emoji": riddle.emoji if riddle else None, # Drawn right away, no /api/get-emoji round trip
         "makeGuessUrl": url_for('main.make_guess'),
-        "getEmojiUrl": url_for('main.get_emoji', riddle_id=riddle.id)
+        "getEmojiUrl": url_for('main.get_emoji', riddle_id=riddle.id, v=emoji_version(riddle)) if riddle else None,
+        "pixelatedImageUrls": None,
+        "pixelationWorkerUrl": assets.urls('emoji_renderer.js')[0], # Pixelates in the browser without pixelatedImageUrls
+        "stateUrl": url_for('main.get_state', mode=selected_mode)
     }
 
-    return render_template(
-        template_name,
-        stats=stats,
+    if riddle and selected_mode == 'Pixelated' and pixelator.available:
+        # The server renders the pixelation levels (pixelation.py): the page only gets their
+        # URLs, the emoji itself is only sent once the player may see it
+        game_config_data["emoji"] = None
+        game_config_data["pixelatedImageUrls"] = [
+            url_for('main.pixelated_image', riddle_id=riddle.id, level=level, v=pixelated_version(riddle, level))
+            for level in range(len(LEVEL_SIZES))
+        ]
+
+    template_context = dict(
+        stats=stats_to_dict(None),
         selected_mode=selected_mode,
         max_guesses=MAX_GUESSES,
-        avg_incorrect=avg_incorrect_val,
-        incorrect_guesses=incorrect_count,
-        current_riddle_id=riddle.id, # Still useful for template if not using game_config everywhere
-        category=riddle.category,
-        game_over=game_is_over,
-        is_win=player_has_won,
-        answer_display=current_answer_display,
-        guessed_letters=current_guesses,
+        avg_incorrect=0.0,
+        incorrect_guesses=0,
+        current_riddle_id=riddle.id if riddle else None,
+        category=riddle.category if riddle else "N/A",
+        game_over=riddle is None,
+        is_win=False,
+        answer_display=riddle.profile.template if riddle else "",
+        guessed_letters=[],
         alphabet=list(ALPHABET),
         next_midnight_iso=next_midnight_iso_val,
         current_year=datetime.now().year,
-        day_number_on_load=day_number, 
-        is_game_over_on_load=game_is_over, 
-        is_win_on_load=player_has_won, 
-        incorrect_guesses_on_load=incorrect_count, 
-        max_guesses_on_load=MAX_GUESSES, 
+        day_number_on_load=day_number,
+        is_game_over_on_load=riddle is None,
+        is_win_on_load=False,
+        incorrect_guesses_on_load=0,
+        max_guesses_on_load=MAX_GUESSES,
         game_config_data=game_config_data
     )
+    if not riddle:
+        logger.error("index: No riddle found", extra={'mode': selected_mode, 'day_number': day_number})
+        template_context['error_message'] = f"No riddle available today for {selected_mode} mode. Please check back tomorrow or run 'flask init-db'."
+    return minify_html(render_template(template_name, **template_context))
+
+def cacheable_response(response, etag, expires):
+    """Lets browsers and proxies keep the response until `expires` (revalidating with the ETag)."""
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = seconds_until(expires)
+    response.expires = expires
+    return response
+
+def game_page_etag(mode, day_number, riddle_id):
+    """Changes with the day, the riddle and the deploy (templates / static files)."""
+    return page_etag(f"{mode}:{day_number}:{riddle_id}")
+
+def page_etag(key):
+    key = f"{key}:{request.script_root}:{current_app.config['DEPLOY_VERSION']}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
+def seconds_until(moment):
+    return max(0, int((moment - datetime.now(timezone.utc)).total_seconds()))
+
+@main.route('/api/state')
+def get_state():
+    """
+    The player's game for today in a mode: guesses, answer display and stats. Also makes
+    this mode/day the one /guess plays (active_state_* in the session).
+    """
+    player_uuid = get_or_create_player_uuid()
+    selected_mode = request.args.get('mode', 'Classic')
+
+    today_date = utc_today()
+    today_iso = today_date.isoformat()
+    day_number = day_number_for(today_date)
+
+    # Set current game context for make_guess
+    session['active_state_mode'] = selected_mode
+    session['active_state_date_iso'] = today_iso
+
+    riddle = riddle_repository.get_for_day(selected_mode, day_number)
+    stats = stats_for_json(get_player_stats_dict(player_uuid, selected_mode))
+    if not riddle:
+        response = jsonify({
+            'mode': selected_mode,
+            'day_number': day_number,
+            'riddle_id': None,
+            'error': f"No riddle available today for {selected_mode} mode.",
+            'game_over': True,
+            'is_win': False,
+            'answer_display': '',
+            'guessed_letters': [],
+            'incorrect_guesses': 0,
+            'max_guesses': MAX_GUESSES,
+            'stats': stats
+        })
+    else:
+        game_state_store = get_game_state_store()
+        game_state_for_current_mode = game_state_store.load(player_uuid, today_iso, selected_mode)
+
+        if game_state_for_current_mode and game_state_for_current_mode.get('riddle_id') == riddle.id:
+            logger.debug("get_state: Loading existing game state", extra={'mode': selected_mode, 'day_number': day_number})
+            current_guesses = game_state_for_current_mode.get('guesses', [])
+            game_is_over = game_state_for_current_mode.get('game_over', False)
+            player_has_won = game_state_for_current_mode.get('is_win', False)
+        else:
+            logger.debug("get_state: Initializing new game state", extra={'mode': selected_mode, 'day_number': day_number})
+            current_guesses, game_is_over, player_has_won = [], False, False
+            game_state_store.save(player_uuid, today_iso, selected_mode, {
+                'riddle_id': riddle.id,
+                'guesses': [],
+                'game_over': False,
+                'is_win': False
+            })
+
+        guess_mask = guesses_to_mask(current_guesses)
+        response = jsonify({
+            'mode': selected_mode,
+            'day_number': day_number,
+            'riddle_id': riddle.id,
+            'game_over': game_is_over,
+            'is_win': player_has_won,
+            'answer_display': riddle.profile.solved_display if game_is_over else riddle.profile.display(guess_mask),
+            'guessed_letters': current_guesses,
+            'incorrect_guesses': riddle.profile.incorrect_count(guess_mask),
+            'max_guesses': MAX_GUESSES,
+            'stats': stats
+        })
+    response.cache_control.no_store = True
+    return response
+
+def stats_for_json(stats):
+    """Stats dict plus the formatted last-played time the page shows."""
+    last_played = stats.get('last_played_datetime')
+    return dict(stats, last_played_datetime_str=last_played.strftime('%Y-%m-%d %H:%M:%S') if last_played else None)
+
+# Most letters a single /guess request may carry (one per letter of the alphabet)
+MAX_BATCH_GUESSES = len(ALPHABET)
+
+def apply_guesses(profile, guesses, letters):
+    """
+    The per-letter work of make_guess: applies letters in order to guesses (a list, appended
+    to in place) and returns (per-letter results, guess mask, game_over, is_win). Letters after
+    the one that ends the game aren't applied.
+    """
+    guess_mask = guesses_to_mask(guesses)
+    results, game_over, is_win = [], False, False
+    for letter in letters:
+        if game_over:
+            results.append({'letter': letter, 'success': False, 'error': 'The game is already over.'})
+            continue
+        guess_bit = letter_bit(letter) if len(letter) == 1 else 0
+        if not guess_bit:
+            results.append({'letter': letter, 'success': False, 'error': 'Invalid guess. Please enter a single letter.'})
+            continue
+        if guess_mask & guess_bit:
+            results.append({'letter': letter, 'success': False, 'error': 'Letter already guessed.'})
+            continue
+
+        guesses.append(letter)
+        guess_mask |= guess_bit
+        is_win = profile.is_solved(guess_mask)
+        game_over = is_win or profile.incorrect_count(guess_mask) >= MAX_GUESSES
+        results.append({'letter': letter, 'success': True, 'is_correct': bool(profile.required_mask & guess_bit)})
+    return results, guess_mask, game_over, is_win
 
 @main.route('/guess', methods=['POST'])
 def make_guess():
-    data = request.get_json()
-    guess = data.get('guess', '').lower()
+    """
+    Applies {"guess": "a"}, or {"guesses": ["a", "b", ...]} in order: letters after the one
+    that ends the game are ignored, and the whole batch is one state save (and at most one
+    stats update). A batch response has a "results" entry per letter plus the final state.
+
+    With "delta": true the response only has what the client can't work out itself (see
+    delta_guess_response): the answer positions each letter revealed and the incorrect count,
+    plus the answer and stats once the game ends, instead of the whole display and guess list.
+    """
+    data = request.get_json(silent=True) or {}
+    if not isinstance(data, dict):
+        return jsonify({'success': False, 'error': 'Expected a JSON object: {"guess": "a"} or {"guesses": [...]}.'}), 400
+    is_batch = 'guesses' in data
+    is_delta = data.get('delta') is True
+    if is_batch:
+        letters = data.get('guesses')
+        if not isinstance(letters, list) or not letters or len(letters) > MAX_BATCH_GUESSES:
+            return jsonify({'success': False, 'error': f'"guesses" must be a list of 1 to {MAX_BATCH_GUESSES} letters.'}), 400
+    else:
+        letters = [data.get('guess', '')]
+    letters = [letter.lower() if isinstance(letter, str) else '' for letter in letters]
     player_uuid = session.get('player_uuid')
 
     # Get current game context from session (set by index route)
     active_mode = session.get('active_state_mode')
     active_date_iso = session.get('active_state_date_iso')
 
-    if not active_mode or not active_date_iso:
+    if not player_uuid or not active_mode or not active_date_iso:
         return jsonify({'success': False, 'error': 'Game session context not found. Please refresh.', 'game_over': True})
 
     # Fetch the specific game state for the current mode and date
-    game_states_for_day = session.get('game_states_by_day_mode', {}).get(active_date_iso, {})
-    current_game_session_state = game_states_for_day.get(active_mode)
+    game_state_store = get_game_state_store()
+    current_game_session_state = game_state_store.load(player_uuid, active_date_iso, active_mode)
 
     if not current_game_session_state:
         return jsonify({'success': False, 'error': 'Game state not found for this mode/day. Please refresh.', 'game_over': True})
@@ -211,155 +299,124 @@ def make_guess():
     if riddle_id_from_session is None:
          return jsonify({'success': False, 'error': 'Riddle ID not found in session state. Please refresh.', 'game_over': True})
 
-    riddle = Riddle.query.get(riddle_id_from_session)
+    riddle = riddle_repository.get_by_id(riddle_id_from_session)
     if not riddle:
         return jsonify({'success': False, 'error': 'Riddle not found. Please refresh.', 'game_over': True})
 
-    answer = riddle.name.lower()
+    profile = riddle.profile # Precomputed letter mask / positions / display template
     guesses = current_game_session_state.get('guesses', []) # Get guesses from mode-specific state
+    guess_mask = guesses_to_mask(guesses)
 
     if current_game_session_state.get('game_over', False):
         # Construct response based on the saved game_over state
-        response_answer_display = ''.join(char if char.isalpha() else ' ' for char in answer) # Show full answer
-        return jsonify({
+        response = {
             'success': False, # Or True, but game is over
             'error': 'The game is already over.',
             'game_over': True,
             'is_win': current_game_session_state.get('is_win', False),
-            'answer_display': response_answer_display,
+            'answer_display': profile.solved_display, # Show full answer
             'guessed_letters': guesses,
-            'incorrect_guesses': len([g for g in guesses if g not in answer])
-        })
+            'incorrect_guesses': profile.incorrect_count(guess_mask)
+        }
+        if is_batch:
+            response['results'] = [{'letter': letter, 'success': False, 'error': 'The game is already over.'} for letter in letters]
+        return jsonify(response)
 
-    if not guess.isalpha() or len(guess) != 1:
-        return jsonify({'success': False, 'error': 'Invalid guess. Please enter a single letter.'})
+    results, guess_mask, game_over, is_win = apply_guesses(profile, guesses, letters)
 
-    if guess in guesses:
-        return jsonify({'success': False, 'error': 'Letter already guessed.'})
+    applied = [result for result in results if result['success']]
+    if not is_batch and not applied:
+        return jsonify({'success': False, 'error': results[0]['error']})
 
-    guesses.append(guess)
-    # current_game_session_state['guesses'] = guesses # List is modified in-place, but explicit re-assignment is safer if any doubt
+    incorrect_guess_count = profile.incorrect_count(guess_mask)
+    if applied:
+        # Update the mode-specific game state
+        current_game_session_state['game_over'] = game_over
+        current_game_session_state['is_win'] = is_win
+        current_game_session_state['guesses'] = guesses # Ensure the list is updated back
+        game_state_store.save(player_uuid, active_date_iso, active_mode, current_game_session_state)
 
-    is_win = all(char in guesses or not char.isalpha() for char in answer)
-    incorrect_guess_count = len([g for g in guesses if g not in answer])
-    game_over = is_win or incorrect_guess_count >= MAX_GUESSES
+    stats = None
+    if game_over: # If game just ended, show full answer
+        response_answer_display = profile.solved_display
+        # Update player stats in DB, the upsert hands back the updated row
+        stats = update_player_stats(player_uuid, active_mode, is_win, incorrect_guess_count, date.fromisoformat(active_date_iso))
+        if stats is None:
+            stats = get_player_stats_dict(player_uuid, active_mode)
+    elif is_delta:
+        response_answer_display = None # Not needed, skip building it
+    else:
+        response_answer_display = profile.display(guess_mask)
 
-    # Update the mode-specific session state
-    current_game_session_state['game_over'] = game_over
-    current_game_session_state['is_win'] = is_win
-    current_game_session_state['guesses'] = guesses # Ensure the list is updated back
-    session.modified = True # Crucial!
+    if is_delta:
+        return jsonify(delta_guess_response(profile, results, is_batch, incorrect_guess_count, game_over, is_win, stats))
 
-    response_answer_display = ''.join(char if char.lower() in guesses or not char.isalpha() else '_' for char in riddle.name)
-    if game_over: # If game just ended, show full answer
-        response_answer_display = ''.join(char if char.isalpha() else ' ' for char in riddle.name)
-        # Update player stats in DB
-        update_player_stats(player_uuid, active_mode, is_win, incorrect_guess_count, date.fromisoformat(active_date_iso))
-
-    return jsonify({
-        'success': True,
-        'guessed_letter': guess,
-        'is_correct': guess in answer,
+    response = {
+        'success': bool(applied),
         'game_over': game_over,
         'is_win': is_win,
         'answer_display': response_answer_display,
         'guessed_letters': guesses,
         'incorrect_guesses': incorrect_guess_count,
-        'stats': get_player_stats_dict(player_uuid, active_mode) if game_over else None
-    })
-
-# Helper function to update player stats (extracted for clarity)
-def update_player_stats(player_uuid, game_mode, is_win_for_game, incorrect_guesses_for_game, game_date_for_streak):
-    # Query using the composite primary key (player_uuid, game_mode)
-    player_stats = PlayerStats.query.get((player_uuid, game_mode)) 
-    if not player_stats:
-        # If no stats record exists, create one for this player and game mode
-        print(f"[INFO] update_player_stats: First game for player {player_uuid} in mode {game_mode}. Creating PlayerStats record.")
-        player_stats = PlayerStats(
-            player_uuid=player_uuid,
-            game_mode=game_mode, # Ensure game_mode is set when creating new record
-            total_games=0,  # Will be incremented to 1 below
-            total_incorrect=0, # Will be updated below
-            current_play_streak=0, # Initial streak
-            longest_play_streak=0,
-            current_correct_streak=0,
-            longest_correct_streak=0,
-            last_played_datetime=None # Will be set to now_utc below
-        )
-        db.session.add(player_stats)
-        # The commit at the end of this function will save the new record.
-
-    now_utc = datetime.now(timezone.utc)
-    # Ensure last_played_datetime is timezone-aware if comparing with now_utc
-    last_played_date = None
-    if player_stats.last_played_datetime:
-        if player_stats.last_played_datetime.tzinfo is None:
-            # If naive, assume UTC (or your app's default timezone)
-            # This depends on how last_played_datetime is stored. For safety, let's assume it might be naive.
-            # It's better to always store it as timezone-aware UTC.
-            last_played_date = player_stats.last_played_datetime.replace(tzinfo=timezone.utc).date()
-        else:
-            last_played_date = player_stats.last_played_datetime.astimezone(timezone.utc).date()
-
-    # Update total games only if it's a new game for the day or if it's the first game ever
-    # This logic might need refinement based on how "game played" is defined.
-    # For now, let's assume every call to this function (on game_over) means a game was played.
-    player_stats.total_games += 1
-    player_stats.total_incorrect += incorrect_guesses_for_game
-
-    # Play Streak
-    if last_played_date == game_date_for_streak - timedelta(days=1):
-        player_stats.current_play_streak += 1
-    elif last_played_date != game_date_for_streak: # Reset if not played yesterday or today (and it's a new day for this game)
-        player_stats.current_play_streak = 1
-    # If last_played_date is game_date_for_streak, streak doesn't change until the next distinct game day.
-
-    if player_stats.current_play_streak > player_stats.longest_play_streak:
-        player_stats.longest_play_streak = player_stats.current_play_streak
-
-    # Correct Streak
-    if is_win_for_game:
-        player_stats.current_correct_streak += 1
+        'stats': stats
+    }
+    if is_batch:
+        response['results'] = results
     else:
-        player_stats.current_correct_streak = 0 # Reset on loss
+        response['guessed_letter'] = applied[0]['letter']
+        response['is_correct'] = applied[0]['is_correct']
+    return jsonify(response)
+
+def delta_guess_response(profile, results, is_batch, incorrect_guess_count, game_over, is_win, stats):
+    """
+    The compact /guess response: the client already shows the answer tiles, the guessed letters
+    and the stats, so it only gets the change.
+
+        {"success": true, "letter": "r", "revealed": [0], "incorrect_guesses": 0}
 
-    if player_stats.current_correct_streak > player_stats.longest_correct_streak:
-        player_stats.longest_correct_streak = player_stats.current_correct_streak
-    
-    player_stats.last_played_datetime = now_utc # Update last played time to now
+    "revealed" are the answer positions of the letter (empty for an incorrect guess). A batch has
+    {"letter", "revealed"} or {"letter", "error"} per letter under "results" instead. Only when
+    the game ends are "game_over", "is_win", the full "answer" and the updated "stats" added.
+    """
+    def delta(result):
+        if not result['success']:
+            return {'letter': result['letter'], 'error': result['error']}
+        return {'letter': result['letter'], 'revealed': profile.revealed_positions(result['letter'])}
+
+    if is_batch:
+        response = {'success': any(result['success'] for result in results), 'results': [delta(result) for result in results]}
+    else:
+        response = {'success': True, **delta(results[0])}
+    response['incorrect_guesses'] = incorrect_guess_count
+    if game_over:
+        response.update(game_over=True, is_win=is_win, answer=profile.solved_display, stats=stats)
+    return response
 
+# Helper function to update player stats (extracted for clarity)
+def update_player_stats(player_uuid, game_mode, is_win_for_game, incorrect_guesses_for_game, game_date_for_streak):
+    """Records a finished game in one UPSERT statement (see stats.py) and returns the updated stats dict."""
+    if stats_writer.enabled:
+        # Write-behind mode: queue it, the background flush writes it in a batch
+        stats_writer.record(player_uuid, game_mode, is_win_for_game, incorrect_guesses_for_game, game_date_for_streak)
+        return get_player_stats_dict(player_uuid, game_mode)
     try:
+        player_stats = upsert_player_stats(player_uuid, game_mode, is_win_for_game, incorrect_guesses_for_game, game_date_for_streak)
         db.session.commit()
-        print(f"[DEBUG] update_player_stats: Stats updated for player {player_uuid}")
-    except Exception as e:
+        logger.debug("update_player_stats: Stats updated", extra={'player_uuid': player_uuid, 'mode': game_mode})
+        return stats_to_dict(player_stats)
+    except Exception:
         db.session.rollback()
-        print(f"[ERROR] update_player_stats: Failed to update stats for {player_uuid}: {e}")
+        logger.exception("update_player_stats: Failed to update stats", extra={'player_uuid': player_uuid, 'mode': game_mode})
+        return None
 
 # Helper to get stats as dict (you might have this already)
 def get_player_stats_dict(player_uuid, game_mode):
     # Query using the composite primary key (player_uuid, game_mode)
-    player_stats = PlayerStats.query.get((player_uuid, game_mode))
-    if player_stats:
-        avg_incorrect = (player_stats.total_incorrect / player_stats.total_games) if player_stats.total_games > 0 else 0.0
-        return {
-            'total_games': player_stats.total_games,
-            'avg_incorrect': avg_incorrect,
-            'current_play_streak': player_stats.current_play_streak,
-            'longest_play_streak': player_stats.longest_play_streak,
-            'current_correct_streak': player_stats.current_correct_streak,
-            'longest_correct_streak': player_stats.longest_correct_streak,
-            'last_played_datetime': player_stats.last_played_datetime
-        }
-    # Return default stats if no record exists for the given player and game mode
-    return {
-        'total_games': 0,
-        'avg_incorrect': 0.0,
-        'current_play_streak': 0,
-        'longest_play_streak': 0,
-        'current_correct_streak': 0,
-        'longest_correct_streak': 0,
-        'last_played_datetime': None
-    }
+    # Returns default stats if no record exists for the given player and game mode
+    player_stats = db.session.get(PlayerStats, (player_uuid, game_mode))
+    if stats_writer.enabled:
+        player_stats = stats_writer.merge_pending(player_uuid, game_mode, player_stats) # Games not flushed yet
+    return stats_to_dict(player_stats)
 
 def calculate_avg_incorrect(player_uuid): # Placeholder for your existing logic if separate
     stats = PlayerStats.query.get(player_uuid)
@@ -368,137 +425,370 @@ def calculate_avg_incorrect(player_uuid): # Placeholder for your existing logic
     return 0
 
 # --- ADD API Endpoint for Emoji ---
+# Riddle ids aren't stable: a re-run init-db reuses table ids, and the catalog behind schedule
+# ids changes with import-emoji-test. So the game page links the emoji / images with ?v= the
+# version of what's behind the id (emoji_version, pixelated_version), and only those URLs are
+# kept for a year; any other URL (an old version, or none) has to be revalidated after a while.
+EMOJI_MAX_AGE = 365 * 24 * 60 * 60
+EMOJI_REVALIDATE_MAX_AGE = 5 * 60
+
 @main.route('/api/get-emoji/<int:riddle_id>')
 def get_emoji(riddle_id):
-    riddle = Riddle.query.get(riddle_id)
-    if riddle:
-        return jsonify({'emoji': riddle.emoji})
-    else:
+    riddle = riddle_repository.get_by_id(riddle_id)
+    if not riddle or (riddle.day_number is not None and riddle.day_number > current_day_number()):
+        # Future riddles don't exist yet (schedule ids are predictable)
         return jsonify({'error': 'Riddle not found'}), 404
+    hidden = riddle.game_mode == 'Pixelated' and pixelator.available
+    if hidden and revealed_pixelation_level(riddle) != FULL_LEVEL:
+        # Pixelated mode shows the server-rendered levels until the game is over
+        return jsonify({'error': 'Not revealed yet'}), 403
+    response = jsonify({'emoji': riddle.emoji})
+    response.set_etag(hashlib.sha1(f"{riddle.id}:{riddle.emoji}".encode('utf-8')).hexdigest()[:20])
+    set_versioned_max_age(response, emoji_version(riddle))
+    if hidden:
+        response.cache_control.private = True # Only revealed to this player
+    else:
+        response.cache_control.public = True
+    return response.make_conditional(request) # 304 for a matching If-None-Match
+
+def set_versioned_max_age(response, version):
+    """A year when the URL's ?v= is the current version of its content, a short max-age otherwise."""
+    if request.args.get('v') == version:
+        response.cache_control.max_age = EMOJI_MAX_AGE
+    else:
+        response.cache_control.max_age = EMOJI_REVALIDATE_MAX_AGE
+        response.cache_control.must_revalidate = True
+
+def keyed_digest(value):
+    """
+    HMAC of value with SECRET_KEY, for validators and URL versions derived from a riddle's emoji:
+    a plain hash could be computed for every catalog emoji offline and matched, giving away answers.
+    """
+    secret = current_app.secret_key
+    if isinstance(secret, str):
+        secret = secret.encode('utf-8')
+    return hmac.new(secret, value.encode('utf-8'), hashlib.sha256).hexdigest()
+
+def emoji_version(riddle):
+    return keyed_digest(f"emoji:{riddle.id}:{riddle.emoji}")[:12]
+
+def pixelated_version(riddle, level):
+    """Changes with the emoji, the font and the renderer (the PNG's cache key)."""
+    return keyed_digest(f"pixelated:{riddle.id}:{pixelator.cache_key(riddle.emoji, level)}")[:12]
+
+def revealed_pixelation_level(riddle):
+    """
+    The finest pixelation level (pixelation.LEVEL_SIZES index) of the riddle this player may
+    see: past days are fully revealed, today's riddle goes by the player's game, future
+    riddles aren't shown at all (None).
+    """
+    today_number = current_day_number()
+    if riddle.day_number is None or riddle.day_number > today_number:
+        return None
+    if riddle.day_number < today_number:
+        return FULL_LEVEL
+    player_uuid = session.get('player_uuid')
+    state = get_game_state_store().load(player_uuid, utc_today().isoformat(), riddle.game_mode) if player_uuid else None
+    if not state or state.get('riddle_id') != riddle.id:
+        return 0
+    incorrect_guesses = riddle.profile.incorrect_count(guesses_to_mask(state.get('guesses', [])))
+    return level_for(incorrect_guesses, state.get('game_over', False), MAX_GUESSES)
+
+@main.route('/api/pixelated/<int:riddle_id>/<int:level>.png')
+def pixelated_image(riddle_id, level):
+    """A Pixelated riddle's emoji at a pixelation level, rendered once and then read from the disk cache."""
+    if not pixelator.available:
+        abort(404)
+    riddle = riddle_repository.get_by_id(riddle_id)
+    if not riddle or riddle.game_mode != 'Pixelated' or not 0 <= level <= FULL_LEVEL:
+        abort(404)
+    revealed = revealed_pixelation_level(riddle)
+    if revealed is None or level > revealed:
+        return jsonify({'error': 'Not revealed yet'}), 403
+
+    png, key = pixelator.get_png(riddle.emoji, level)
+    response = make_response(png)
+    response.mimetype = 'image/png'
+    response.set_etag(keyed_digest(key)[:20]) # Opaque: the cache key is a plain hash of the emoji
+    set_versioned_max_age(response, pixelated_version(riddle, level))
+    if level == 0:
+        response.cache_control.public = True # The coarsest level is the same for everyone
+    else:
+        response.cache_control.private = True # Revealed to this player, by their guesses
+    return response.make_conditional(request)
 
 # --- ADD NEW ROUTE FOR MORE GAMES PAGE ---
 @main.route('/more-games')
 def more_games():
-    """Renders the page listing available game modes."""
-    print("[DEBUG] more_games: Rendering more_games.html")
-    # You can add logic here if needed, e.g., fetching descriptions for modes
-    return render_template('more_games.html', available_modes=AVAILABLE_MODES)
+    """Renders the page listing available game modes (cached until midnight, like the game pages)."""
+    day_number = current_day_number()
+    next_midnight = next_utc_midnight()
+    etag = page_etag(f"more_games:{day_number}")
+    if etag in request.if_none_match:
+        return cacheable_response(make_response('', 304), etag, next_midnight)
+
+    def render():
+        logger.debug("more_games: Rendering more_games.html")
+        # You can add logic here if needed, e.g., fetching descriptions for modes
+        return minify_html(render_template('more_games.html', available_modes=AVAILABLE_MODES))
+
+    page = page_cache.get_or_render(('more_games', request.script_root, day_number), etag, render)
+    return cacheable_response(make_response(page.body), page.etag, next_midnight)
+
+# Built CSS/JS bundles (see assets.py). The names contain a hash of the content, so they can be kept forever.
+ASSET_MAX_AGE = 365 * 24 * 60 * 60
+
+@main.route('/assets/<path:filename>')
+def asset(filename):
+    """Serves a file of the current build, precompressed (br / gzip) when the browser accepts it."""
+    path = assets.path_for(filename)
+    if path is None:
+        abort(404)
+    mimetype = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    encoding = None
+    for candidate, suffix in ENCODINGS:
+        if request.accept_encodings[candidate] and os.path.exists(path + suffix):
+            encoding, path = candidate, path + suffix
+            break
+
+    response = send_file(path, mimetype=mimetype, max_age=ASSET_MAX_AGE, conditional=True)
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding') # Caches must keep the variants apart
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 @main.cli.command("init-db")
-def init_db_command():
+@click.option('--days', type=int, default=None, help='How many days to schedule (default: one full cycle, i.e. the catalog size).')
+def init_db_command(days):
     """
     Initializes the database with riddles for multiple modes.
     - Each mode cycles through all available emojis.
     - On any given day_number, different modes will have different emojis.
-    - Introduces more variation in sequences between modes.
+    - The assignment comes from the deterministic scheduler (see scheduler.py), so the rows
+      match what RIDDLE_SOURCE = 'schedule' would serve.
     """
     db.create_all()
-    print("Ensured all tables exist (created if necessary).")
+    cli_logger.info("Ensured all tables exist (created if necessary).")
 
     Riddle.query.delete()
     db.session.commit()
-    print("Cleared existing riddles.")
-
-    if not initial_emojis:
-        print("Error: initial_emojis list is empty. Cannot populate riddles.")
-        return
+    cli_logger.info("Cleared existing riddles.")
 
-    num_unique_emojis = len(initial_emojis)
+    catalog = get_catalog()
+    num_unique_emojis = len(catalog)
     num_modes = len(AVAILABLE_MODES)
 
     if num_unique_emojis == 0:
-        print("Error: The initial_emojis list is empty. No riddles to add.")
+        cli_logger.error("Error: The emoji catalog is empty. No riddles to add.")
+        return
+
+    if num_unique_emojis < num_modes:
+        cli_logger.error(f"Error: Number of unique emojis ({num_unique_emojis}) is less than the number of game modes ({num_modes}).")
+        cli_logger.error("Different game modes would have to share an emoji on the same day_number. Add more emojis.")
+        return
+
+    days = days or num_unique_emojis
+    seed = current_app.config['SCHEDULE_SEED']
+    cli_logger.info(f"Scheduling {days} day_numbers for modes: {', '.join(AVAILABLE_MODES)} ({num_unique_emojis} emojis, seed '{seed}')...")
+
+    started = time.perf_counter()
+    rows = list(schedule_rows(catalog, AVAILABLE_MODES, seed, range(days)))
+    generated = time.perf_counter()
+
+    try:
+        db.session.execute(insert(Riddle), rows) # One bulk (executemany) insert
+        db.session.commit()
+        riddle_repository.clear() # Cached riddles point at the rows we just replaced
+    except Exception as e:
+        db.session.rollback()
+        cli_logger.error(f"Error committing riddles: {e}")
         return
+    inserted = time.perf_counter()
+
+    cli_logger.info(f"Successfully committed {len(rows)} riddles ({days} days x {num_modes} modes) to the database.")
+    cli_logger.info(f"  generated in {generated - started:.2f}s, inserted in {inserted - generated:.2f}s")
 
-    # This warning is still relevant: if you have few emojis, daily uniqueness is hard.
+@main.cli.command("extend-schedule")
+@click.option('--days', type=int, default=30, show_default=True, help='How many days to add after the last scheduled day.')
+def extend_schedule_command(days):
+    """
+    Appends riddles after the last scheduled day without touching existing rows.
+    - Every mode continues from its own max(day_number) up to the same last day.
+    - A mode without riddles yet starts today.
+    - New riddles never reuse an emoji another mode already has on that day.
+    Nothing already served changes, so running caches stay valid.
+    """
+    catalog = get_catalog()
+    num_unique_emojis = len(catalog)
+    num_modes = len(AVAILABLE_MODES)
     if num_unique_emojis < num_modes:
-        print(f"Warning: Number of unique emojis ({num_unique_emojis}) is less than the number of game modes ({num_modes}).")
-        print("This means different game modes WILL have the SAME emoji on the SAME day_number with the current logic.")
-        # return # Consider aborting if this is a critical failure condition
-
-    print(f"Populating riddles for {num_unique_emojis} day_numbers, for modes: {', '.join(AVAILABLE_MODES)}...")
-    print(f"Each mode will cycle through all {num_unique_emojis} emojis.")
-
-    # Create a base shuffled list of emojis - this is what each mode will draw from
-    # but in a different order determined by their mode-specific day mapping.
-    # We can just use initial_emojis directly if we apply transformations to day_number.
-
-    # Generate a unique permutation of day numbers for each mode to pick from the emoji list
-    # This helps in making the sequence of emojis different for each mode.
-    mode_day_permutations = {}
-    base_day_indices = list(range(num_unique_emojis))
-    for mode_idx, mode_name in enumerate(AVAILABLE_MODES):
-        permuted_days = random.sample(base_day_indices, num_unique_emojis)
-        mode_day_permutations[mode_name] = permuted_days
-        # print(f"Permutation for {mode_name}: {mode_day_permutations[mode_name][:10]}...") # For debugging
-
-
-    for day_number_iter in range(num_unique_emojis): # This is the actual calendar day sequence (0 to N-1)
-        emojis_assigned_this_calendar_day = {} # Tracks {emoji_char: mode_name}
-
-        print(f"Processing Calendar Day (Iteration): {day_number_iter}")
-
-        for mode_idx, mode in enumerate(AVAILABLE_MODES):
-            # Determine which emoji to pick for THIS mode on THIS calendar_day_iter
-            # We need a strategy that ensures:
-            # 1. This mode cycles through all emojis over num_unique_emojis days.
-            # 2. This mode's emoji for calendar_day_iter is different from other modes' emojis for calendar_day_iter.
-
-            # Strategy: Each mode has its own "starting point" in the emoji list,
-            # and progresses through it. We then check for daily conflicts.
-
-            # Effective emoji index for this mode, before conflict resolution
-            # The (mode_idx * some_offset) makes each mode start at a different point
-            # in the initial_emojis list for its own "day 0".
-            
-            # Ensure the stable offset logic is the one that's active:
-            mode_specific_start_offset = mode_idx # Classic (idx 0) gets offset 0, Pixelated (idx 1) gets offset 1, etc.
-
-            # The emoji this mode *would* pick for its internal sequence on day_number_iter
-            prospective_emoji_idx = (day_number_iter + mode_specific_start_offset) % num_unique_emojis
-            
-            chosen_riddle_data = None
-            
-            # Conflict resolution: try to find an emoji not yet used today
-            # This loop attempts to ensure daily uniqueness.
-            attempts = 0
-            original_prospective_idx = prospective_emoji_idx
-            while attempts < num_unique_emojis:
-                current_check_idx = (original_prospective_idx + attempts) % num_unique_emojis
-                candidate_data = initial_emojis[current_check_idx]
-                
-                if candidate_data['emoji'] not in emojis_assigned_this_calendar_day:
-                    chosen_riddle_data = candidate_data
-                    emojis_assigned_this_calendar_day[chosen_riddle_data['emoji']] = mode
-                    break
-                attempts += 1
-            
-            if not chosen_riddle_data:
-                # This should ideally not happen if num_unique_emojis >= num_modes
-                # If it does, it means we couldn't find a unique emoji for this mode today.
-                print(f"  CRITICAL WARNING on Calendar Day {day_number_iter} for Mode '{mode}': Could not find a unique emoji. Assigning non-unique or skipping.")
-                # Fallback: assign the original prospective one, even if it's a duplicate for the day
-                # This indicates a flaw if num_unique_emojis < num_modes or very bad luck in small N
-                chosen_riddle_data = initial_emojis[original_prospective_idx]
-                if chosen_riddle_data['emoji'] in emojis_assigned_this_calendar_day:
-                     print(f"    -> Assigned '{chosen_riddle_data['emoji']}' which was already used by '{emojis_assigned_this_calendar_day[chosen_riddle_data['emoji']]}' today.")
-                else: # Should not happen if the above if was true
-                     emojis_assigned_this_calendar_day[chosen_riddle_data['emoji']] = mode
-
-
-            riddle = Riddle(
-                emoji=chosen_riddle_data['emoji'],
-                name=chosen_riddle_data['name'],
-                category=chosen_riddle_data['category'],
-                day_number=day_number_iter, # This is the actual day_number for the game cycle
-                game_mode=mode
-            )
-            db.session.add(riddle)
-            print(f"  Added: Day {day_number_iter} - Mode: {mode} - Emoji: {riddle.emoji} ({riddle.name})")
-    
+        cli_logger.error(f"Error: Number of unique emojis ({num_unique_emojis}) is less than the number of game modes ({num_modes}).")
+        return
+
+    last_day_by_mode = dict(
+        db.session.query(Riddle.game_mode, func.max(Riddle.day_number)).group_by(Riddle.game_mode).all()
+    )
+    if not last_day_by_mode:
+        cli_logger.info("No riddles scheduled yet, run 'flask main init-db' first.")
+        return
+
+    today = current_day_number()
+    first_day_by_mode = {
+        mode: last_day_by_mode[mode] + 1 if mode in last_day_by_mode else today
+        for mode in AVAILABLE_MODES
+    }
+    first_day = min(first_day_by_mode.values())
+    end_day = max(last_day_by_mode.values()) + days # Inclusive
+    if end_day < first_day:
+        cli_logger.info("Nothing to add.")
+        return
+
+    # Emojis stored rows already use in the new range (only modes that were behind have any)
+    taken_by_day = {}
+    existing = db.session.query(Riddle.day_number, Riddle.emoji).filter(Riddle.day_number.between(first_day, end_day))
+    for day_number, emoji in existing:
+        taken_by_day.setdefault(day_number, set()).add(emoji)
+    for day_number in range(first_day, end_day + 1):
+        taken_by_day.setdefault(day_number, set())
+
+    seed = current_app.config['SCHEDULE_SEED']
+    rows = list(schedule_rows(catalog, AVAILABLE_MODES, seed, range(first_day, end_day + 1),
+                              first_day_by_mode=first_day_by_mode, taken_by_day=taken_by_day))
+    if not rows:
+        cli_logger.info("Nothing to add.")
+        return
+
+    # Tables filled by the old init-db have autoincrement ids that may overlap scheduled ids;
+    # let the database pick ids then
+    new_ids = {row['id'] for row in rows}
+    used_ids = db.session.query(Riddle.id).filter(Riddle.id.between(min(new_ids), max(new_ids)))
+    if any(riddle_id in new_ids for (riddle_id,) in used_ids):
+        cli_logger.info("Existing riddle ids overlap the scheduled ids, letting the database assign ids.")
+        for row in rows:
+            del row['id']
+
     try:
+        db.session.execute(insert(Riddle), rows)
         db.session.commit()
-        print(f"Successfully committed riddles for {num_unique_emojis} day_numbers to the database.")
     except Exception as e:
         db.session.rollback()
-        print(f"Error committing riddles: {e}")
\ No newline at end of file
+        cli_logger.error(f"Error committing riddles: {e}")
+        return
+
+    cli_logger.info(f"Added {len(rows)} riddles for day_numbers {first_day}-{end_day}.")
+    for mode in AVAILABLE_MODES:
+        cli_logger.info(f"  {mode}: from day_number {first_day_by_mode[mode]}")
+
+@main.cli.command("check-catalog")
+def check_catalog_command():
+    """
+    Reports problems in the emoji catalog (app/data/emojis.jsonl):
+    - entries left out because their emoji or name is already in the catalog
+    - emojis / names / categories too long for the Riddle columns
+    - names without a single letter to guess
+    Exits with status 1 if anything was found.
+    """
+    catalog = get_catalog()
+    problems = 0
+    for duplicate in catalog.duplicates:
+        kept = catalog[duplicate.kept_index]
+        cli_logger.error(f"Duplicate {duplicate.reason}: line {duplicate.source_index + 1} {duplicate.entry['emoji']} '{duplicate.entry['name']}'"
+                         f" (same as {kept['emoji']} '{kept['name']}')")
+        problems += 1
+
+    columns = Riddle.__table__.c
+    for index, entry in enumerate(catalog):
+        for field in ('emoji', 'name', 'category'):
+            if len(entry[field]) > columns[field].type.length:
+                cli_logger.error(f"Too long {field}: {entry['emoji']} '{entry['name']}' ({len(entry[field])} > {columns[field].type.length})")
+                problems += 1
+        if not any(letter_bit(char.lower()) for char in entry['name']):
+            cli_logger.error(f"Nothing to guess: {entry['emoji']} '{entry['name']}'")
+            problems += 1
+
+    cli_logger.info(f"{len(catalog)} emojis in {len(catalog.categories)} categories:")
+    for category in catalog.categories:
+        cli_logger.info(f"  {category}: {len(catalog.indexes_in_category(category))}")
+    if problems:
+        cli_logger.info(f"{problems} problem(s) found.")
+        raise SystemExit(1)
+    cli_logger.info("No problems found.")
+
+@main.cli.command("import-emoji-test")
+@click.argument('emoji_test_path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--catalog', 'catalog_path', type=click.Path(dir_okay=False), default=DEFAULT_CATALOG_PATH, show_default=True, help='Catalog file to append to.')
+@click.option('--skin-tones/--no-skin-tones', default=False, show_default=True, help='Also import the skin tone variants.')
+@click.option('--batch-size', type=int, default=500, show_default=True, help='Entries written per batch.')
+@click.option('--dry-run', is_flag=True, help='Only report what would be added.')
+def import_emoji_test_command(emoji_test_path, catalog_path, skin_tones, batch_size, dry_run):
+    """
+    Appends the emojis of a local copy of Unicode's emoji-test.txt that aren't in the
+    catalog yet (see catalog_import.py). Existing entries are never changed, so the
+    schedule of days already materialized stays the same.
+    """
+    started = time.perf_counter()
+    catalog = EmojiCatalog.load(catalog_path) if os.path.exists(catalog_path) else EmojiCatalog.from_entries([])
+    columns = Riddle.__table__.c
+
+    with open(emoji_test_path, encoding='utf-8') as lines:
+        if dry_run:
+            output = open(os.devnull, 'w', encoding='utf-8')
+        else:
+            _ensure_trailing_newline(catalog_path)
+            output = open(catalog_path, 'a', encoding='utf-8', newline='\n')
+        with output:
+            counts = import_emoji_test(lines, catalog, output,
+                                       max_emoji_length=columns.emoji.type.length, max_name_length=columns.name.type.length,
+                                       include_skin_tones=skin_tones, batch_size=batch_size)
+
+    if not dry_run and os.path.abspath(catalog_path) == os.path.abspath(DEFAULT_CATALOG_PATH):
+        reset_catalog()
+    cli_logger.info(f"{'Would add' if dry_run else 'Added'} {counts['added']} emojis ({len(catalog) + counts['added']} in the catalog) in {time.perf_counter() - started:.2f}s.")
+    cli_logger.info(f"  skipped: {counts['existing']} already in the catalog, {counts['too_long']} too long, {counts['unusable_name']} without a usable name")
+
+
+def _ensure_trailing_newline(path):
+    """So appended lines don't get glued onto the last entry."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, 'rb+') as f:
+        f.seek(-1, os.SEEK_END)
+        if f.read(1) != b'\n':
+            f.write(b'\n')
+
+@main.cli.command("render-pixelated")
+@click.option('--days', type=int, default=7, show_default=True, help='How many days to render, starting today.')
+def render_pixelated_command(days):
+    """Fills the pixelation image cache (see pixelation.py) for the coming days' Pixelated riddles."""
+    if not pixelator.available:
+        cli_logger.error("Server-side pixelation is unavailable (needs Pillow and a color emoji font, see PIXELATED_EMOJI_FONT).")
+        raise SystemExit(1)
+    started = time.perf_counter()
+    today_number = current_day_number()
+    rendered = 0
+    for day_number in range(today_number, today_number + days):
+        riddle = riddle_repository.get_for_day('Pixelated', day_number)
+        if riddle is None:
+            cli_logger.info(f"  day {day_number}: no Pixelated riddle")
+            continue
+        pixelator.render_levels(riddle.emoji)
+        rendered += 1
+    cli_logger.info(f"Rendered {rendered} riddles x {len(LEVEL_SIZES)} levels to {pixelator.cache_dir} in {time.perf_counter() - started:.2f}s.")
+
+@main.cli.command("build-assets")
+def build_assets_command():
+    """
+    Writes the minified, content-hashed CSS/JS bundles (and their .gz / .br variants) to
+    app/static/dist, see assets.py. Run it on every deploy; until it's run (or when the
+    sources changed since), the pages link the source files instead.
+    """
+    started = time.perf_counter()
+    manifest = build_assets(current_app.static_folder)
+    assets.load()
+    for name, filename in sorted(manifest['files'].items()):
+        sizes = manifest['sizes'][name]
+        compressed = ', '.join(f"{suffix} {sizes[suffix]} B" for suffix in ('.br', '.gz') if suffix in sizes)
+        cli_logger.info(f"  {filename}: {sizes['source']} B of sources -> {sizes['minified']} B minified ({compressed})")
+    cli_logger.info(f"Built {len(manifest['files'])} bundles in {time.perf_counter() - started:.2f}s.")
@@ -0,0 +1,110 @@
+"""
+Deterministic riddle schedule.
+
+Which emoji a mode shows on a day is a pure function of (mode, day_number, seed) and
+the catalog size, so it can be computed without touching the database:
+
+- Days are grouped in cycles of `catalog_size` days. Every cycle has its own seeded
+  permutation of the catalog, so each mode shows every emoji exactly once per cycle and
+  the order changes from one cycle to the next.
+- Mode i reads that permutation starting at offset i * (catalog_size // number_of_modes).
+  The offsets are distinct, so on any given day every mode gets a different emoji
+  (as long as the catalog has at least as many entries as there are modes).
+
+Riddle ids are derived from the slot as well (see scheduled_riddle_id), so a riddle
+computed here and the same riddle materialized in the Riddle table share their id.
+
+Changing the seed or the catalog size changes the whole schedule; materialize it
+with `flask main init-db` to freeze it.
+"""
+import random
+from array import array
+from functools import lru_cache
+
+# Riddle ids are day_number * SCHEDULE_ID_STRIDE + mode_index + 1, leaving room for new modes
+SCHEDULE_ID_STRIDE = 64
+
+
+@lru_cache(maxsize=32)
+def cycle_permutation(seed, catalog_size, cycle):
+    """Seeded permutation of range(catalog_size) used during the given cycle."""
+    rng = random.Random(f'{seed}:{catalog_size}:{cycle}')
+    order = list(range(catalog_size))
+    rng.shuffle(order)
+    return array('I', order)
+
+
+def mode_offsets(num_modes, catalog_size):
+    if catalog_size < num_modes:
+        raise ValueError(f'The catalog needs at least {num_modes} emojis to give {num_modes} modes different emojis every day, it has {catalog_size}.')
+    spacing = catalog_size // num_modes
+    return [mode_index * spacing for mode_index in range(num_modes)]
+
+
+def emoji_index(mode_index, day_number, seed, catalog_size, num_modes):
+    """Index into the catalog of the emoji mode `mode_index` shows on `day_number`."""
+    cycle, day_in_cycle = divmod(day_number, catalog_size)
+    permutation = cycle_permutation(seed, catalog_size, cycle)
+    offset = mode_offsets(num_modes, catalog_size)[mode_index]
+    return permutation[(day_in_cycle + offset) % catalog_size]
+
+
+def day_assignments(day_number, seed, catalog_size, num_modes):
+    """Catalog index for every mode on one day (all different)."""
+    cycle, day_in_cycle = divmod(day_number, catalog_size)
+    permutation = cycle_permutation(seed, catalog_size, cycle)
+    return [permutation[(day_in_cycle + offset) % catalog_size] for offset in mode_offsets(num_modes, catalog_size)]
+
+
+def scheduled_riddle_id(mode_index, day_number):
+    return day_number * SCHEDULE_ID_STRIDE + mode_index + 1
+
+
+def slot_for_riddle_id(riddle_id):
+    """(mode_index, day_number) a scheduled riddle id stands for."""
+    day_number, mode_index = divmod(riddle_id - 1, SCHEDULE_ID_STRIDE)
+    return mode_index, day_number
+
+
+def schedule_rows(entries, modes, seed, day_numbers, first_day_by_mode=None, taken_by_day=None):
+    """
+    Riddle rows (dicts ready for a bulk insert) for the given days and all modes.
+
+    `entries` is the emoji catalog (dicts with emoji / name / category). The rows carry
+    their scheduled id, so they match what the scheduler serves for the same slot.
+
+    When extending an existing schedule, `first_day_by_mode` skips the days a mode already
+    has, and `taken_by_day` ({day_number: set of emojis}) lists emojis already used on a
+    day by stored rows. A scheduled emoji that is taken is replaced by the next free one
+    in the cycle's permutation, so modes still never share an emoji on the same day.
+    """
+    catalog_size = len(entries)
+    num_modes = len(modes)
+    offsets = mode_offsets(num_modes, catalog_size)
+    first_day_by_mode = first_day_by_mode or {}
+    taken_by_day = taken_by_day if taken_by_day is not None else {}
+    for day_number in day_numbers:
+        cycle, day_in_cycle = divmod(day_number, catalog_size)
+        permutation = cycle_permutation(seed, catalog_size, cycle)
+        taken = taken_by_day.get(day_number)
+        for mode_index, mode in enumerate(modes):
+            if day_number < first_day_by_mode.get(mode, day_number):
+                continue
+            position = day_in_cycle + offsets[mode_index]
+            entry = entries[permutation[position % catalog_size]]
+            if taken is not None:
+                probes = 0
+                while entry['emoji'] in taken:
+                    probes += 1
+                    if probes >= catalog_size:
+                        raise ValueError(f'No free emoji left for {mode} on day {day_number}.')
+                    entry = entries[permutation[(position + probes) % catalog_size]]
+                taken.add(entry['emoji'])
+            yield {
+                'id': scheduled_riddle_id(mode_index, day_number),
+                'emoji': entry['emoji'],
+                'name': entry['name'],
+                'category': entry['category'],
+                'day_number': day_number,
+                'game_mode': mode,
+            }
@@ -0,0 +1,232 @@
+"""
+Compact binary encoding for the Flask cookie session.
+
+The default session serializer writes game state as tagged JSON, so every guessed
+letter, mode name and ISO date is spelled out in the cookie. This serializer packs the
+keys the game uses into a few bytes instead:
+
+- player_uuid          -> 16 raw bytes
+- active_state_mode    -> index into AVAILABLE_MODES
+- active_state_date_iso -> day number relative to EPOCH_DATE
+- game_states_by_day_mode -> one record per (day, mode): day number, mode index, riddle
+  id, a byte with the guess count and the game_over / is_win flags, then one byte per
+  guess (the letter's index, 0 = 'a'), in the order they were played.
+
+Only the last `window_days` days of game states are kept. Anything it can't pack (flash
+messages, unknown modes, ...) is stored as tagged JSON after the packed part. The body
+is zlib-compressed when that makes it smaller. Cookies written by the old JSON
+serializer (they start with '{') are still accepted.
+"""
+import struct
+import uuid
+import zlib
+from datetime import date, timedelta
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSessionInterface
+from itsdangerous import URLSafeTimedSerializer
+
+from .answer_profile import LETTER_BITS
+from .days import day_number_for, utc_today, EPOCH_DATE
+
+FORMAT_VERSION = 1
+FLAG_COMPRESSED = 0x01
+
+HAS_UUID = 0x01
+HAS_ACTIVE_MODE = 0x02
+HAS_ACTIVE_DATE = 0x04
+HAS_EXTRA = 0x08
+
+GAME_OVER_FLAG = 0x40
+IS_WIN_FLAG = 0x80
+GUESS_COUNT_MASK = 0x3F
+
+_LETTERS = sorted(LETTER_BITS)
+_LETTER_INDEXES = {letter: index for index, letter in enumerate(_LETTERS)}
+
+_HEADER = struct.Struct('>BB') # version, flags
+_STATE = struct.Struct('>hBIB') # day number, mode index, riddle id, guess count | flags; then the guesses
+
+
+class CompactSessionSerializer:
+    def __init__(self, modes, window_days=3):
+        self.modes = list(modes)
+        self.mode_indexes = {mode: index for index, mode in enumerate(self.modes)}
+        self.window_days = window_days
+        self.json = TaggedJSONSerializer()
+
+    # --- Encoding ---
+
+    def dumps(self, value):
+        extra = dict(value)
+        fields = 0
+        parts = []
+
+        packed_uuid = self._pack_uuid(extra.get('player_uuid'))
+        if packed_uuid is not None:
+            fields |= HAS_UUID
+            parts.append(packed_uuid)
+            del extra['player_uuid']
+
+        mode_index = self.mode_indexes.get(extra.get('active_state_mode'))
+        if mode_index is not None:
+            fields |= HAS_ACTIVE_MODE
+            parts.append(struct.pack('>B', mode_index))
+            del extra['active_state_mode']
+
+        active_day = self._pack_day(extra.get('active_state_date_iso'))
+        if active_day is not None:
+            fields |= HAS_ACTIVE_DATE
+            parts.append(struct.pack('>h', active_day))
+            del extra['active_state_date_iso']
+
+        records, leftover_states = self._pack_states(extra.pop('game_states_by_day_mode', None))
+        if leftover_states:
+            extra['game_states_by_day_mode'] = leftover_states
+        parts.append(struct.pack('>B', len(records)))
+        parts.extend(records)
+
+        if extra:
+            fields |= HAS_EXTRA
+            parts.append(self.json.dumps(extra).encode('utf-8'))
+
+        body = struct.pack('>B', fields) + b''.join(parts)
+        flags = 0
+        compressed = zlib.compress(body, 9)
+        if len(compressed) < len(body):
+            body = compressed
+            flags |= FLAG_COMPRESSED
+        return _HEADER.pack(FORMAT_VERSION, flags) + body
+
+    def _pack_uuid(self, player_uuid):
+        if not isinstance(player_uuid, str):
+            return None
+        try:
+            parsed = uuid.UUID(player_uuid)
+        except ValueError:
+            return None
+        return parsed.bytes if str(parsed) == player_uuid else None
+
+    def _pack_day(self, date_iso):
+        if not isinstance(date_iso, str):
+            return None
+        try:
+            day_number = day_number_for(date.fromisoformat(date_iso))
+        except ValueError:
+            return None
+        return day_number if -32768 <= day_number <= 32767 else None
+
+    def _pack_states(self, states_by_day):
+        """Packed records for the recent states plus whatever couldn't be packed."""
+        if not states_by_day:
+            return [], {}
+        oldest_day = day_number_for(utc_today()) - (self.window_days - 1)
+        records = []
+        leftover = {}
+        for date_iso, states_by_mode in states_by_day.items():
+            day_number = self._pack_day(date_iso)
+            if day_number is not None and day_number < oldest_day:
+                continue # Outside the history window, drop it
+            for mode, state in states_by_mode.items():
+                record = self._pack_state(day_number, mode, state)
+                if record is None:
+                    leftover.setdefault(date_iso, {})[mode] = state
+                else:
+                    records.append(record)
+        if len(records) > 255:
+            records = records[-255:]
+        return records, leftover
+
+    def _pack_state(self, day_number, mode, state):
+        mode_index = self.mode_indexes.get(mode)
+        riddle_id = state.get('riddle_id')
+        guesses = state.get('guesses', [])
+        if (day_number is None or mode_index is None or not isinstance(riddle_id, int)
+                or not 0 <= riddle_id <= 0xFFFFFFFF or len(guesses) > len(_LETTERS)
+                or any(g not in _LETTER_INDEXES for g in guesses)):
+            return None
+        flags = len(guesses)
+        if state.get('game_over'):
+            flags |= GAME_OVER_FLAG
+        if state.get('is_win'):
+            flags |= IS_WIN_FLAG
+        return _STATE.pack(day_number, mode_index, riddle_id, flags) + bytes(_LETTER_INDEXES[g] for g in guesses)
+
+    # --- Decoding ---
+
+    def loads(self, value):
+        if value[:1] == b'{':
+            return self.json.loads(value.decode('utf-8')) # Cookie from the JSON serializer
+        version, flags = _HEADER.unpack_from(value)
+        if version != FORMAT_VERSION:
+            raise ValueError(f'Unknown session format version {version}')
+        body = value[_HEADER.size:]
+        if flags & FLAG_COMPRESSED:
+            body = zlib.decompress(body)
+
+        fields = body[0]
+        offset = 1
+        session_data = {}
+        if fields & HAS_UUID:
+            session_data['player_uuid'] = str(uuid.UUID(bytes=body[offset:offset + 16]))
+            offset += 16
+        if fields & HAS_ACTIVE_MODE:
+            session_data['active_state_mode'] = self.modes[body[offset]]
+            offset += 1
+        if fields & HAS_ACTIVE_DATE:
+            (day_number,) = struct.unpack_from('>h', body, offset)
+            session_data['active_state_date_iso'] = (EPOCH_DATE + timedelta(days=day_number)).isoformat()
+            offset += 2
+
+        record_count = body[offset]
+        offset += 1
+        states_by_day = {}
+        date_isos = {}
+        for _ in range(record_count):
+            day_number, mode_index, riddle_id, flags = _STATE.unpack_from(body, offset)
+            offset += _STATE.size
+            guess_count = flags & GUESS_COUNT_MASK
+            guesses = [_LETTERS[index] for index in body[offset:offset + guess_count]]
+            offset += guess_count
+            date_iso = date_isos.get(day_number)
+            if date_iso is None:
+                date_iso = date_isos[day_number] = (EPOCH_DATE + timedelta(days=day_number)).isoformat()
+            states_by_day.setdefault(date_iso, {})[self.modes[mode_index]] = {
+                'riddle_id': riddle_id,
+                'guesses': guesses,
+                'game_over': bool(flags & GAME_OVER_FLAG),
+                'is_win': bool(flags & IS_WIN_FLAG),
+            }
+
+        if fields & HAS_EXTRA:
+            extra = self.json.loads(body[offset:].decode('utf-8'))
+            for date_iso, states_by_mode in extra.pop('game_states_by_day_mode', {}).items():
+                states_by_day.setdefault(date_iso, {}).update(states_by_mode)
+            session_data.update(extra)
+        if states_by_day:
+            session_data['game_states_by_day_mode'] = states_by_day
+        return session_data
+
+
+class _TextURLSafeTimedSerializer(URLSafeTimedSerializer):
+    """
+    itsdangerous returns bytes for a binary payload serializer, but the signed value is
+    URL-safe base64 either way, and the cookie value has to be a str.
+    """
+
+    def dumps(self, obj, salt=None):
+        value = super().dumps(obj, salt)
+        return value.decode('ascii') if isinstance(value, bytes) else value
+
+
+class CompactSessionInterface(SecureCookieSessionInterface):
+    """Signed cookie session that uses CompactSessionSerializer."""
+
+    def __init__(self, modes, window_days=3):
+        self.serializer = CompactSessionSerializer(modes, window_days=window_days)
+
+    def get_signing_serializer(self, app):
+        if not app.secret_key:
+            return None
+        signer_kwargs = dict(key_derivation=self.key_derivation, digest_method=self.digest_method)
+        return _TextURLSafeTimedSerializer(app.secret_key, salt=self.salt, serializer=self.serializer, signer_kwargs=signer_kwargs)
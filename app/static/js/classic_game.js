@@ -16,10 +16,11 @@ const initialRiddleId = gameConfig.initialRiddleId;
 // const makeGuessUrl = gameConfig.makeGuessUrl; // url_for('main.make_guess') from gameConfig
 
 let currentEmojiCharacter = ''; // To store the fetched emoji
+// The page itself is the same for every player (and may come from a cache); the player's
+// guesses and stats are loaded from gameConfig.stateUrl. Guesses wait until that's done.
+let playerState = null;
 
 document.addEventListener('DOMContentLoaded', () => {
-    const darkModeToggle = document.getElementById('darkModeToggle');
-    const body = document.body;
     const timerDisplayElement = document.getElementById('timerDisplay');
     const countdownContainer = document.getElementById('countdownTimer');
     const shareSection = document.getElementById('share-section');
@@ -28,15 +29,6 @@ document.addEventListener('DOMContentLoaded', () => {
     const shareStatsButton = document.getElementById('shareStatsButton');
     const copyStatsFeedback = document.getElementById('copyStatsFeedback');
 
-    if (isGameOverOnLoad && shareButton) {
-        console.log("Setting share button data on page load.");
-        shareButton.dataset.dayNumber = dayNumberOnLoad;
-        const attemptsOnLoad = incorrectGuessesOnLoad + (isWinOnLoad ? 1 : 0);
-        shareButton.dataset.attempts = attemptsOnLoad;
-        shareButton.dataset.maxGuesses = maxGuessesOnLoad;
-        shareButton.dataset.isWin = isWinOnLoad.toString(); // Ensure it's a string for dataset
-    }
-
     let timerInterval = null;
 
     function updateCountdown() {
@@ -69,31 +61,14 @@ document.addEventListener('DOMContentLoaded', () => {
         if(countdownContainer) countdownContainer.style.display = 'none';
     }
 
-    const applyTheme = (theme) => {
-        if (theme === 'dark') {
-            body.classList.add('dark-mode');
-            darkModeToggle.textContent = '☀️';
-        } else {
-            body.classList.remove('dark-mode');
-            darkModeToggle.textContent = '🌙';
-        }
-    };
-    const savedTheme = localStorage.getItem('theme') || 'light';
-    applyTheme(savedTheme);
-
-    darkModeToggle.addEventListener('click', () => {
-        const currentTheme = body.classList.contains('dark-mode') ? 'dark' : 'light';
-        const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
-        localStorage.setItem('theme', newTheme);
-        applyTheme(newTheme);
-    });
-
     if (initialRiddleId) {
         fetchEmojiAndDisplay(initialRiddleId, incorrectGuessesOnLoad, gameConfig.initialGameMode, isGameOverOnLoad);
     } else {
         displayEmoji('', incorrectGuessesOnLoad, gameConfig.initialGameMode, true); // Pass true for isGameOver if no riddle
     }
 
+    loadPlayerState();
+
     document.addEventListener('keydown', (event) => {
         const key = event.key.toLowerCase();
         if (key.length === 1 && key >= 'a' && key <= 'z') {
@@ -115,17 +90,51 @@ document.addEventListener('DOMContentLoaded', () => {
         alphabetContainer.addEventListener('click', handleGuess);
     }
 
-    async function handleGuess(event) {
+    // Letters typed in quick succession are sent together: each click queues its letter,
+    // and the queue goes out as one {guesses: [...]} request GUESS_BATCH_DELAY_MS after the
+    // first letter, or as soon as the request in flight returns (the server applies them in
+    // order and ignores the ones after the game ends).
+    const GUESS_BATCH_DELAY_MS = 50;
+    let queuedLetters = [];
+    let flushTimer = null;
+    let guessInFlight = false;
+
+    function enableLetterButton(letter) {
+        const button = document.querySelector(`.letter-tile[data-letter="${letter}"]`);
+        if (button && !document.body.classList.contains('game-over-state')) {
+            button.disabled = false;
+            button.classList.remove('disabled');
+        }
+    }
+
+    function handleGuess(event) {
         if (!event.target.matches('.letter-tile:not(:disabled)')) {
             return;
         }
+        if (!playerState) {
+            return; // Still loading the player's game
+        }
         const button = event.target;
-        const letter = button.dataset.letter;
-        
+
         // Optimistically disable button
         button.disabled = true;
         button.classList.add('disabled');
 
+        queuedLetters.push(button.dataset.letter);
+        if (!guessInFlight && flushTimer === null) {
+            flushTimer = setTimeout(flushGuesses, GUESS_BATCH_DELAY_MS);
+        }
+    }
+
+    async function flushGuesses() {
+        flushTimer = null;
+        if (guessInFlight || queuedLetters.length === 0) {
+            return;
+        }
+        const letters = queuedLetters;
+        queuedLetters = [];
+        guessInFlight = true;
+
         try {
             const response = await fetch(gameConfig.makeGuessUrl, {
                 method: 'POST',
@@ -133,41 +142,48 @@ document.addEventListener('DOMContentLoaded', () => {
                     'Content-Type': 'application/json',
                     'Accept': 'application/json'
                 },
-                body: JSON.stringify({ guess: letter })
+                body: JSON.stringify({ guesses: letters, delta: true })
             });
             const data = await response.json();
 
-            if (!response.ok || !data.success) {
+            if (!response.ok || !data.results) {
                 console.error("Guess Error:", data.error || `HTTP error! status: ${response.status}`);
                 addFlashMessage(data.error || 'An error occurred.', 'danger');
-                // Re-enable button only if the error is not "already guessed" or "game over"
-                // and the game is not actually over according to server response (if available)
-                if (!(data.error?.toLowerCase().includes('already guessed')) &&
-                    !(data.error?.toLowerCase().includes('game is already over')) &&
-                    !(data.game_over)) {
-                    button.disabled = false;
-                    button.classList.remove('disabled');
+                if (!data.game_over) {
+                    letters.forEach(enableLetterButton);
                 }
                 return;
             }
 
-            // Call handleGuessResponse to update the UI with the server's data
-            handleGuessResponse(data);
+            // Re-enable the letters the server turned down, unless there's no point retrying them
+            const rejected = data.results.filter(result => result.error);
+            rejected.forEach(result => {
+                console.error("Guess Error:", result.letter, result.error);
+                if (!(result.error?.toLowerCase().includes('already guessed')) &&
+                    !(result.error?.toLowerCase().includes('game is already over')) &&
+                    !data.game_over) {
+                    enableLetterButton(result.letter);
+                }
+            });
+            if (!data.success) {
+                addFlashMessage(data.error || rejected[0]?.error || 'An error occurred.', 'danger');
+                return;
+            }
 
-            // The specific styling for the guessed letter button (e.g., adding 'correct' class)
-            // is handled within handleGuessResponse based on data.answer_display.
-            // So, no need to add button.classList.add('correct') here directly based on data.is_correct.
+            // Reveal the batch's letters on the tiles already shown (the response is a delta)
+            applyGuessDelta(data);
 
         } catch (error) {
             console.error('Fetch error:', error);
             addFlashMessage('A network error occurred. Please try again.', 'danger');
-            // Re-enable button on network error, if it's not part of guessed_letters already
-            // This needs careful consideration; for now, re-enable if not part of an ongoing game over sequence.
-            // A robust way would be to check if the letter is in `data.guessed_letters` if an error occurs after a successful response.
-            // For a simple network error before response, re-enabling is usually safe.
-            if (!document.body.classList.contains('game-over-state')) { // Assuming you add such a class on game over
-                 button.disabled = false;
-                 button.classList.remove('disabled');
+            // Nothing came back, so none of the letters can be assumed guessed
+            letters.forEach(enableLetterButton);
+        } finally {
+            guessInFlight = false;
+            if (document.body.classList.contains('game-over-state')) {
+                queuedLetters = []; // Typed while the last guess was ending the game
+            } else if (queuedLetters.length > 0) {
+                flushGuesses(); // Typed while this batch was in flight
             }
         }
     }
@@ -290,8 +306,14 @@ async function fetchEmojiAndDisplay(riddleId, incorrectGuesses, gameMode, isGame
         displayEmoji('', incorrectGuesses, gameMode, isGameOver);
         return;
     }
+    // Today's emoji comes with the page; other riddles are fetched (the response is cacheable)
+    if (riddleId === initialRiddleId && gameConfig.emoji) {
+        currentEmojiCharacter = gameConfig.emoji;
+        displayEmoji(currentEmojiCharacter, incorrectGuesses, gameMode, isGameOver);
+        return;
+    }
     try {
-        const response = await fetch(`/api/get-emoji/${riddleId}`);
+        const response = await fetch(riddleId === initialRiddleId && gameConfig.getEmojiUrl ? gameConfig.getEmojiUrl : `/api/get-emoji/${riddleId}`);
         if (!response.ok) {
             throw new Error(`Failed to fetch emoji: ${response.statusText}`);
         }
@@ -316,24 +338,49 @@ function displayEmoji(emojiChar, incorrectGuesses, gameMode, isGameOver) {
         console.error("Emoji display elements not found for Classic mode!");
         return;
     }
-    const displayChar = emojiChar || '❓';
-    textEmojiSpan.style.display = 'inline';
     emojiContainer.classList.add('classic-mode');
     emojiContainer.classList.remove('pixelated-mode');
-    textEmojiSpan.textContent = displayChar;
+    EmojiRenderer.showText(textEmojiSpan, emojiChar);
+}
+
+async function loadPlayerState() {
+    try {
+        const response = await fetch(gameConfig.stateUrl, { headers: { 'Accept': 'application/json' } });
+        if (!response.ok) {
+            throw new Error(`HTTP error! status: ${response.status}`);
+        }
+        applyState(await response.json());
+    } catch (error) {
+        console.error("Error loading game state:", error);
+        addFlashMessage('Could not load your game. Please refresh the page.', 'danger');
+    }
 }
 
-function handleGuessResponse(data) {
-    if (!data.success) {
-        console.error("Guess Error:", data.error);
-        // Optionally, display this error to the user using addFlashMessage
-        // addFlashMessage(data.error, 'danger'); 
+function applyState(state) {
+    playerState = state;
+    if (state.riddle_id !== gameConfig.initialRiddleId) {
+        // The page is from before midnight (or a stale cache), today's riddle is different
+        addFlashMessage('A new Emojile is available! Refresh the page.', 'info');
         return;
     }
+    renderAnswerTiles(state.answer_display);
+    markGuessedLetters(state.guessed_letters, state.answer_display);
+    updateIncorrectGuessesDisplay(state.incorrect_guesses);
+    if (state.game_over) {
+        showGameOver(state);
+    }
+    if (state.stats && state.stats.total_games > 0) {
+        updateStatsDisplay(state.stats);
+        const statsCard = document.getElementById('stats-card');
+        if (statsCard) {
+            statsCard.style.display = 'block';
+        }
+    }
+}
 
-    // 1. Update the Answer Tiles
+function renderAnswerTiles(answerDisplay) {
     const answerTiles = document.querySelectorAll('.answer-tile');
-    const newAnswerDisplayArray = data.answer_display.split('');
+    const newAnswerDisplayArray = answerDisplay.split('');
 
     answerTiles.forEach((tile, index) => {
         if (index < newAnswerDisplayArray.length) {
@@ -350,16 +397,16 @@ function handleGuessResponse(data) {
             }
         }
     });
+}
 
-    // 2. Update the Guessed Letters on the Keyboard
-    const guessedLetters = data.guessed_letters; 
+function markGuessedLetters(guessedLetters, answerDisplay) {
     guessedLetters.forEach(letter => {
         const letterTile = document.querySelector(`.letter-tile[data-letter="${letter.toLowerCase()}"]`);
         if (letterTile) {
             letterTile.classList.add('disabled');
             letterTile.disabled = true;
             // Style keyboard tile if letter is in the answer
-            if (data.answer_display.toLowerCase().includes(letter.toLowerCase())) {
+            if (answerDisplay.toLowerCase().includes(letter.toLowerCase())) {
                  letterTile.classList.add('correct');
             } else {
                 // Optionally, add an 'incorrect' class to style wrongly guessed letters on the keyboard
@@ -367,45 +414,76 @@ function handleGuessResponse(data) {
             }
         }
     });
+}
 
-    // 3. Update Guesses Left Display
-    const guessesLeftDisplay = document.getElementById('guesses-left-display');
-    if (guessesLeftDisplay && typeof gameConfig !== 'undefined' && gameConfig.MAX_GUESSES !== undefined) {
-        guessesLeftDisplay.textContent = `Guesses left: ${gameConfig.MAX_GUESSES - data.incorrect_guesses}`;
+function showGameOver(data) {
+    document.body.classList.add('game-over-state'); // Optional: for global styling/state checking
+    // Disable all alphabet tiles that are not already disabled
+    document.querySelectorAll('.letter-tile:not(.disabled)').forEach(tile => {
+        tile.disabled = true;
+        tile.classList.add('disabled');
+    });
+
+    const shareSection = document.getElementById('share-section');
+    if (shareSection) {
+        shareSection.style.display = 'block';
+        const shareButton = document.getElementById('shareButton');
+        if (shareButton && typeof gameConfig !== 'undefined') {
+            shareButton.dataset.dayNumber = gameConfig.dayNumberOnLoad;
+            shareButton.dataset.attempts = data.incorrect_guesses + (data.is_win ? 1 : 0);
+            shareButton.dataset.maxGuesses = gameConfig.MAX_GUESSES;
+            shareButton.dataset.isWin = data.is_win.toString();
+        }
     }
+}
 
-    // 4. Handle Game Over State
-    if (data.game_over) {
-        document.body.classList.add('game-over-state'); // Optional: for global styling/state checking
-        // Disable all alphabet tiles that are not already disabled
-        document.querySelectorAll('.letter-tile:not(.disabled)').forEach(tile => {
-            tile.disabled = true;
-            tile.classList.add('disabled');
+// Applies a compact /guess response ({delta: true}, see delta_guess_response in routes.py):
+// only the positions each letter revealed, the incorrect count, and the answer and stats when
+// the game ends. The rest of the page is already up to date.
+function applyGuessDelta(data) {
+    const answerTiles = document.querySelectorAll('.answer-tile');
+    data.results.forEach(result => {
+        if (result.error) {
+            return;
+        }
+        result.revealed.forEach(index => {
+            const tile = answerTiles[index];
+            if (tile) {
+                tile.textContent = result.letter.toUpperCase();
+                tile.classList.remove('space');
+            }
         });
-
-        const message = data.is_win ? 'Congratulations! You guessed it!' : 'Game over! Better luck next time.';
-        // Using addFlashMessage for consistency, or keep alert if preferred
-        addFlashMessage(message, data.is_win ? 'success' : 'warning');
-        addFlashMessage(`The answer was: ${data.answer_display.toUpperCase()}`, 'info');
-
-
-        const shareSection = document.getElementById('share-section');
-        if (shareSection) {
-            shareSection.style.display = 'block';
-            const shareButton = document.getElementById('shareButton');
-            if (shareButton && typeof gameConfig !== 'undefined') {
-                shareButton.dataset.dayNumber = gameConfig.dayNumberOnLoad;
-                shareButton.dataset.attempts = data.incorrect_guesses + (data.is_win ? 1 : 0);
-                shareButton.dataset.maxGuesses = gameConfig.MAX_GUESSES;
-                shareButton.dataset.isWin = data.is_win.toString();
+        const letterTile = document.querySelector(`.letter-tile[data-letter="${result.letter}"]`);
+        if (letterTile) {
+            letterTile.classList.add('disabled');
+            letterTile.disabled = true;
+            if (result.revealed.length > 0) {
+                letterTile.classList.add('correct');
             }
         }
-        if (data.stats) {
-            updateStatsDisplay(data.stats);
-            const statsCard = document.getElementById('stats-card');
-            if (statsCard) {
-                statsCard.style.display = 'block';
-            }
+    });
+
+    updateIncorrectGuessesDisplay(data.incorrect_guesses);
+
+    if (data.game_over) {
+        renderAnswerTiles(data.answer);
+        handleGameOver(data, data.answer);
+    }
+}
+
+function handleGameOver(data, answer) {
+    showGameOver(data);
+
+    const message = data.is_win ? 'Congratulations! You guessed it!' : 'Game over! Better luck next time.';
+    // Using addFlashMessage for consistency, or keep alert if preferred
+    addFlashMessage(message, data.is_win ? 'success' : 'warning');
+    addFlashMessage(`The answer was: ${answer.toUpperCase()}`, 'info');
+
+    if (data.stats) {
+        updateStatsDisplay(data.stats);
+        const statsCard = document.getElementById('stats-card');
+        if (statsCard) {
+            statsCard.style.display = 'block';
         }
     }
 }
@@ -0,0 +1,161 @@
+// Client-side emoji drawing shared by both game pages (bundled in front of classic_game.js
+// and pixelated_game.js, see app/assets.py).
+//
+// Pixelated mode without server-rendered images (see app/pixelation.py) pixelates the emoji
+// in the browser: the emoji is rasterized once per riddle into a SOURCE_SIZE square, each
+// level is downsampled from it once and kept as an ImageBitmap, so a guess only costs one
+// drawImage. The rasterizing runs in a Web Worker on an OffscreenCanvas when the browser
+// has both; the worker is this same file (the 'emoji_renderer.js' bundle), which is why
+// nothing below touches the DOM until EmojiRenderer is used on the page.
+const EmojiRenderer = (() => {
+    const SOURCE_SIZE = 256;
+    const CANVAS_SIZE = 128; // The full level, as drawn on the page
+    const EMOJI_SCALE = 0.82; // Font size relative to SOURCE_SIZE
+    const LEVEL_SIZES = [8, 16, 32]; // Per incorrect guess, then CANVAS_SIZE
+
+    // --- Rasterizing (page and worker) ---
+    function rasterizeSource(emoji, makeCanvas) {
+        const canvas = makeCanvas(SOURCE_SIZE);
+        const ctx = canvas.getContext('2d');
+        ctx.clearRect(0, 0, SOURCE_SIZE, SOURCE_SIZE);
+        ctx.font = `${SOURCE_SIZE * EMOJI_SCALE}px Arial`;
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'middle';
+        ctx.fillText(emoji, SOURCE_SIZE / 2, SOURCE_SIZE / 2);
+        return canvas;
+    }
+
+    function downsample(source, size, makeCanvas) {
+        const canvas = makeCanvas(size);
+        const ctx = canvas.getContext('2d');
+        ctx.imageSmoothingEnabled = false;
+        ctx.drawImage(source, 0, 0, SOURCE_SIZE, SOURCE_SIZE, 0, 0, size, size);
+        return canvas;
+    }
+
+    // Source rasters by emoji: one per riddle, every level is cut from it
+    const sources = new Map();
+    function sourceFor(emoji, makeCanvas) {
+        if (!sources.has(emoji)) {
+            sources.set(emoji, rasterizeSource(emoji, makeCanvas));
+        }
+        return sources.get(emoji);
+    }
+
+    const isWorker = typeof document === 'undefined' && typeof self !== 'undefined' && typeof self.postMessage === 'function';
+    if (isWorker) {
+        const makeOffscreen = (size) => new OffscreenCanvas(size, size);
+        self.onmessage = (event) => {
+            const { id, emoji, size } = event.data;
+            try {
+                const bitmap = downsample(sourceFor(emoji, makeOffscreen), size, makeOffscreen).transferToImageBitmap();
+                self.postMessage({ id, bitmap }, [bitmap]);
+            } catch (error) {
+                self.postMessage({ id, error: String(error) });
+            }
+        };
+        return null;
+    }
+
+    // --- Page side ---
+    let worker = null;
+    let nextRequestId = 1;
+    const pendingRequests = new Map(); // Request id -> { resolve, reject }
+    const levels = new Map(); // `${emoji}|${size}` -> Promise of an ImageBitmap / canvas
+    const latestDraw = new WeakMap(); // Canvas -> key of the last requested level
+
+    const makeCanvas = (size) => {
+        const canvas = document.createElement('canvas');
+        canvas.width = size;
+        canvas.height = size;
+        return canvas;
+    };
+
+    function startWorker(url) {
+        if (worker || !url || typeof Worker === 'undefined' || typeof OffscreenCanvas === 'undefined') {
+            return;
+        }
+        try {
+            worker = new Worker(url);
+        } catch (error) {
+            console.warn("Emoji worker unavailable, drawing on the main thread:", error);
+            worker = null;
+            return;
+        }
+        worker.onmessage = (event) => {
+            const request = pendingRequests.get(event.data.id);
+            pendingRequests.delete(event.data.id);
+            if (!request) {
+                return;
+            }
+            if (event.data.error) {
+                request.reject(new Error(event.data.error));
+            } else {
+                request.resolve(event.data.bitmap);
+            }
+        };
+        worker.onerror = (event) => {
+            console.warn("Emoji worker failed, drawing on the main thread:", event.message);
+            worker = null;
+            pendingRequests.forEach(request => request.reject(new Error('worker failed')));
+            pendingRequests.clear();
+        };
+    }
+
+    function renderInWorker(emoji, size) {
+        return new Promise((resolve, reject) => {
+            const id = nextRequestId++;
+            pendingRequests.set(id, { resolve, reject });
+            worker.postMessage({ id, emoji, size });
+        });
+    }
+
+    function renderOnMainThread(emoji, size) {
+        return downsample(sourceFor(emoji, makeCanvas), size, makeCanvas);
+    }
+
+    // The level as an ImageBitmap (worker) or canvas (main thread), rendered once per emoji and size
+    function renderLevel(emoji, size) {
+        const key = `${emoji}|${size}`;
+        if (!levels.has(key)) {
+            const rendered = worker
+                ? renderInWorker(emoji, size).catch(() => renderOnMainThread(emoji, size))
+                : Promise.resolve(renderOnMainThread(emoji, size));
+            levels.set(key, rendered);
+        }
+        return levels.get(key);
+    }
+
+    // Blocks per side for a player's game: coarser with fewer incorrect guesses, full when over
+    function levelSize(incorrectGuesses, isGameOver, maxGuesses) {
+        if (isGameOver || incorrectGuesses >= maxGuesses) {
+            return CANVAS_SIZE;
+        }
+        return LEVEL_SIZES[Math.min(Math.max(incorrectGuesses, 0), LEVEL_SIZES.length - 1)];
+    }
+
+    async function drawPixelated(canvas, emoji, size) {
+        const key = `${emoji}|${size}`;
+        latestDraw.set(canvas, key);
+        const level = await renderLevel(emoji, size);
+        if (latestDraw.get(canvas) !== key) {
+            return; // A later guess asked for another level meanwhile
+        }
+        if (canvas.width !== CANVAS_SIZE || canvas.height !== CANVAS_SIZE) {
+            canvas.width = CANVAS_SIZE;
+            canvas.height = CANVAS_SIZE;
+        }
+        const ctx = canvas.getContext('2d');
+        ctx.clearRect(0, 0, CANVAS_SIZE, CANVAS_SIZE);
+        ctx.imageSmoothingEnabled = false;
+        ctx.drawImage(level, 0, 0, size, size, 0, 0, CANVAS_SIZE, CANVAS_SIZE);
+    }
+
+    // Classic mode shows the emoji as text
+    function showText(element, emoji) {
+        element.style.display = 'inline';
+        element.textContent = emoji || '❓';
+    }
+
+    return { startWorker, levelSize, drawPixelated, showText, renderLevel };
+})();
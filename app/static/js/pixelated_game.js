@@ -0,0 +1,513 @@
+// Values the page used to get straight from Jinja are read from the game-config-data JSON
+// (the same one classic_game.js uses).
+const gameConfig = JSON.parse(document.getElementById('game-config-data').textContent);
+
+const MAX_GUESSES = gameConfig.MAX_GUESSES;
+let currentEmojiCharacter = ''; // To store the fetched emoji
+
+// This page is the same for every player (and may come from a cache): the player's
+// game is loaded from stateUrl, which fills playerState. Guesses wait until then.
+const dayNumberOnLoad = gameConfig.dayNumberOnLoad;
+const maxGuessesOnLoad = gameConfig.maxGuessesOnLoad; // This is same as MAX_GUESSES
+const nextMidnightISO = gameConfig.nextMidnightISO;
+const stateUrl = gameConfig.stateUrl;
+const initialRiddleId = gameConfig.initialRiddleId;
+const initialGameMode = gameConfig.initialGameMode; // Should be 'Pixelated'
+let playerState = null;
+
+if (!gameConfig.pixelatedImageUrls) {
+    EmojiRenderer.startWorker(gameConfig.pixelationWorkerUrl); // Pixelating in the browser
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    const timerDisplayElement = document.getElementById('timerDisplay');
+    const countdownContainer = document.getElementById('countdownTimer');
+    const shareSection = document.getElementById('share-section'); // Declare shareSection only once
+    const shareButton = document.getElementById('shareButton');
+    const copyFeedback = document.getElementById('copy-feedback');
+    const shareStatsButton = document.getElementById('shareStatsButton');
+    const copyStatsFeedback = document.getElementById('copyStatsFeedback');
+
+    // --- Countdown Timer Logic ---
+    let timerInterval = null;
+
+    function updateCountdown() {
+        if (!nextMidnightISO || nextMidnightISO === 'null' || !timerDisplayElement) {
+            if(countdownContainer) countdownContainer.style.display = 'none'; // Hide if no time
+            return; // Exit if no target time or element
+        }
+
+        const targetTime = new Date(nextMidnightISO).getTime();
+        const now = new Date().getTime();
+        const difference = targetTime - now;
+
+        if (difference <= 0) {
+            // Time is up or passed
+            timerDisplayElement.textContent = "Ready!";
+            if(countdownContainer) countdownContainer.innerHTML = "<strong>New Emojile available!</strong> Refresh the page.";
+            clearInterval(timerInterval); // Stop the timer
+        } else {
+            // Calculate hours, minutes, seconds
+            const hours = Math.floor((difference % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
+            const minutes = Math.floor((difference % (1000 * 60 * 60)) / (1000 * 60));
+            const seconds = Math.floor((difference % (1000 * 60)) / 1000);
+
+            // Format H:MM:SS
+            timerDisplayElement.textContent =
+                `${hours}:${minutes.toString().padStart(2, '0')}:${seconds.toString().padStart(2, '0')}`;
+
+            if(countdownContainer) countdownContainer.style.display = 'block'; // Ensure visible
+        }
+    }
+
+    // Initial call and set interval
+    if (nextMidnightISO && nextMidnightISO !== 'null') {
+         updateCountdown(); // Run once immediately
+         timerInterval = setInterval(updateCountdown, 1000); // Update every second
+    } else {
+         if(countdownContainer) countdownContainer.style.display = 'none'; // Hide if no time initially
+    }
+    // --- End Countdown Timer Logic ---
+
+
+    // --- NEW Emoji Fetch and Display Logic for Pixelated ---
+    if (!initialRiddleId) {
+        displayEmoji('', 0, initialGameMode, true);
+    } else {
+        // Drawn right away at the coarsest level; redrawn once the player's state is known
+        // (how pixelated it is depends on their incorrect guesses)
+        fetchEmojiAndDisplay(initialRiddleId, 0, initialGameMode, false);
+    }
+    loadPlayerState();
+    // --- End NEW Emoji Fetch ---
+
+    // --- Existing Keyboard Listener ---
+    document.addEventListener('keydown', (event) => {
+        const key = event.key.toLowerCase();
+        if (key.length === 1 && key >= 'a' && key <= 'z') {
+            const tile = document.getElementById(`tile-${key}`);
+            if (tile && !tile.classList.contains('disabled')) {
+                // Simulate click or directly navigate
+                window.location.href = tile.href;
+            }
+        }
+    });
+    // --- End Keyboard Listener ---
+
+    // --- NEW: AJAX Guess Handling ---
+    const alphabetContainer = document.querySelector('.alphabet-tiles');
+    const answerDisplayContainer = document.querySelector('.answer-display');
+    const guessesLeftDisplay = document.getElementById('guesses-left-display');
+    const statsCard = document.getElementById('stats-card');
+    const statsBody = document.getElementById('stats-body');
+    const flashContainer = document.querySelector('.container'); // Target container to add flash messages
+
+    // Use event delegation
+    if (alphabetContainer) {
+        alphabetContainer.addEventListener('click', handleGuess);
+    }
+
+    async function handleGuess(event) {
+        // Only act on letter tiles that are buttons and not disabled
+        if (!event.target.matches('.letter-tile:not(:disabled)')) {
+            return;
+        }
+
+        if (!playerState) {
+            return; // Still loading the player's game
+        }
+
+        const button = event.target;
+        const letter = button.dataset.letter;
+
+        // Disable button immediately for feedback
+        button.disabled = true;
+        button.classList.add('disabled');
+
+        try {
+            const response = await fetch(gameConfig.makeGuessUrl, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'Accept': 'application/json'
+                },
+                body: JSON.stringify({ guess: letter, delta: true }) // Compact response, see applyGuessDelta
+            });
+
+            const data = await response.json();
+
+            if (!response.ok || !data.success) {
+                console.error("Guess Error:", data.error || `HTTP error! status: ${response.status}`);
+                addFlashMessage(data.error || 'An error occurred.', 'danger');
+                if (data.error?.toLowerCase().indexOf('already guessed') === -1 && data.error?.toLowerCase().indexOf('game is already over') === -1) {
+                     button.disabled = false;
+                     button.classList.remove('disabled');
+                }
+                return;
+            }
+
+            // --- Success: Update UI ---
+
+            // 1. Reveal the letter where the server says it is (the response is a delta)
+            data.revealed.forEach(index => revealAnswerTile(index, data.letter));
+
+            // 2. Update Guesses Left
+            if(guessesLeftDisplay) {
+                guessesLeftDisplay.textContent = `Guesses left: ${ MAX_GUESSES - data.incorrect_guesses }`;
+            }
+
+            // 3. Style the guessed letter tile
+            if (data.revealed.length > 0) {
+                button.classList.add('correct');
+            }
+
+            // Update Pixelation
+            fetchEmojiAndDisplay(initialRiddleId, data.incorrect_guesses, initialGameMode, data.game_over);
+
+            // 4. Handle Game Over
+            if (data.game_over) {
+                disableAllLetterTiles();
+                renderAnswerTiles(data.answer); // The full answer only comes with the game over
+
+                const message = data.is_win ? 'Congratulations! You guessed it!' : 'Too many guesses! Better luck next time.';
+                const msgCategory = data.is_win ? 'success' : 'warning';
+                addFlashMessage(message, msgCategory);
+                addFlashMessage(`The answer was: ${data.answer.toUpperCase()}`, 'info');
+
+                if (data.stats) {
+                    updateStatsDisplay(data.stats);
+                    if (statsCard) statsCard.style.display = 'block';
+                }
+
+                showShareSection(data);
+            }
+
+        } catch (error) {
+            console.error('Fetch error:', error);
+            addFlashMessage('A network error occurred. Please try again.', 'danger');
+            button.disabled = false;
+            button.classList.remove('disabled');
+        }
+    }
+
+    // --- Player State (loaded after the page, see stateUrl) ---
+    async function loadPlayerState() {
+        try {
+            const response = await fetch(stateUrl, { headers: { 'Accept': 'application/json' } });
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            applyState(await response.json());
+        } catch (error) {
+            console.error('Error loading game state:', error);
+            addFlashMessage('Could not load your game. Please refresh the page.', 'danger');
+        }
+    }
+
+    function applyState(state) {
+        playerState = state;
+        if (state.riddle_id !== initialRiddleId) {
+            // The page is from before midnight (or a stale cache), today's riddle is different
+            addFlashMessage('A new Emojile is available! Refresh the page.', 'info');
+            return;
+        }
+        if (!initialRiddleId) {
+            return;
+        }
+        renderAnswerTiles(state.answer_display);
+        state.guessed_letters.forEach(letter => {
+            const tile = document.querySelector(`.letter-tile[data-letter="${letter}"]`);
+            if (tile) {
+                tile.disabled = true;
+                tile.classList.add('disabled');
+                if (state.answer_display.toLowerCase().includes(letter)) {
+                    tile.classList.add('correct');
+                }
+            }
+        });
+        if (guessesLeftDisplay) {
+            guessesLeftDisplay.textContent = `Guesses left: ${ MAX_GUESSES - state.incorrect_guesses }`;
+        }
+        if (state.game_over) {
+            disableAllLetterTiles();
+            showShareSection(state);
+        }
+        if (state.stats && state.stats.total_games > 0) {
+            updateStatsDisplay(state.stats);
+            if (statsCard) statsCard.style.display = 'block';
+        }
+        fetchEmojiAndDisplay(initialRiddleId, state.incorrect_guesses, initialGameMode, state.game_over);
+    }
+
+    function renderAnswerTiles(answerDisplay) {
+        answerDisplay.split('').forEach((char, index) => {
+            const tile = document.getElementById(`answer-char-${index}`);
+            if (tile) {
+                if (char === ' ') {
+                    tile.innerHTML = '&nbsp;';
+                    tile.classList.add('space');
+                    tile.classList.remove('revealed');
+                } else if (char === '_') {
+                    tile.innerHTML = '&nbsp;';
+                    tile.classList.remove('space');
+                    tile.classList.remove('revealed');
+                } else {
+                    tile.textContent = char.toUpperCase();
+                    tile.classList.remove('space');
+                    tile.classList.add('revealed');
+                }
+            }
+        });
+    }
+
+    function revealAnswerTile(index, letter) {
+        const tile = document.getElementById(`answer-char-${index}`);
+        if (tile) {
+            tile.textContent = letter.toUpperCase();
+            tile.classList.remove('space');
+            tile.classList.add('revealed');
+        }
+    }
+
+    function disableAllLetterTiles() {
+        if (alphabetContainer) {
+            alphabetContainer.querySelectorAll('.letter-tile:not(.disabled)').forEach(tile => {
+                tile.disabled = true;
+                tile.classList.add('disabled');
+            });
+        }
+    }
+
+    function showShareSection(data) {
+        if (shareSection) {
+            shareSection.style.display = 'block';
+            if(shareButton) {
+                shareButton.dataset.dayNumber = dayNumberOnLoad;
+                shareButton.dataset.attempts = data.incorrect_guesses + (data.is_win ? 1 : 0);
+                shareButton.dataset.maxGuesses = MAX_GUESSES;
+                shareButton.dataset.isWin = data.is_win;
+            }
+        }
+    }
+    // --- End Player State ---
+
+    // --- Share Button Logic ---
+    if (shareButton) {
+        shareButton.addEventListener('click', copyShareText);
+    }
+
+    function copyShareText() {
+        const dayNumber = shareButton.dataset.dayNumber;
+        const attempts = shareButton.dataset.attempts;
+        const maxGuesses = shareButton.dataset.maxGuesses;
+        const isWin = shareButton.dataset.isWin === 'true'; // Convert string back to boolean
+
+        // Basic text format (can be enhanced later with squares)
+        let shareText = `Emojile Day ${dayNumber}\n`;
+        if (isWin) {
+            shareText += `Guessed in ${attempts}/${maxGuesses} attempts! 🎉\n`;
+        } else {
+            shareText += `X/${maxGuesses} attempts 😥\n`;
+        }
+        shareText += `\n#emojile ${window.location.href}`; // Add hashtag and link
+
+        // Use Clipboard API
+        navigator.clipboard.writeText(shareText).then(() => {
+            // Success feedback
+            if (copyFeedback) {
+                copyFeedback.style.display = 'inline'; // Show "Copied!"
+                shareButton.disabled = true; // Temporarily disable button
+                setTimeout(() => {
+                    copyFeedback.style.display = 'none'; // Hide after 2 seconds
+                    shareButton.disabled = false; // Re-enable button
+                }, 2000);
+            }
+        }).catch(err => {
+            console.error('Failed to copy text: ', err);
+            addFlashMessage('Failed to copy score. Please try again.', 'danger');
+        });
+    }
+    // --- End Share Button Logic ---
+
+    // --- NEW: Share Stats Button Logic ---
+    if (shareStatsButton) {
+        shareStatsButton.addEventListener('click', copyOverallStats);
+    }
+
+    function copyOverallStats() {
+        // Read stats directly from the displayed elements
+        const totalGames = document.getElementById('stats-total-games')?.textContent || 'N/A';
+        const avgIncorrect = document.getElementById('stats-avg-incorrect')?.textContent || 'N/A';
+        const currentPlayStreak = document.getElementById('stats-current-play-streak')?.textContent || 'N/A';
+        const longestPlayStreak = document.getElementById('stats-longest-play-streak')?.textContent || 'N/A';
+        const currentCorrectStreak = document.getElementById('stats-current-correct-streak')?.textContent || 'N/A';
+        const longestCorrectStreak = document.getElementById('stats-longest-correct-streak')?.textContent || 'N/A';
+
+        // Construct the text
+        let statsText = `My Emojile Stats:\n`;
+        statsText += `Total Games: ${totalGames}\n`;
+        statsText += `Avg Incorrect Guesses: ${avgIncorrect}\n`;
+        statsText += `Current Play Streak: ${currentPlayStreak} 🔥\n`;
+        statsText += `Longest Play Streak: ${longestPlayStreak}\n`;
+        statsText += `Current Correct Streak: ${currentCorrectStreak} ✅\n`;
+        statsText += `Longest Correct Streak: ${longestCorrectStreak}\n`;
+        statsText += `\nPlay Emojile! ${window.location.href}`;
+
+        // Use Clipboard API
+        navigator.clipboard.writeText(statsText).then(() => {
+            // Success feedback
+            if (copyStatsFeedback) {
+                copyStatsFeedback.style.display = 'inline'; // Show "Copied!"
+                shareStatsButton.disabled = true; // Temporarily disable button
+                setTimeout(() => {
+                    copyStatsFeedback.style.display = 'none'; // Hide after 2 seconds
+                    shareStatsButton.disabled = false; // Re-enable button
+                }, 2000);
+            }
+        }).catch(err => {
+            console.error('Failed to copy stats text: ', err);
+            addFlashMessage('Failed to copy stats. Please try again.', 'danger');
+        });
+    }
+    // --- End Share Stats Button Logic ---
+
+    // Helper function to add flash messages dynamically
+    function addFlashMessage(message, category) {
+        const alertDiv = document.createElement('div');
+        alertDiv.className = `alert alert-${category} alert-dismissible fade show`;
+        alertDiv.setAttribute('role', 'alert');
+        alertDiv.innerHTML = `
+            ${message}
+            <button type="button" class="btn-close" data-bs-dismiss="alert" aria-label="Close"></button>
+        `;
+        // Insert after the countdown timer or H1
+        const referenceNode = document.getElementById('countdownTimer') || document.querySelector('h1');
+        if (referenceNode && referenceNode.parentNode) {
+             referenceNode.parentNode.insertBefore(alertDiv, referenceNode.nextSibling);
+        } else {
+             flashContainer.insertBefore(alertDiv, flashContainer.firstChild); // Fallback
+        }
+
+         // Auto-dismiss after a few seconds (optional)
+         setTimeout(() => {
+             const bootstrapAlert = bootstrap.Alert.getOrCreateInstance(alertDiv);
+             if (bootstrapAlert) {
+                 bootstrapAlert.close();
+             }
+         }, 7000); // 7 seconds
+    }
+
+    // Helper function to update stats display
+    function updateStatsDisplay(statsData) {
+        const fields = {
+            'stats-total-games': statsData.total_games,
+            'stats-avg-incorrect': statsData.avg_incorrect.toFixed(2),
+            'stats-current-play-streak': statsData.current_play_streak,
+            'stats-longest-play-streak': statsData.longest_play_streak,
+            'stats-current-correct-streak': statsData.current_correct_streak,
+            'stats-longest-correct-streak': statsData.longest_correct_streak,
+            'stats-last-played': statsData.last_played_datetime_str ? `Last game finished: ${statsData.last_played_datetime_str}` : ''
+        };
+        for (const id in fields) {
+            const element = document.getElementById(id);
+            if (element) {
+                element.textContent = fields[id];
+            }
+        }
+    }
+}); // End DOMContentLoaded
+
+async function fetchEmojiAndDisplay(riddleId, incorrectGuesses, gameMode, isGameOver) {
+    if (!riddleId) {
+        console.log("No riddle ID, clearing emoji display.");
+        displayEmoji('', incorrectGuesses, gameMode, isGameOver); // Clear display
+        return;
+    }
+
+    // Server-rendered levels: the emoji itself isn't sent until the game is over
+    if (riddleId === initialRiddleId && gameConfig.pixelatedImageUrls) {
+        displayPixelatedImage(gameConfig.pixelatedImageUrls[pixelationLevel(incorrectGuesses, isGameOver)]);
+        return;
+    }
+
+    // Today's emoji comes with the page; other riddles are fetched (the response is cacheable)
+    if (riddleId === initialRiddleId && gameConfig.emoji) {
+        currentEmojiCharacter = gameConfig.emoji;
+        displayEmoji(currentEmojiCharacter, incorrectGuesses, gameMode, isGameOver);
+        return;
+    }
+    try {
+        const response = await fetch(riddleId === initialRiddleId && gameConfig.getEmojiUrl ? gameConfig.getEmojiUrl : `/api/get-emoji/${riddleId}`);
+        if (!response.ok) {
+            throw new Error(`Failed to fetch emoji: ${response.statusText}`);
+        }
+        const data = await response.json();
+        if (data.emoji) {
+            currentEmojiCharacter = data.emoji;
+            displayEmoji(currentEmojiCharacter, incorrectGuesses, gameMode, isGameOver);
+        } else {
+            console.error("Emoji not found in API response for riddle ID:", riddleId);
+            displayEmoji('', incorrectGuesses, gameMode, isGameOver); // Clear display
+        }
+    } catch (error) {
+        console.error("Error fetching emoji:", error);
+        displayEmoji('', incorrectGuesses, gameMode, isGameOver); // Clear display on error
+    }
+}
+
+// Index into gameConfig.pixelatedImageUrls (8, 16, 32 blocks, then the full emoji); the
+// server allows the same levels (pixelation.level_for)
+function pixelationLevel(incorrectGuesses, isGameOver) {
+    if (isGameOver || incorrectGuesses >= MAX_GUESSES) {
+        return 3;
+    }
+    return Math.min(Math.max(incorrectGuesses, 0), 2);
+}
+
+let latestPixelatedUrl = null; // Only the last requested level is drawn, whichever loads first
+
+function displayPixelatedImage(url) {
+    latestPixelatedUrl = url;
+    const canvas = document.getElementById('pixelated-emoji-canvas');
+    const emojiContainer = document.getElementById('emoji-container');
+    if (!canvas || !emojiContainer) {
+        console.error("Required emoji display elements (canvas or container) not found for Pixelated mode!");
+        return;
+    }
+    const image = new Image();
+    image.onload = () => {
+        if (url !== latestPixelatedUrl) {
+            return;
+        }
+        const canvasSize = 128;
+        canvas.width = canvasSize;
+        canvas.height = canvasSize;
+        canvas.style.display = 'block';
+        emojiContainer.classList.add('pixelated-mode');
+        emojiContainer.classList.remove('classic-mode');
+        const ctx = canvas.getContext('2d');
+        ctx.clearRect(0, 0, canvasSize, canvasSize);
+        ctx.imageSmoothingEnabled = false; // Keep the blocks sharp
+        ctx.drawImage(image, 0, 0, canvasSize, canvasSize);
+    };
+    image.onerror = () => console.error("Error loading pixelated image:", url);
+    image.src = url;
+}
+
+function displayEmoji(emojiChar, incorrectGuesses, gameMode, isGameOver) {
+    const canvas = document.getElementById('pixelated-emoji-canvas');
+    const emojiContainer = document.getElementById('emoji-container');
+
+    if (!canvas || !emojiContainer) {
+        console.error("Required emoji display elements (canvas or container) not found for Pixelated mode!");
+        return;
+    }
+
+    canvas.style.display = 'block';
+    emojiContainer.classList.add('pixelated-mode');
+    emojiContainer.classList.remove('classic-mode');
+
+    // Rasterized and pixelated once per level (in a worker where possible), see emoji_renderer.js
+    const size = EmojiRenderer.levelSize(incorrectGuesses, isGameOver, MAX_GUESSES);
+    EmojiRenderer.drawPixelated(canvas, emojiChar || '❓', size);
+}
@@ -0,0 +1,28 @@
+// Dark mode toggle shared by every page (bundled in front of the page's own script, see
+// app/assets.py). The choice is kept in localStorage.
+document.addEventListener('DOMContentLoaded', () => {
+    const darkModeToggle = document.getElementById('darkModeToggle');
+    const body = document.body;
+    if (!darkModeToggle) {
+        return;
+    }
+
+    const applyTheme = (theme) => {
+        if (theme === 'dark') {
+            body.classList.add('dark-mode');
+            darkModeToggle.textContent = '☀️'; // Sun icon for light mode
+        } else {
+            body.classList.remove('dark-mode');
+            darkModeToggle.textContent = '🌙'; // Moon icon for dark mode
+        }
+    };
+    const savedTheme = localStorage.getItem('theme') || 'light';
+    applyTheme(savedTheme);
+
+    darkModeToggle.addEventListener('click', () => {
+        const currentTheme = body.classList.contains('dark-mode') ? 'dark' : 'light';
+        const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
+        localStorage.setItem('theme', newTheme);
+        applyTheme(newTheme);
+    });
+});
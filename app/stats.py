@@ -0,0 +1,323 @@
+"""
+Player statistics writes.
+
+A finished game is recorded with a single INSERT ... ON CONFLICT DO UPDATE ... RETURNING
+statement: the counters, both streaks and the longest-streak maximums are computed by
+the database from the existing row, so concurrent game-overs for the same
+(player_uuid, game_mode) can't lose increments and the caller gets the updated row back
+without a second query. Works on SQLite (3.35+) and PostgreSQL; other backends fall
+back to the read-modify-write ORM path.
+"""
+import atexit
+import logging
+import os
+import threading
+from collections import namedtuple
+from datetime import datetime, time, timedelta, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import and_, case, literal
+from sqlalchemy.dialects import postgresql, sqlite
+
+from . import db
+from .models import PlayerStats
+
+logger = logging.getLogger(__name__)
+
+_INSERT_BY_DIALECT = {
+    'sqlite': sqlite.insert,
+    'postgresql': postgresql.insert,
+}
+
+
+def stats_to_dict(player_stats):
+    """Stats dict used by the templates / JSON responses (works for ORM objects and result rows)."""
+    if player_stats is None:
+        return {
+            'total_games': 0,
+            'avg_incorrect': 0.0,
+            'current_play_streak': 0,
+            'longest_play_streak': 0,
+            'current_correct_streak': 0,
+            'longest_correct_streak': 0,
+            'last_played_datetime': None
+        }
+    avg_incorrect = (player_stats.total_incorrect / player_stats.total_games) if player_stats.total_games > 0 else 0.0
+    return {
+        'total_games': player_stats.total_games,
+        'avg_incorrect': avg_incorrect,
+        'current_play_streak': player_stats.current_play_streak,
+        'longest_play_streak': player_stats.longest_play_streak,
+        'current_correct_streak': player_stats.current_correct_streak,
+        'longest_correct_streak': player_stats.longest_correct_streak,
+        'last_played_datetime': player_stats.last_played_datetime
+    }
+
+
+def build_stats_upsert(insert, player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at):
+    """The INSERT ... ON CONFLICT DO UPDATE ... RETURNING statement for one finished game."""
+    stats = PlayerStats.__table__.c
+
+    # Play streak: +1 if the last game was the day before game_date, unchanged if it was on
+    # game_date itself, otherwise it starts again at 1. Compared as datetime ranges so the
+    # SQL is the same on every backend.
+    day_start = datetime.combine(game_date, time.min, tzinfo=timezone.utc)
+    played_day_before = and_(stats.last_played_datetime >= day_start - timedelta(days=1), stats.last_played_datetime < day_start)
+    played_same_day = and_(stats.last_played_datetime >= day_start, stats.last_played_datetime < day_start + timedelta(days=1))
+    new_play_streak = case(
+        (played_day_before, stats.current_play_streak + 1),
+        (played_same_day, stats.current_play_streak),
+        else_=literal(1),
+    )
+    new_correct_streak = stats.current_correct_streak + 1 if is_win else literal(0)
+
+    statement = insert(PlayerStats.__table__).values(
+        player_uuid=player_uuid,
+        game_mode=game_mode,
+        total_games=1,
+        total_incorrect=incorrect_guesses,
+        current_play_streak=1,
+        longest_play_streak=1,
+        current_correct_streak=1 if is_win else 0,
+        longest_correct_streak=1 if is_win else 0,
+        last_played_datetime=played_at,
+    )
+    new_values = statement.excluded # The row we tried to insert
+    statement = statement.on_conflict_do_update(
+        index_elements=[stats.player_uuid, stats.game_mode],
+        set_={
+            'total_games': stats.total_games + 1,
+            'total_incorrect': stats.total_incorrect + new_values.total_incorrect,
+            'current_play_streak': new_play_streak,
+            'longest_play_streak': case(
+                (new_play_streak > stats.longest_play_streak, new_play_streak),
+                else_=stats.longest_play_streak,
+            ),
+            'current_correct_streak': new_correct_streak,
+            'longest_correct_streak': case(
+                (new_correct_streak > stats.longest_correct_streak, new_correct_streak),
+                else_=stats.longest_correct_streak,
+            ),
+            'last_played_datetime': new_values.last_played_datetime,
+        },
+    )
+    return statement.returning(*PlayerStats.__table__.c)
+
+
+def upsert_player_stats(player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at=None):
+    """Record one finished game and return the updated stats row (not committed)."""
+    played_at = played_at or datetime.now(timezone.utc)
+    insert = _INSERT_BY_DIALECT.get(db.session.get_bind().dialect.name)
+    if insert is None:
+        return _update_player_stats_orm(player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at)
+    statement = build_stats_upsert(insert, player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at)
+    return db.session.execute(statement).one()
+
+
+def _update_player_stats_orm(player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at):
+    """Read-modify-write version of the upsert for databases without ON CONFLICT."""
+    player_stats = db.session.get(PlayerStats, (player_uuid, game_mode))
+    if not player_stats:
+        player_stats = PlayerStats(
+            player_uuid=player_uuid,
+            game_mode=game_mode,
+            total_games=0,
+            total_incorrect=0,
+            current_play_streak=0,
+            longest_play_streak=0,
+            current_correct_streak=0,
+            longest_correct_streak=0,
+            last_played_datetime=None
+        )
+        db.session.add(player_stats)
+
+    apply_game_result(player_stats, is_win, incorrect_guesses, game_date, played_at)
+    db.session.flush()
+    return player_stats
+
+
+def _as_utc(moment):
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc) # Stored naive, it's UTC
+    return moment
+
+
+def apply_game_result(player_stats, is_win, incorrect_guesses, game_date, played_at):
+    """Python version of the upsert's update: applies one finished game to player_stats in place."""
+    last_played_date = None
+    if player_stats.last_played_datetime:
+        last_played_date = _as_utc(player_stats.last_played_datetime).astimezone(timezone.utc).date()
+
+    player_stats.total_games += 1
+    player_stats.total_incorrect += incorrect_guesses
+
+    if last_played_date == game_date - timedelta(days=1):
+        player_stats.current_play_streak += 1
+    elif last_played_date != game_date:
+        player_stats.current_play_streak = 1
+    player_stats.longest_play_streak = max(player_stats.longest_play_streak, player_stats.current_play_streak)
+
+    if is_win:
+        player_stats.current_correct_streak += 1
+    else:
+        player_stats.current_correct_streak = 0
+    player_stats.longest_correct_streak = max(player_stats.longest_correct_streak, player_stats.current_correct_streak)
+
+    player_stats.last_played_datetime = played_at
+
+
+GameResult = namedtuple('GameResult', ['player_uuid', 'game_mode', 'is_win', 'incorrect_guesses', 'game_date', 'played_at'])
+
+
+class StatsWriteBehind:
+    """
+    Optional write-behind buffer for finished games (STATS_WRITE_BEHIND = True).
+
+    Instead of committing one transaction per game-over, results are queued in this
+    process and written by a background thread every STATS_FLUSH_INTERVAL_SECONDS, or
+    sooner once STATS_FLUSH_MAX_PENDING results are waiting, all in one transaction.
+    Whatever is left is flushed at interpreter exit. Reads merge the queued results on
+    top of the stored row (see merge_pending) so players see their stats right away.
+
+    A batch that fails is retried; after STATS_FLUSH_MAX_ATTEMPTS failed flushes in a row
+    the results are written one at a time and those that still fail are logged and
+    dropped, so one bad row can't keep the queue growing.
+    """
+
+    def __init__(self, flush_interval=2.0, max_pending=200, max_attempts=5):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.app = None
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {} # (player_uuid, game_mode) -> [GameResult, ...] in play order
+        self._pending_count = 0
+        self._flushing = {} # Results taken by the running flush, visible to reads until cleared
+        self._failed_flushes = 0
+        self._wake = threading.Event()
+        self._thread = None
+        self._thread_pid = None
+        self._atexit_registered = False
+
+    @property
+    def enabled(self):
+        return self.app is not None
+
+    def init_app(self, app):
+        if not app.config.get('STATS_WRITE_BEHIND'):
+            self.app = None
+            return
+        self.app = app
+        self.flush_interval = app.config.get('STATS_FLUSH_INTERVAL_SECONDS', self.flush_interval)
+        self.max_pending = app.config.get('STATS_FLUSH_MAX_PENDING', self.max_pending)
+        self.max_attempts = app.config.get('STATS_FLUSH_MAX_ATTEMPTS', self.max_attempts)
+        if not self._atexit_registered:
+            atexit.register(self.flush)
+            self._atexit_registered = True
+
+    def record(self, player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at=None):
+        result = GameResult(player_uuid, game_mode, is_win, incorrect_guesses, game_date, played_at or datetime.now(timezone.utc))
+        with self._lock:
+            self._pending.setdefault((player_uuid, game_mode), []).append(result)
+            self._pending_count += 1
+            full = self._pending_count >= self.max_pending
+        self._ensure_thread()
+        if full:
+            self._wake.set()
+
+    def merge_pending(self, player_uuid, game_mode, player_stats):
+        """player_stats (ORM object, row or None) with the queued results applied, None if there's nothing at all."""
+        key = (player_uuid, game_mode)
+        with self._lock:
+            flushing, pending = self._flushing.get(key, []), self._pending.get(key, [])
+        if flushing and player_stats is not None and player_stats.last_played_datetime is not None:
+            # The flush clears _flushing only after its commit: results the row was read with
+            # already have a played_at up to its last_played_datetime
+            last_played = _as_utc(player_stats.last_played_datetime)
+            flushing = [result for result in flushing if _as_utc(result.played_at) > last_played]
+        results = flushing + pending
+        if not results:
+            return player_stats
+        merged = SimpleNamespace(
+            total_games=0, total_incorrect=0, current_play_streak=0, longest_play_streak=0,
+            current_correct_streak=0, longest_correct_streak=0, last_played_datetime=None,
+        )
+        if player_stats is not None:
+            for field in vars(merged):
+                setattr(merged, field, getattr(player_stats, field))
+        for result in results:
+            apply_game_result(merged, result.is_win, result.incorrect_guesses, result.game_date, result.played_at)
+        return merged
+
+    def flush(self):
+        """Write all queued results in one transaction. Returns how many were written."""
+        if self.app is None:
+            return 0
+        with self._flush_lock:
+            with self._lock:
+                self._flushing, self._pending = self._pending, {}
+                self._pending_count = 0
+                batch = self._flushing
+            if not batch:
+                return 0
+            written = sum(len(results) for results in batch.values())
+            try:
+                with self.app.app_context():
+                    if self._failed_flushes >= self.max_attempts:
+                        written = self._write_one_by_one(batch)
+                    else:
+                        for results in batch.values():
+                            for result in results:
+                                upsert_player_stats(*result)
+                        db.session.commit() # Not under _lock: requests keep recording and reading meanwhile
+            except Exception:
+                self._failed_flushes += 1
+                logger.exception("StatsWriteBehind: flush failed, will retry",
+                                 extra={'pending': written, 'failed_flushes': self._failed_flushes})
+                with self._lock:
+                    # Put them back in front of anything queued meanwhile, order matters for streaks
+                    for key, results in batch.items():
+                        self._pending[key] = results + self._pending.get(key, [])
+                        self._pending_count += len(results)
+                    self._flushing = {}
+                return 0
+            self._failed_flushes = 0
+            with self._lock:
+                self._flushing = {}
+            logger.debug("StatsWriteBehind: flushed game results", extra={'written': written})
+            return written
+
+    def _write_one_by_one(self, batch):
+        """After repeated failures: commits each result on its own, logging and dropping the ones that fail."""
+        written = 0
+        for results in batch.values():
+            for result in results:
+                try:
+                    upsert_player_stats(*result)
+                    db.session.commit()
+                    written += 1
+                except Exception:
+                    db.session.rollback()
+                    logger.exception("StatsWriteBehind: dropping a game result that can't be written", extra=result._asdict())
+        return written
+
+    def _ensure_thread(self):
+        # Started lazily (and again after a fork) so every gunicorn worker gets its own flusher
+        if self._thread is not None and self._thread.is_alive() and self._thread_pid == os.getpid():
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive() and self._thread_pid == os.getpid():
+                return
+            self._thread = threading.Thread(target=self._run, name='stats-write-behind', daemon=True)
+            self._thread_pid = os.getpid()
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+stats_writer = StatsWriteBehind()
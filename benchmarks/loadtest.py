@@ -0,0 +1,362 @@
+"""
+Load test: simulated players playing today's game against the app.
+
+Usage: python benchmarks/loadtest.py [--target inprocess|http|both] [--players 2000]
+                                     [--concurrency 8] [--workers 4] [--url http://host:port]
+
+Each player has its own cookies and plays one game, like the browser does: GET /?mode=...,
+GET /api/state?mode=... (starts the game), the emoji (GET /api/get-emoji/<id>, or the first
+pixelation level in Pixelated mode when the server renders them), then POST /guess one
+letter at a time until the game is won or lost. Whether a player wins, and the order of its
+letters, comes from --seed, and the riddles come from a fresh SQLite database seeded with
+`init-db` (SCHEDULE_SEED), so two runs of the same commit send the same requests.
+
+'inprocess' drives create_app() through Flask's test client (no network, shows the app's
+own cost); 'http' starts gunicorn (--workers) on the same database and plays over
+HTTP/1.1 keep-alive connections, or plays against --url. For each endpoint it prints
+requests, requests/s, p50/p95/p99 latency, and SQL statements per request (from the app's
+own /metrics numbers, see app/metrics.py; over HTTP only with --workers 1, each worker
+counts its own). --json writes the same numbers to a file.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import string
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from app.days import current_day_number  # noqa: E402
+
+MODES = ['Classic', 'Pixelated']
+MAX_GUESSES = 3
+ENDPOINTS = ['main.index', 'main.get_state', 'main.get_emoji', 'main.pixelated_image', 'main.make_guess']
+GAME_CONFIG = re.compile(rb'<script id="game-config-data" type="application/json">(.*?)</script>', re.S)
+
+
+# --- Database ---
+
+def seed_database(path, seed):
+    """A fresh SQLite database with the riddles up to tomorrow, as 'flask main init-db' writes them."""
+    from app import create_app
+    app = create_app(bench_config(path, seed))
+    result = app.test_cli_runner().invoke(args=['main', 'init-db', '--days', str(current_day_number() + 2)])
+    if result.exit_code != 0:
+        raise SystemExit(f"init-db failed:\n{result.output}")
+
+
+def bench_config(path, seed):
+    from config import Config
+
+    class LoadTestConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        SECRET_KEY = 'loadtest'
+        DEPLOY_VERSION = 'loadtest'
+        SCHEDULE_SEED = seed
+        LOG_LEVEL = 'WARNING'
+    return LoadTestConfig
+
+
+def bench_environ(path, seed):
+    """The same settings for a gunicorn process (config.py reads them from the environment)."""
+    return dict(os.environ, DATABASE_URL=f'sqlite:///{path}', SECRET_KEY='loadtest', DEPLOY_VERSION='loadtest',
+                SCHEDULE_SEED=seed, LOG_LEVEL='WARNING')
+
+
+def answers_by_riddle(path):
+    """riddle id -> name for today's riddles, which is how the simulated players know what to guess."""
+    import sqlite3
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute('SELECT id, name FROM riddle WHERE day_number = ?', (current_day_number(),))
+        return dict(rows.fetchall())
+
+
+# --- Clients: get(path) / post_json(path, data) -> (status, body) ---
+
+class InProcessClient:
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def get(self, path):
+        response = self.client.get(path)
+        return response.status_code, response.data
+
+    def post_json(self, path, data):
+        response = self.client.post(path, json=data)
+        return response.status_code, response.data
+
+
+class HttpClient:
+    """One keep-alive connection and a cookie jar of one (the session cookie), like a browser tab."""
+
+    def __init__(self, base_url):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.connection = None
+        self.cookies = {}
+
+    def request(self, method, path, body=None, headers=None):
+        headers = dict(headers or {}, Host=f'{self.host}:{self.port}')
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in self.cookies.items())
+        for attempt in (1, 2):
+            if self.connection is None:
+                self.connection = http.client.HTTPConnection(self.host, self.port, timeout=30)
+            try:
+                self.connection.request(method, path, body=body, headers=headers)
+                response = self.connection.getresponse()
+                data = response.read()
+                break
+            except (http.client.HTTPException, ConnectionError):
+                self.connection.close()
+                self.connection = None # The server closed the idle connection, open another one
+                if attempt == 2:
+                    raise
+        for header in response.headers.get_all('Set-Cookie') or []:
+            name, _, rest = header.partition('=')
+            self.cookies[name.strip()] = rest.split(';', 1)[0]
+        return response.status, data
+
+    def get(self, path):
+        return self.request('GET', path)
+
+    def post_json(self, path, data):
+        return self.request('POST', path, json.dumps(data).encode(), {'Content-Type': 'application/json'})
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+
+
+# --- Players ---
+
+class Recorder:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+        self._lock = threading.Lock()
+
+    def call(self, endpoint, request, *args):
+        started = time.perf_counter()
+        status, body = request(*args)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.latencies.setdefault(endpoint, []).append(elapsed)
+            if status >= 500 or status == 404:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+        return status, body
+
+
+def guess_plan(answer, rng):
+    """The letters a player will try, in order: 70% of players win (after 0-2 wrong letters), the rest lose."""
+    letters = sorted({char.lower() for char in answer if char.isascii() and char.isalpha()})
+    wrong = [letter for letter in string.ascii_lowercase if letter not in letters]
+    if rng.random() < 0.7:
+        plan = letters + rng.sample(wrong, rng.randint(0, MAX_GUESSES - 1))
+        rng.shuffle(plan) # Wrong letters after the last right one are never sent
+        return plan
+    misses = rng.sample(wrong, MAX_GUESSES)
+    plan = rng.sample(letters, rng.randint(0, len(letters) - 1)) + misses[:-1]
+    rng.shuffle(plan)
+    return plan + misses[-1:] # The losing guess
+
+
+def play(client, recorder, answers, seed, index):
+    rng = random.Random(f'{seed}:{index}')
+    mode = rng.choice(MODES)
+    status, page = recorder.call('main.index', client.get, f'/?mode={mode}')
+    config = json.loads(GAME_CONFIG.search(page).group(1))
+    recorder.call('main.get_state', client.get, f'/api/state?mode={mode}')
+    if config.get('pixelatedImageUrls'):
+        recorder.call('main.pixelated_image', client.get, config['pixelatedImageUrls'][0])
+    else:
+        recorder.call('main.get_emoji', client.get, config['getEmojiUrl'])
+
+    for letter in guess_plan(answers[config['initialRiddleId']], rng):
+        status, body = recorder.call('main.make_guess', client.post_json, '/guess', {'guess': letter, 'delta': True})
+        if status != 200 or json.loads(body).get('game_over'):
+            break
+
+
+def run_players(make_client, answers, players, concurrency, seed):
+    recorder = Recorder()
+
+    def run(index):
+        client = make_client() # A new player: new cookies (and connection)
+        try:
+            play(client, recorder, answers, seed, index)
+        finally:
+            if hasattr(client, 'close'):
+                client.close()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(run, index) for index in range(players)]:
+            future.result()
+    return recorder, time.perf_counter() - started
+
+
+# --- Reporting ---
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * fraction // 1))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(recorder, elapsed, queries):
+    summary = {}
+    for endpoint in ENDPOINTS:
+        latencies = sorted(recorder.latencies.get(endpoint, []))
+        if not latencies:
+            continue
+        summary[endpoint] = {
+            'requests': len(latencies),
+            'errors': recorder.errors.get(endpoint, 0),
+            'requests_per_second': len(latencies) / elapsed,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p95_ms': percentile(latencies, 0.95) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'queries_per_request': queries.get(endpoint),
+        }
+    total = sum(len(values) for values in recorder.latencies.values())
+    return {'elapsed_seconds': elapsed, 'requests': total, 'requests_per_second': total / elapsed, 'endpoints': summary}
+
+
+def print_summary(title, summary):
+    print(f"\n{title}: {summary['requests']} requests in {summary['elapsed_seconds']:.2f}s "
+          f"({summary['requests_per_second']:.0f} req/s)")
+    print(f"{'endpoint':<22} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8}")
+    for endpoint, row in summary['endpoints'].items():
+        queries = f"{row['queries_per_request']:.2f}" if row['queries_per_request'] is not None else 'n/a'
+        print(f"{endpoint:<22} {row['requests']:>8} {row['errors']:>6} {row['requests_per_second']:>8.0f} "
+              f"{row['p50_ms']:>8.2f} {row['p95_ms']:>8.2f} {row['p99_ms']:>8.2f} {queries:>8}")
+
+
+def query_totals(metrics_text):
+    """endpoint -> [SQL statements, requests] so far, from a /metrics scrape."""
+    totals = {}
+    for name, endpoint, value in re.findall(r'^emojile_request_sql_queries_(sum|count)\{endpoint="([^"]+)"\} (\S+)$', metrics_text, re.M):
+        totals.setdefault(endpoint, [0.0, 0.0])[0 if name == 'sum' else 1] = float(value)
+    return totals
+
+
+def queries_per_request(after, before=None):
+    """Average SQL statements per request by endpoint between two query_totals."""
+    before = before or {}
+    averages = {}
+    for endpoint, (statements, requests) in after.items():
+        statements_before, requests_before = before.get(endpoint, (0.0, 0.0))
+        if requests > requests_before:
+            averages[endpoint] = (statements - statements_before) / (requests - requests_before)
+    return averages
+
+
+# --- Targets ---
+
+def run_inprocess(args, db_path, answers):
+    from app import create_app
+    from app.metrics import metrics
+    app = create_app(bench_config(db_path, args.seed))
+    run_players(lambda: InProcessClient(app), answers, min(args.players, 50), args.concurrency, args.seed + ':warmup')
+    metrics.reset()
+    recorder, elapsed = run_players(lambda: InProcessClient(app), answers, args.players, args.concurrency, args.seed)
+    return summarize(recorder, elapsed, queries_per_request(query_totals(metrics.render())))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(url, process, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process is not None and process.poll() is not None:
+            raise SystemExit(f"gunicorn exited with {process.returncode}")
+        try:
+            status, _ = HttpClient(url).get('/more-games')
+            if status == 200:
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"{url} did not come up in {timeout}s")
+
+
+def run_http(args, db_path, answers):
+    process = None
+    url = args.url
+    if url is None:
+        if shutil.which('gunicorn') is None:
+            raise SystemExit("gunicorn is not installed (pip install gunicorn), or pass --url")
+        port = free_port()
+        url = f'http://127.0.0.1:{port}'
+        process = subprocess.Popen(
+            ['gunicorn', '--workers', str(args.workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning',
+             'app:create_app()'],
+            cwd=ROOT, env=bench_environ(db_path, args.seed))
+    try:
+        wait_for(url, process)
+        run_players(lambda: HttpClient(url), answers, min(args.players, 50), args.concurrency, args.seed + ':warmup')
+        # Per-worker numbers: only meaningful when one worker answers every request
+        single_worker = args.url is None and args.workers == 1
+        before = query_totals(HttpClient(url).get('/metrics')[1].decode()) if single_worker else None
+        recorder, elapsed = run_players(lambda: HttpClient(url), answers, args.players, args.concurrency, args.seed)
+        queries = {}
+        if single_worker:
+            queries = queries_per_request(query_totals(HttpClient(url).get('/metrics')[1].decode()), before)
+        return summarize(recorder, elapsed, queries)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait(timeout=10)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--target', choices=['inprocess', 'http', 'both'], default='inprocess')
+    parser.add_argument('--players', type=int, default=2000, help='simulated players (one game each)')
+    parser.add_argument('--concurrency', type=int, default=8, help='players playing at the same time')
+    parser.add_argument('--workers', type=int, default=4, help='gunicorn workers for --target http')
+    parser.add_argument('--url', help='play against this server instead of starting gunicorn (its own database)')
+    parser.add_argument('--seed', default='emojile', help='schedule seed and player behaviour')
+    parser.add_argument('--json', help='write the results to this file')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='emojile-loadtest-')
+    db_path = os.path.join(workdir, 'loadtest.db')
+    try:
+        seed_database(db_path, args.seed)
+        answers = answers_by_riddle(db_path)
+        results = {'players': args.players, 'concurrency': args.concurrency, 'seed': args.seed}
+        if args.target in ('inprocess', 'both'):
+            results['inprocess'] = run_inprocess(args, db_path, answers)
+            print_summary(f"In-process, {args.players} players, concurrency {args.concurrency}", results['inprocess'])
+        if args.target in ('http', 'both'):
+            results['http'] = run_http(args, db_path, answers)
+            where = args.url or f"gunicorn x{args.workers}"
+            print_summary(f"HTTP ({where}), {args.players} players, concurrency {args.concurrency}", results['http'])
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Microbenchmarks of the code every request runs, with results saved for comparison.
+
+Usage: python benchmarks/micro.py [--filter stats] [--repeat 5] [--json results.json]
+                                  [--compare baseline.json] [--threshold 1.15]
+
+  answer.*    building an answer's profile, make_guess's per-letter evaluation (apply_guesses)
+              and the masked answer_display
+  session.*   encoding / decoding game_states_by_day_mode in the session cookie (json and
+              compact serializers, a player with 3 days of history)
+  stats.*     get_player_stats_dict and update_player_stats against a SQLite file
+  schedule.*  the rows 'flask main init-db' generates, for catalogs of 100 / 1k / 10k emojis
+              (one full cycle of days each)
+
+Each benchmark is timed with timeit (autoranged, best of --repeat) and reported per call.
+--json writes the numbers with the commit and Python version; --compare prints the change
+against such a file and exits with 1 when a benchmark got slower than --threshold times
+the baseline, so it can gate a commit.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import timeit
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(BENCHMARKS_DIR, '..')
+sys.path.insert(0, ROOT)
+
+from flask import Flask  # noqa: E402
+from flask.sessions import SecureCookieSessionInterface  # noqa: E402
+
+from app.answer_profile import AnswerProfile, guesses_to_mask  # noqa: E402
+from app.session_codec import CompactSessionInterface  # noqa: E402
+from app.scheduler import schedule_rows  # noqa: E402
+from session_cookie import build_session, MODES  # noqa: E402
+
+ANSWERS = ['Rocket', 'Smiling Face with Open Hands', 'Flag: United Kingdom', 'Man Technologist: Medium-Dark Skin Tone']
+BENCHMARKS = {} # name -> function returning the callable to time (setup happens there, untimed)
+
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# --- Game logic ---
+
+@benchmark('answer.profile_build')
+def bench_profile_build():
+    return lambda: [AnswerProfile(name) for name in ANSWERS]
+
+
+@benchmark('answer.evaluate_guess')
+def bench_evaluate_guess():
+    from app.routes import apply_guesses
+    profiles = [AnswerProfile(name) for name in ANSWERS]
+    # A fresh guess list per call, as make_guess gets from the game state store
+    return lambda: [apply_guesses(profile, ['e', 'z', 'a'], ['n']) for profile in profiles]
+
+
+@benchmark('answer.display')
+def bench_display():
+    profiles = [AnswerProfile(name) for name in ANSWERS]
+    mask = guesses_to_mask(['e', 'a', 'n', 't', 'o'])
+    return lambda: [profile.display(mask) for profile in profiles]
+
+
+# --- Session cookie ---
+
+def session_benchmark(interface, decode):
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    signer = interface.get_signing_serializer(app)
+    session_data = build_session(3)
+    if decode:
+        cookie = signer.dumps(session_data)
+        return lambda: signer.loads(cookie)
+    return lambda: signer.dumps(session_data)
+
+
+for _name, _interface in (('json', SecureCookieSessionInterface), ('compact', lambda: CompactSessionInterface(MODES))):
+    benchmark(f'session.encode_{_name}')(lambda interface=_interface: session_benchmark(interface(), decode=False))
+    benchmark(f'session.decode_{_name}')(lambda interface=_interface: session_benchmark(interface(), decode=True))
+
+
+# --- Stats (SQLite) ---
+
+class StatsDatabase:
+    """A create_app() on a temporary SQLite file with `players` players that have played 10 games."""
+    _instance = None
+
+    def __init__(self, players=1000):
+        from app import create_app, db
+        from app.stats import upsert_player_stats
+        from config import Config
+
+        self.workdir = tempfile.mkdtemp(prefix='emojile-micro-')
+
+        class MicroConfig(Config):
+            SQLALCHEMY_DATABASE_URI = f"sqlite:///{os.path.join(self.workdir, 'micro.db')}"
+            DEPLOY_VERSION = 'micro'
+            LOG_LEVEL = 'WARNING'
+            STATS_WRITE_BEHIND = False
+        self.app = create_app(MicroConfig)
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+        rng = random.Random(0)
+        self.players = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(players)]
+        first_day = date(2025, 6, 1)
+        for player_uuid in self.players:
+            for day in range(10):
+                game_date = first_day + timedelta(days=day)
+                upsert_player_stats(player_uuid, 'Classic', rng.random() < 0.7, rng.randint(0, 3), game_date,
+                                    datetime.combine(game_date, datetime.min.time(), tzinfo=timezone.utc))
+        db.session.commit()
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def close(cls):
+        if cls._instance is not None:
+            from app import db
+            db.session.remove()
+            db.engine.dispose()
+            cls._instance.context.pop()
+            shutil.rmtree(cls._instance.workdir, ignore_errors=True)
+            cls._instance = None
+
+
+@benchmark('stats.get_player_stats_dict')
+def bench_get_stats():
+    from app.routes import get_player_stats_dict
+    players = StatsDatabase.get().players
+    index = iter(range(10 ** 9))
+    return lambda: get_player_stats_dict(players[next(index) % len(players)], 'Classic')
+
+
+@benchmark('stats.update_player_stats')
+def bench_update_stats():
+    from app.routes import update_player_stats
+    players = StatsDatabase.get().players
+    days = iter(range(10 ** 9))
+
+    def update():
+        day = next(days)
+        # A player's game on the next day: the streak-extending upsert, one transaction each
+        update_player_stats(players[day % len(players)], 'Classic', day % 3 != 0, day % 4,
+                            date(2025, 6, 11) + timedelta(days=day // len(players)))
+    return update
+
+
+# --- Schedule generation ---
+
+def synthetic_catalog(size):
+    rng = random.Random(size)
+    return [{'emoji': f'E{index}', 'name': ''.join(rng.choices(string.ascii_letters + ' ', k=rng.randint(4, 30))),
+             'category': f'Category {index % 9}'} for index in range(size)]
+
+
+for _size, _label in ((100, '100'), (1000, '1k'), (10000, '10k')):
+    @benchmark(f'schedule.rows_{_label}')
+    def bench_schedule(size=_size):
+        catalog = synthetic_catalog(size)
+        return lambda: list(schedule_rows(catalog, MODES, 'micro', range(size)))
+
+
+# --- Running / comparing ---
+
+def measure(function, repeat):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange() # Calls per sample so a sample takes >= 0.2s
+    samples = [elapsed / number for elapsed in timer.repeat(repeat=repeat, number=number)]
+    return {'best_us': min(samples) * 1e6, 'median_us': statistics.median(samples) * 1e6, 'number': number}
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """Prints the change against a baseline run; True when something got slower than threshold x."""
+    regressed = False
+    print(f"\nCompared with {baseline.get('commit') or 'baseline'}:")
+    for name, result in results.items():
+        before = baseline['results'].get(name)
+        if before is None:
+            print(f"  {name:<32} new")
+            continue
+        ratio = result['best_us'] / before['best_us']
+        flag = ''
+        if ratio > threshold:
+            flag, regressed = '  REGRESSION', True
+        print(f"  {name:<32} {before['best_us']:>12.2f} -> {result['best_us']:>12.2f} us  x{ratio:.2f}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--filter', default='', help='only run benchmarks whose name contains this')
+    parser.add_argument('--repeat', type=int, default=5, help='timeit samples per benchmark (the best one counts)')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='results file of an earlier run to compare with')
+    parser.add_argument('--threshold', type=float, default=1.15, help='slowdown ratio that counts as a regression')
+    args = parser.parse_args()
+
+    results = {}
+    try:
+        print(f"{'benchmark':<32} {'best':>12} {'median':>12} {'calls':>8}")
+        for name, setup in BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(setup(), args.repeat)
+            print(f"{name:<32} {results[name]['best_us']:>9.2f} us {results[name]['median_us']:>9.2f} us {results[name]['number']:>8}")
+    finally:
+        StatsDatabase.close()
+
+    run = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'results': results,
+    }
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(run, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.threshold):
+                raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
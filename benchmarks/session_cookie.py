@@ -0,0 +1,79 @@
+"""
+Compare the cookie produced by Flask's default session serializer with the compact one.
+
+Usage: python benchmarks/session_cookie.py [--days 30] [--number 2000]
+
+For a returning player with `days` days of history in both modes it prints the signed
+cookie size and the time to encode (dumps) and decode (loads) it.
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import timeit
+import uuid
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from flask import Flask  # noqa: E402
+from flask.sessions import SecureCookieSessionInterface  # noqa: E402
+
+from app.days import utc_today  # noqa: E402
+from app.session_codec import CompactSessionInterface  # noqa: E402
+
+MODES = ['Classic', 'Pixelated']
+
+
+def build_session(days, seed=0):
+    rng = random.Random(seed)
+    today = utc_today()
+    states = {}
+    for offset in range(days):
+        date_iso = (today - timedelta(days=offset)).isoformat()
+        states[date_iso] = {
+            mode: {
+                'riddle_id': rng.randint(1, 2000),
+                'guesses': rng.sample(string.ascii_lowercase, rng.randint(1, 9)),
+                'game_over': offset > 0,
+                'is_win': rng.random() < 0.7,
+            }
+            for mode in MODES
+        }
+    return {
+        'player_uuid': str(uuid.UUID(int=rng.getrandbits(128))),
+        'active_state_mode': 'Classic',
+        'active_state_date_iso': today.isoformat(),
+        'game_states_by_day_mode': states,
+    }
+
+
+def measure(name, interface, app, session_data, number):
+    signer = interface.get_signing_serializer(app)
+    cookie = signer.dumps(session_data)
+    encode = timeit.timeit(lambda: signer.dumps(session_data), number=number) / number
+    decode = timeit.timeit(lambda: signer.loads(cookie), number=number) / number
+    print(f"{name:<10} {len(cookie):>8} B {encode * 1e6:>10.1f} us {decode * 1e6:>10.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=30, help='days of history in the session')
+    parser.add_argument('--number', type=int, default=2000, help='timeit iterations')
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    session_data = build_session(args.days)
+
+    print(f"Session with {args.days} days x {len(MODES)} modes of game state")
+    print(f"{'serializer':<10} {'cookie':>10} {'encode':>13} {'decode':>13}")
+    measure('json', SecureCookieSessionInterface(), app, session_data, args.number)
+    measure('compact', CompactSessionInterface(MODES), app, session_data, args.number)
+    # What the compact cookie would cost without the history window
+    measure('compact*', CompactSessionInterface(MODES, window_days=args.days), app, session_data, args.number)
+
+
+if __name__ == '__main__':
+    main()
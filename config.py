@@ -9,4 +9,69 @@ class Config:
     # --- Add these lines for persistent sessions ---
     SESSION_PERMANENT = True
     PERMANENT_SESSION_LIFETIME = timedelta(days=7) # Keep session cookie for 2 days
-    # --- End added lines ---
\ No newline at end of file
+    # --- End added lines ---
+
+    # Riddle repository: how many riddles from other days (archive lookups) to keep in memory,
+    # and how often to re-check the DB when today's riddle for a mode is missing.
+    RIDDLE_CACHE_ARCHIVE_SIZE = int(os.environ.get('RIDDLE_CACHE_ARCHIVE_SIZE', 512))
+    RIDDLE_CACHE_MISS_RECHECK_SECONDS = 60
+
+    # Where riddles come from: 'table' reads the Riddle rows written by init-db, 'schedule'
+    # computes them from the emoji catalog with the deterministic scheduler (app/scheduler.py),
+    # so serving a riddle needs no query. SCHEDULE_SEED picks the schedule.
+    RIDDLE_SOURCE = os.environ.get('RIDDLE_SOURCE', 'table')
+    SCHEDULE_SEED = os.environ.get('SCHEDULE_SEED', 'emojile')
+
+    # Where per-player game state is kept: 'cookie' (Flask session), 'memory' (this process only)
+    # or 'sql' (game_state table, run 'flask db upgrade' first). States older than
+    # GAME_STATE_TTL_DAYS days are expired.
+    GAME_STATE_BACKEND = os.environ.get('GAME_STATE_BACKEND', 'cookie')
+    GAME_STATE_TTL_DAYS = 2
+
+    # Session cookie encoding: 'compact' packs the game state into a small binary payload
+    # (see app/session_codec.py) and only keeps SESSION_STATE_WINDOW_DAYS days of history,
+    # 'json' is Flask's default serializer.
+    SESSION_SERIALIZER = os.environ.get('SESSION_SERIALIZER', 'compact')
+    SESSION_STATE_WINDOW_DAYS = 3
+
+    # Write-behind stats: queue finished games in the worker and write them in batches every
+    # STATS_FLUSH_INTERVAL_SECONDS (or once STATS_FLUSH_MAX_PENDING are queued) instead of one
+    # transaction per game. Pending games are flushed on shutdown. After STATS_FLUSH_MAX_ATTEMPTS
+    # failed flushes in a row, games that still can't be written are logged and dropped.
+    STATS_WRITE_BEHIND = os.environ.get('STATS_WRITE_BEHIND', '').lower() in ('1', 'true', 'yes')
+    STATS_FLUSH_INTERVAL_SECONDS = 2.0
+    STATS_FLUSH_MAX_PENDING = 200
+    STATS_FLUSH_MAX_ATTEMPTS = 5
+
+    # Identifies the deploy in the ETags of the cacheable game pages. Defaults to a hash of
+    # the templates and static files (see app/deploy.py); set it (e.g. to the git commit)
+    # to skip hashing at startup.
+    DEPLOY_VERSION = os.environ.get('DEPLOY_VERSION')
+
+    # Rendered game pages (per mode / day / riddle) and more_games.html are kept in memory in
+    # each worker until midnight, at most PAGE_CACHE_MAX_ENTRIES of them.
+    PAGE_CACHE_ENABLED = True
+    PAGE_CACHE_MAX_ENTRIES = 64
+
+    # Link the fingerprinted CSS/JS bundles written by 'flask main build-assets' (served from
+    # /assets/ with a one-year immutable Cache-Control) when app/static/dist is up to date with
+    # the sources. False always links the source files under /static/.
+    ASSETS_USE_BUILD = os.environ.get('ASSETS_USE_BUILD', '1').lower() in ('1', 'true', 'yes')
+
+    # Pixelated mode: render the pixelation levels on the server (app/pixelation.py, needs
+    # Pillow and a color emoji font) into PNGs cached under PIXELATED_CACHE_DIR (default:
+    # instance/pixelated). Without them the browser draws the emoji on a canvas.
+    PIXELATED_SERVER_RENDER = os.environ.get('PIXELATED_SERVER_RENDER', '1').lower() in ('1', 'true', 'yes')
+    PIXELATED_EMOJI_FONT = os.environ.get('PIXELATED_EMOJI_FONT') # Default: the first of pixelation.EMOJI_FONT_CANDIDATES found
+    PIXELATED_CACHE_DIR = os.environ.get('PIXELATED_CACHE_DIR')
+
+    # Per-request metrics (latency per endpoint, SQL statements and time, template render time,
+    # session cookie size) served at /metrics in the Prometheus text format (app/metrics.py).
+    METRICS_ENABLED = os.environ.get('METRICS_ENABLED', '1').lower() in ('1', 'true', 'yes')
+
+    # Logging (app/logs.py): JSON lines on stdout, written by a background thread. LOG_LEVEL is
+    # the level of the 'app' loggers, LOG_LEVELS overrides it per logger ("app.routes=DEBUG,...").
+    # LOG_DEBUG_SAMPLE_RATE keeps that share of each DEBUG message (e.g. 0.01: 1 in 100).
+    LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+    LOG_LEVELS = os.environ.get('LOG_LEVELS', '')
+    LOG_DEBUG_SAMPLE_RATE = float(os.environ.get('LOG_DEBUG_SAMPLE_RATE', 1.0))
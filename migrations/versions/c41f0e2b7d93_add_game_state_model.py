@@ -0,0 +1,39 @@
+"""Add GameState model
+
+Revision ID: c41f0e2b7d93
+Revises: 8376fc61ca90
+Create Date: 2026-10-18 10:15:02.113408
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f0e2b7d93'
+down_revision = '8376fc61ca90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('game_state',
+    sa.Column('player_uuid', sa.String(length=36), nullable=False),
+    sa.Column('date_iso', sa.String(length=10), nullable=False),
+    sa.Column('game_mode', sa.String(length=50), nullable=False),
+    sa.Column('riddle_id', sa.Integer(), nullable=False),
+    sa.Column('guesses', sa.String(length=26), nullable=False),
+    sa.Column('game_over', sa.Boolean(), nullable=False),
+    sa.Column('is_win', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('player_uuid', 'date_iso', 'game_mode')
+    )
+    with op.batch_alter_table('game_state', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_game_state_date_iso'), ['date_iso'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('game_state', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_game_state_date_iso'))
+
+    op.drop_table('game_state')
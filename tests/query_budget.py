@@ -0,0 +1,55 @@
+"""
+Query budgets: count the SQL statements a request issues and fail a test that goes over.
+
+    class TestSomething(QueryBudgetMixin, unittest.TestCase):
+        def test_guess(self):
+            self.assertQueryBudget(0, self.client.post, '/guess', json={'guess': 'r'})
+
+Statements are counted with SQLAlchemy's before_cursor_execute event on db.engine, for the
+calling thread only (a background flush can't make a test flaky). On failure the message
+lists every statement the request ran.
+"""
+import threading
+
+from sqlalchemy import event
+
+from app import db
+
+
+class QueryCounter:
+    """The SQL statements executed on `engine` by this thread while the counter is active (a context manager)."""
+
+    def __init__(self, engine=None):
+        self.engine = engine
+        self.statements = []
+        self._thread_id = None
+
+    def __enter__(self):
+        self.engine = self.engine if self.engine is not None else db.engine
+        self._thread_id = threading.get_ident()
+        self.statements = []
+        event.listen(self.engine, 'before_cursor_execute', self._record)
+        return self
+
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, 'before_cursor_execute', self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == self._thread_id:
+            self.statements.append(' '.join(statement.split()))
+
+    def __len__(self):
+        return len(self.statements)
+
+    def report(self):
+        return '\n'.join(f'  {index}. {statement}' for index, statement in enumerate(self.statements, 1)) or '  (none)'
+
+
+class QueryBudgetMixin:
+    def assertQueryBudget(self, budget, request, *args, **kwargs):
+        """Calls request(*args, **kwargs) (e.g. a test client method) and returns its result; fails over `budget` statements."""
+        with QueryCounter() as counter:
+            result = request(*args, **kwargs)
+        if len(counter) > budget:
+            self.fail(f"{len(counter)} SQL statements, over the budget of {budget}:\n{counter.report()}")
+        return result
@@ -0,0 +1,36 @@
+import unittest
+from app.answer_profile import AnswerProfile, guesses_to_mask, mask_to_letters
+
+
+class TestAnswerProfile(unittest.TestCase):
+    def test_masks_and_positions(self):
+        profile = AnswerProfile('Tear-Off Calendar')
+        self.assertEqual(profile.required_mask, guesses_to_mask('tearofcldn'))
+        self.assertEqual(profile.positions['a'], (2, 10, 15))
+        self.assertEqual(profile.template, '____-___ ________')
+        self.assertEqual(profile.solved_display, 'Tear-Off Calendar')
+
+    def test_punctuation_and_digits_are_shown_throughout(self):
+        for name, template in (('T-Rex', '_-___'), ('Keycap: 10', '______: 10')):
+            profile = AnswerProfile(name)
+            self.assertEqual(profile.template, template)
+            solved_mask = guesses_to_mask(name.lower())
+            self.assertEqual(profile.display(solved_mask), name)
+            self.assertEqual(profile.solved_display, profile.display(solved_mask))
+
+    def test_evaluate_guesses(self):
+        profile = AnswerProfile('Pool 8 Ball')
+        mask = guesses_to_mask(['o', 'x', 'l'])
+        self.assertEqual(profile.incorrect_count(mask), 1)
+        self.assertFalse(profile.is_solved(mask))
+        self.assertEqual(profile.display(mask), '_ool 8 __ll')
+        mask |= guesses_to_mask('pba')
+        self.assertTrue(profile.is_solved(mask))
+        self.assertEqual(profile.display(mask), 'Pool 8 Ball')
+
+    def test_mask_to_letters(self):
+        self.assertEqual(mask_to_letters(guesses_to_mask(['z', 'a'])), ['a', 'z'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from app import create_app
+from app.assets import (assets, build_assets, dedupe_css_rules, minify_css, minify_html, minify_js,
+                        BUNDLES, MANIFEST_NAME)
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+
+
+class TestMinifiers(unittest.TestCase):
+    def test_css(self):
+        css = "/* colors */\n.a ,\n.b > .c {\n    color : red; /* note */\n    margin: 0 auto;\n}\na :hover { color: blue; }\n"
+        self.assertEqual(minify_css(css), ".a,.b>.c{color :red;margin:0 auto}a :hover{color:blue}")
+
+    def test_css_dedupe_keeps_last_copy(self):
+        css = minify_css(".a { color: red; }\n.b { color: blue; }\n.a { color: red; }\n.empty { }\n@media (max-width: 600px) { .a { color: red; } }")
+        self.assertEqual(dedupe_css_rules(css), ".b{color:blue}.a{color:red}@media (max-width:600px){.a{color:red}}")
+
+    def test_js_keeps_strings_templates_and_regexes(self):
+        js = (
+            "// leading comment\n"
+            "const url = 'http://example.com'; // trailing comment\n"
+            "const text = `line one\n    // not a comment ${ {a: 1}.a } and ${`nested ${url}`}`;\n"
+            "const re = /\\/\\/[a-z/]+/g; /* block */ const half = 10 / 2 / 1;\n"
+            "function f() {\n    return /x/.test('x');\n}\n"
+        )
+        minified = minify_js(js)
+        self.assertIn("const url = 'http://example.com';\n", minified)
+        self.assertIn("`line one\n    // not a comment ${ {a: 1}.a} and ${`nested ${url}`}`", minified)
+        self.assertIn("/\\/\\/[a-z/]+/g", minified)
+        self.assertIn("10 / 2 / 1", minified)
+        self.assertIn("return /x/.test('x')", minified)
+        self.assertNotIn("comment\n", minified.replace("// not a comment", ""))
+        self.assertNotIn("block", minified)
+
+    def test_html(self):
+        self.assertEqual(minify_html("<div>\n    <span>a</span>\n\n    <span>b</span>\n</div>"),
+                         "<div>\n<span>a</span>\n<span>b</span>\n</div>")
+        self.assertEqual(minify_html("<pre>\n    x</pre>"), "<pre>\n    x</pre>")
+
+
+class TestBuildAssets(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        # Build from a copy of the sources so the real app/static/dist is left alone
+        self.static_folder = tempfile.mkdtemp()
+        for directory in ('css', 'js'):
+            shutil.copytree(os.path.join(self.app.static_folder, directory), os.path.join(self.static_folder, directory))
+        self.dist_folder = os.path.join(self.static_folder, 'dist')
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        assets.reset()
+        self.app_context.pop()
+        shutil.rmtree(self.static_folder)
+
+    def use_build(self):
+        assets.static_folder = self.static_folder
+        assets.dist_folder = self.dist_folder
+        return assets.load()
+
+    def test_build(self):
+        os.makedirs(self.dist_folder)
+        with open(os.path.join(self.dist_folder, 'classic_game.0123456789ab.js'), 'w') as f:
+            f.write('old build')
+
+        manifest = build_assets(self.static_folder)
+
+        self.assertEqual(set(manifest['files']), set(BUNDLES))
+        with open(os.path.join(self.dist_folder, MANIFEST_NAME)) as f:
+            self.assertEqual(json.load(f), manifest)
+        for name, filename in manifest['files'].items():
+            stem, ext = os.path.splitext(name)
+            self.assertRegex(filename, rf'^{stem}\.[0-9a-f]{{12}}\{ext}$')
+            with open(os.path.join(self.dist_folder, filename), 'rb') as f:
+                data = f.read()
+            with open(os.path.join(self.dist_folder, filename + '.gz'), 'rb') as f:
+                self.assertEqual(gzip.decompress(f.read()), data)
+            self.assertLess(len(data), manifest['sizes'][name]['source'])
+        self.assertFalse(os.path.exists(os.path.join(self.dist_folder, 'classic_game.0123456789ab.js')))
+        # Same sources, same names
+        self.assertEqual(build_assets(self.static_folder)['files'], manifest['files'])
+
+    @unittest.skipUnless(shutil.which('node'), 'node is not installed')
+    def test_built_scripts_parse(self):
+        manifest = build_assets(self.static_folder)
+        for name, filename in manifest['files'].items():
+            if name.endswith('.js'):
+                result = subprocess.run(['node', '--check', os.path.join(self.dist_folder, filename)], capture_output=True, text=True)
+                self.assertEqual(result.returncode, 0, result.stderr)
+
+    def test_pages_link_sources_without_a_build(self):
+        self.assertFalse(self.use_build())
+        html = self.client.get('/more-games').get_data(as_text=True)
+        self.assertIn('/static/css/style.css', html)
+        self.assertIn('/static/js/theme.js', html)
+        self.assertNotIn('/assets/', html)
+
+    def test_served_with_immutable_cache_control(self):
+        manifest = build_assets(self.static_folder)
+        self.assertTrue(self.use_build())
+        filename = manifest['files']['more_games.js']
+        with self.app.test_request_context():
+            self.assertEqual(assets.urls('more_games.js'), [f'/assets/{filename}'])
+
+        response = self.client.get(f'/assets/{filename}', headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertTrue(response.cache_control.immutable)
+        self.assertTrue(response.cache_control.public)
+        self.assertEqual(response.cache_control.max_age, 365 * 24 * 60 * 60)
+        self.assertTrue(response.mimetype.endswith('javascript'))
+        with open(os.path.join(self.dist_folder, filename), 'rb') as f:
+            plain = f.read()
+        self.assertEqual(gzip.decompress(response.data), plain)
+
+        response = self.client.get(f'/assets/{filename}', headers={'Accept-Encoding': 'identity'})
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.data, plain)
+
+        self.assertEqual(self.client.get('/assets/manifest.json').status_code, 404)
+        self.assertEqual(self.client.get('/assets/../config.py').status_code, 404)
+
+    def test_outdated_build_is_ignored(self):
+        build_assets(self.static_folder)
+        with open(os.path.join(self.static_folder, 'js', 'theme.js'), 'a') as f:
+            f.write('\n// edited\n')
+        self.assertFalse(self.use_build())
+        with self.app.test_request_context():
+            self.assertEqual(assets.urls('more_games.js'), ['/static/js/theme.js'])
+
+
+if __name__ == '__main__':
+    unittest.main()
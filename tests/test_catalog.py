@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+from app import models
+from app import create_app
+from app.catalog import EmojiCatalog, get_catalog
+from app.catalog_import import clean_name
+from config import Config
+
+
+class TestEmojiCatalog(unittest.TestCase):
+    def test_default_catalog(self):
+        catalog = get_catalog()
+        self.assertGreater(len(catalog), 800)
+        self.assertEqual(catalog[0], {'emoji': '😀', 'name': 'Grinning Face', 'category': 'Smileys & People'})
+        self.assertIs(get_catalog(), catalog) # Loaded once
+
+    def test_initial_emojis_still_importable(self):
+        from app.models import initial_emojis
+        self.assertIs(initial_emojis, get_catalog())
+        with self.assertRaises(AttributeError):
+            models.no_such_thing
+
+    def test_load_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'emojis.jsonl')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('{"emoji": "🚀", "name": "Rocket", "category": "Travel & Places"}\n\n')
+                f.write('{"emoji": "🗿", "name": "Moai", "category": "Objects"}\n')
+            catalog = EmojiCatalog.load(path)
+            self.assertEqual(len(catalog), 2)
+            self.assertEqual([entry['name'] for entry in catalog], ['Rocket', 'Moai'])
+            self.assertEqual(catalog[-1]['category'], 'Objects')
+            self.assertEqual(catalog[:1], [{'emoji': '🚀', 'name': 'Rocket', 'category': 'Travel & Places'}])
+
+            open(path, 'w').close()
+            self.assertEqual(len(EmojiCatalog.load(path)), 0)
+
+    def test_duplicates_are_left_out(self):
+        catalog = EmojiCatalog.from_entries([
+            {'emoji': '❤️', 'name': 'Red Heart', 'category': 'Symbols'},
+            {'emoji': '🚀', 'name': 'Rocket', 'category': 'Travel & Places'},
+            {'emoji': '❤', 'name': 'Heart', 'category': 'Symbols'}, # Same emoji without FE0F
+            {'emoji': '🛸', 'name': 'rocket', 'category': 'Travel & Places'}, # Same name
+            {'emoji': '🗿', 'name': 'Moai', 'category': 'Objects'},
+        ])
+        self.assertEqual([entry['name'] for entry in catalog], ['Red Heart', 'Rocket', 'Moai'])
+        self.assertEqual([(d.source_index, d.kept_index, d.reason) for d in catalog.duplicates], [(2, 0, 'emoji'), (3, 1, 'name')])
+
+    def test_lookups(self):
+        catalog = get_catalog()
+        heart = catalog.index_of_emoji('❤️')
+        self.assertEqual(catalog[heart]['name'], 'Red Heart')
+        self.assertEqual(catalog.index_of_emoji('❤'), heart)
+        self.assertEqual(catalog.index_of_codepoints('U+2764 U+FE0F'), heart)
+        self.assertEqual(catalog.index_of_codepoints([0x2764]), heart)
+        self.assertEqual(catalog.index_of_name('  red-HEART '), heart)
+        self.assertIn(heart, catalog.indexes_in_category('Symbols'))
+        self.assertIn('❤', catalog)
+        self.assertIsNone(catalog.index_of_emoji('x'))
+        self.assertEqual(catalog.indexes_in_category('Nope'), ())
+        self.assertEqual(catalog.duplicates, ())
+
+    def test_check_catalog_command(self):
+        class TestConfig(Config):
+            TESTING = True
+            SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        result = create_app(TestConfig).test_cli_runner().invoke(args=['main', 'check-catalog'])
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn('No problems found.', result.output)
+
+
+
+EMOJI_TEST_SAMPLE = """# emoji-test.txt
+# group: Smileys & Emotion
+1F600                                                  ; fully-qualified     # 😀 E1.0 grinning face
+263A FE0F                                              ; fully-qualified     # ☺️ E0.6 smiling face
+263A                                                   ; unqualified         # ☺ E0.6 smiling face
+# group: People & Body
+1F44B 1F3FB                                            ; fully-qualified     # 👋🏻 E1.0 waving hand: light skin tone
+# group: Component
+1F3FB                                                  ; component           # 🏻 E1.0 light skin tone
+# group: Objects
+1F55B                                                  ; fully-qualified     # 🕛 E0.6 twelve o’clock
+# group: Flags
+1F1E8 1F1EE                                            ; fully-qualified     # 🇨🇮 E2.0 flag: Côte d’Ivoire
+"""
+
+
+class TestImportEmojiTest(unittest.TestCase):
+    def test_clean_name(self):
+        self.assertEqual(clean_name('flag: Côte d’Ivoire'), "Flag Cote D'Ivoire")
+        self.assertEqual(clean_name('upside-down face'), 'Upside-down Face')
+        self.assertIsNone(clean_name('“’”'))
+
+    def test_import_appends_new_entries(self):
+        class TestConfig(Config):
+            TESTING = True
+            SQLALCHEMY_DATABASE_URI = 'sqlite://'
+        runner = create_app(TestConfig).test_cli_runner()
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'emoji-test.txt')
+            catalog_path = os.path.join(tmp, 'emojis.jsonl')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write(EMOJI_TEST_SAMPLE)
+            with open(catalog_path, 'w', encoding='utf-8') as f:
+                f.write('{"emoji": "😀", "name": "Grinning Face", "category": "Smileys & People"}') # No trailing newline
+
+            result = runner.invoke(args=['main', 'import-emoji-test', source, '--catalog', catalog_path, '--batch-size', '1'])
+            self.assertIn('Added 3 emojis (4 in the catalog)', result.output)
+            catalog = EmojiCatalog.load(catalog_path)
+            self.assertEqual(list(catalog)[1:], [
+                {'emoji': '☺️', 'name': 'Smiling Face', 'category': 'Smileys & People'},
+                {'emoji': '🕛', 'name': "Twelve O'clock", 'category': 'Objects'},
+                {'emoji': '🇨🇮', 'name': "Flag Cote D'Ivoire", 'category': 'Symbols'},
+            ])
+
+            result = runner.invoke(args=['main', 'import-emoji-test', source, '--catalog', catalog_path])
+            self.assertIn('Added 0 emojis', result.output)
+            self.assertEqual(len(EmojiCatalog.load(catalog_path)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,209 @@
+import json
+import re
+import unittest
+from unittest import mock
+from flask import render_template
+from app import create_app, db
+from app.page_cache import page_cache
+from app.days import current_day_number
+from app.models import Riddle
+from app.routes import update_player_stats
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+
+
+class TestCacheableGamePage(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        db.session.add(Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=current_day_number(), game_mode='Classic'))
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def test_page_is_the_same_for_everyone(self):
+        first = self.client.get('/?mode=Classic')
+        self.client.get('/api/state?mode=Classic')
+        self.client.post('/guess', json={'guess': 'r'})
+        second = self.client.get('/?mode=Classic')
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        self.assertNotIn('Set-Cookie', first.headers)
+        self.assertNotIn('Cookie', first.headers.get('Vary', ''))
+        self.assertTrue(first.cache_control.public)
+        self.assertGreater(first.cache_control.max_age, 0)
+        self.assertLessEqual(first.cache_control.max_age, 24 * 3600)
+
+    def test_conditional_request(self):
+        etag = self.client.get('/?mode=Classic').headers['ETag']
+        response = self.client.get('/?mode=Classic', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertNotEqual(self.client.get('/?mode=Pixelated').headers['ETag'], etag)
+
+    def test_emoji_in_page(self):
+        html = self.client.get('/?mode=Classic').get_data(as_text=True)
+        self.assertIn('"emoji": "\\ud83d\\ude80"', html) # For the script
+        self.assertIn('<span id="text-emoji-display" style="font-size: 6rem;">🚀</span>', html)
+
+    def test_config_has_todays_day_number(self):
+        html = self.client.get('/?mode=Classic').get_data(as_text=True)
+        config = json.loads(re.search(r'<script id="game-config-data" type="application/json">(.*?)</script>', html, re.S).group(1))
+        self.assertEqual(config['dayNumberOnLoad'], current_day_number())
+        self.assertEqual(config['initialGameMode'], 'Classic')
+        self.assertEqual(config['answerDisplay'], '______')
+
+    def test_get_emoji_cacheable(self):
+        riddle_id = Riddle.query.filter_by(game_mode='Classic').one().id
+        html = self.client.get('/?mode=Classic').get_data(as_text=True)
+        url = json.loads(re.search(r'<script id="game-config-data" type="application/json">(.*?)</script>', html, re.S).group(1))['getEmojiUrl']
+        self.assertRegex(url, rf'^/api/get-emoji/{riddle_id}\?v=[0-9a-f]{{12}}$')
+        response = self.client.get(url)
+        self.assertEqual(response.get_json(), {'emoji': '🚀'})
+        etag, is_weak = response.get_etag()
+        self.assertTrue(etag)
+        self.assertFalse(is_weak)
+        self.assertTrue(response.cache_control.public)
+        self.assertGreaterEqual(response.cache_control.max_age, 30 * 24 * 3600)
+
+        response = self.client.get(url, headers={'If-None-Match': f'"{etag}"'})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+        self.assertEqual(self.client.get('/api/get-emoji/999999').status_code, 404)
+
+        # Ids get reused, so a URL without the current version is only kept briefly
+        for stale_url in (f'/api/get-emoji/{riddle_id}', f'/api/get-emoji/{riddle_id}?v=000000000000'):
+            response = self.client.get(stale_url)
+            self.assertEqual(response.get_json(), {'emoji': '🚀'})
+            self.assertLessEqual(response.cache_control.max_age, 300)
+            self.assertTrue(response.cache_control.must_revalidate)
+
+    def test_get_emoji_hides_future_riddles(self):
+        tomorrow = Riddle(emoji='⭐', name='Star', category='Travel & Places', day_number=current_day_number() + 1, game_mode='Classic')
+        db.session.add(tomorrow)
+        db.session.commit()
+        self.assertEqual(self.client.get(f'/api/get-emoji/{tomorrow.id}').status_code, 404)
+
+    def test_state(self):
+        state = self.client.get('/api/state?mode=Classic').get_json()
+        self.assertEqual(state['answer_display'], '______')
+        self.assertEqual(state['guessed_letters'], [])
+        self.assertFalse(state['game_over'])
+        self.assertEqual(state['stats']['total_games'], 0)
+
+        for letter in 'rocket':
+            self.client.post('/guess', json={'guess': letter})
+        response = self.client.get('/api/state?mode=Classic')
+        state = response.get_json()
+        self.assertTrue(response.cache_control.no_store)
+        self.assertTrue(state['game_over'] and state['is_win'])
+        self.assertEqual(state['answer_display'], 'Rocket')
+        self.assertEqual(state['stats']['total_games'], 1)
+        self.assertIsNotNone(state['stats']['last_played_datetime_str'])
+
+    def test_batch_guess(self):
+        self.client.get('/api/state?mode=Classic')
+        data = self.client.post('/guess', json={'guesses': ['r', 'z', 'R', '1', 'o']}).get_json()
+        self.assertTrue(data['success'])
+        self.assertEqual([(r['letter'], r['success']) for r in data['results']],
+                         [('r', True), ('z', True), ('r', False), ('1', False), ('o', True)])
+        self.assertEqual(data['results'][2]['error'], 'Letter already guessed.')
+        self.assertEqual([data['results'][i]['is_correct'] for i in (0, 1, 4)], [True, False, True])
+        self.assertEqual(data['guessed_letters'], ['r', 'z', 'o'])
+        self.assertEqual(data['answer_display'], 'Ro____')
+        self.assertEqual(data['incorrect_guesses'], 1)
+        self.assertFalse(data['game_over'])
+
+        # Letters after the one that ends the game aren't applied, and stats count one game
+        with mock.patch('app.routes.update_player_stats', wraps=update_player_stats) as update:
+            data = self.client.post('/guess', json={'guesses': ['c', 'k', 'e', 't', 'q']}).get_json()
+        self.assertTrue(data['game_over'] and data['is_win'])
+        self.assertEqual(data['results'][-1], {'letter': 'q', 'success': False, 'error': 'The game is already over.'})
+        self.assertEqual(data['stats']['total_games'], 1)
+        self.assertEqual(update.call_count, 1)
+        state = self.client.get('/api/state?mode=Classic').get_json()
+        self.assertEqual(state['guessed_letters'], list('rzocket')) # In the order they were played
+
+        data = self.client.post('/guess', json={'guesses': ['a']}).get_json()
+        self.assertFalse(data['success'])
+        self.assertEqual(data['results'][0]['error'], 'The game is already over.')
+
+    def test_batch_guess_rejects_bad_lists(self):
+        self.client.get('/api/state?mode=Classic')
+        for guesses in ([], 'abc', list('abcdefghijklmnopqrstuvwxyza')):
+            response = self.client.post('/guess', json={'guesses': guesses})
+            self.assertEqual(response.status_code, 400)
+        for body in (['a'], 'a', 1):
+            response = self.client.post('/guess', json=body)
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse(response.get_json()['success'])
+        data = self.client.post('/guess', json={'guesses': ['r', 'r']}).get_json()
+        self.assertEqual([r['success'] for r in data['results']], [True, False])
+        self.assertNotIn('guessed_letter', data) # Batch responses only have per-letter results
+
+    def test_delta_guess(self):
+        self.client.get('/api/state?mode=Classic')
+        self.assertEqual(self.client.post('/guess', json={'guess': 'o', 'delta': True}).get_json(),
+                         {'success': True, 'letter': 'o', 'revealed': [1], 'incorrect_guesses': 0})
+        self.assertEqual(self.client.post('/guess', json={'guess': 'z', 'delta': True}).get_json(),
+                         {'success': True, 'letter': 'z', 'revealed': [], 'incorrect_guesses': 1})
+        self.assertEqual(self.client.post('/guess', json={'guess': 'z', 'delta': True}).get_json(),
+                         {'success': False, 'error': 'Letter already guessed.'})
+
+        data = self.client.post('/guess', json={'guesses': ['r', 'o', 'c', 'k', 'e', 't'], 'delta': True}).get_json()
+        self.assertEqual(data['results'][:2], [{'letter': 'r', 'revealed': [0]}, {'letter': 'o', 'error': 'Letter already guessed.'}])
+        self.assertTrue(data['game_over'] and data['is_win'])
+        self.assertEqual(data['answer'], 'Rocket')
+        self.assertEqual(data['stats']['total_games'], 1)
+        self.assertNotIn('answer_display', data)
+        self.assertNotIn('guessed_letters', data)
+
+    def test_state_without_riddle(self):
+        state = self.client.get('/api/state?mode=Pixelated').get_json()
+        self.assertIsNone(state['riddle_id'])
+        self.assertTrue(state['game_over'])
+
+    def test_pages_are_rendered_once_per_day(self):
+        with mock.patch('app.routes.render_template', wraps=render_template) as render:
+            first = self.client.get('/?mode=Classic')
+            second = self.client.get('/?mode=Classic')
+            self.client.get('/more-games')
+            more_games = self.client.get('/more-games')
+            self.assertEqual(render.call_count, 2)
+            self.assertEqual(first.data, second.data)
+            self.assertIn(b'Pixelated', more_games.data)
+            self.assertTrue(more_games.cache_control.public)
+
+            with mock.patch('app.page_cache.current_day_number', return_value=current_day_number() + 1):
+                self.client.get('/?mode=Classic') # The cache of the previous day is dropped
+            self.assertEqual(render.call_count, 3)
+
+            self.client.get('/?mode=Nope')
+            self.client.get('/?mode=Nope')
+            self.assertEqual(render.call_count, 5) # Unknown modes aren't cached
+
+    def test_cache_can_be_disabled(self):
+        page_cache.enabled = False
+        try:
+            with mock.patch('app.routes.render_template', wraps=render_template) as render:
+                self.client.get('/?mode=Classic')
+                self.client.get('/?mode=Classic')
+            self.assertEqual(render.call_count, 2)
+        finally:
+            page_cache.enabled = True
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+from datetime import timedelta
+from app import create_app, db
+from app.days import current_day_number, utc_today
+from app.game_state import get_game_state_store
+from app.models import Riddle, GameState
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+class GameStateBackendTests:
+    backend = None
+
+    def setUp(self):
+        config = type('BackendConfig', (TestConfig,), {'GAME_STATE_BACKEND': self.backend})
+        self.app = create_app(config)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        db.session.add(Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=current_day_number(), game_mode='Classic'))
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def test_guesses_survive_reload(self):
+        self.client.get('/api/state?mode=Classic')
+        self.client.post('/guess', json={'guess': 'r'})
+        self.client.post('/guess', json={'guess': 'x'})
+        state = self.client.get('/api/state?mode=Classic').get_json()
+        self.assertEqual(state['guessed_letters'], ['r', 'x'])
+        self.assertEqual(state['incorrect_guesses'], 1)
+        data = self.client.post('/guess', json={'guess': 'r'}).get_json()
+        self.assertEqual(data['error'], 'Letter already guessed.')
+
+    def test_old_days_expire(self):
+        store = get_game_state_store()
+        old_iso = (utc_today() - timedelta(days=store.ttl_days + 1)).isoformat()
+        today_iso = utc_today().isoformat()
+        state = {'riddle_id': 1, 'guesses': ['a'], 'game_over': False, 'is_win': False}
+        with self.app.test_request_context('/'):
+            store.save('player', old_iso, 'Classic', state)
+            store.prune()
+            store.save('player', today_iso, 'Classic', state)
+            self.assertIsNone(store.load('player', old_iso, 'Classic'))
+            self.assertEqual(store.load('player', today_iso, 'Classic'), state)
+
+
+class TestCookieBackend(GameStateBackendTests, unittest.TestCase):
+    backend = 'cookie'
+
+
+class TestMemoryBackend(GameStateBackendTests, unittest.TestCase):
+    backend = 'memory'
+
+
+class TestSQLBackend(GameStateBackendTests, unittest.TestCase):
+    backend = 'sql'
+
+    def test_cookie_only_holds_the_player_token(self):
+        self.client.get('/api/state?mode=Classic')
+        self.client.post('/guess', json={'guess': 'r'})
+        with self.client.session_transaction() as sess:
+            self.assertNotIn('game_states_by_day_mode', sess)
+        self.assertEqual(GameState.query.one().guesses, 'r')
+
+    def test_prunes_once_per_interval(self):
+        store = get_game_state_store()
+        state = {'riddle_id': 1, 'guesses': [], 'game_over': False, 'is_win': False}
+        with mock.patch.object(store, 'prune', wraps=store.prune) as prune:
+            store.save('player', utc_today().isoformat(), 'Classic', state)
+            self.assertEqual(prune.call_count, 0) # Not on a worker's first save
+            store._last_prune -= store.prune_interval_seconds
+            store.save('player', utc_today().isoformat(), 'Classic', state)
+            self.assertEqual(prune.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
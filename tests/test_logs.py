@@ -0,0 +1,91 @@
+import io
+import json
+import logging
+import unittest
+from app import create_app, db
+from app.logs import DebugSampler, JsonFormatter, parse_levels, stop_logging
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+
+
+def make_record(level=logging.DEBUG, msg='index', args=None, **extra):
+    record = logging.LogRecord('app.routes', level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestLogRecords(unittest.TestCase):
+    def test_json_formatter(self):
+        entry = json.loads(JsonFormatter().format(make_record(logging.INFO, 'mode %s', ('Classic',), day_number=5)))
+        self.assertEqual(entry['level'], 'INFO')
+        self.assertEqual(entry['logger'], 'app.routes')
+        self.assertEqual(entry['message'], 'mode Classic')
+        self.assertEqual(entry['day_number'], 5)
+        self.assertRegex(entry['time'], r'^\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{3}\+00:00$')
+
+    def test_debug_sampler(self):
+        sampler = DebugSampler(0.25)
+        kept = [sampler.filter(make_record()) for _ in range(8)]
+        self.assertEqual(kept, [True, False, False, False] * 2)
+        self.assertTrue(sampler.filter(make_record(msg='other'))) # Counted per message
+        self.assertTrue(all(sampler.filter(make_record(logging.INFO)) for _ in range(4)))
+        self.assertFalse(DebugSampler(0).filter(make_record()))
+
+    def test_parse_levels(self):
+        self.assertEqual(parse_levels('app.routes=debug, app.stats=WARNING,'), {'app.routes': 'DEBUG', 'app.stats': 'WARNING'})
+        self.assertEqual(parse_levels(''), {})
+
+
+class TestLoggingSetup(unittest.TestCase):
+    def create_app(self, **config):
+        self.stream = io.StringIO()
+        app = create_app(type('LogConfig', (TestConfig,), {'LOG_STREAM': self.stream, **config}))
+        self.app_context = app.app_context()
+        self.app_context.push()
+        db.create_all()
+        return app
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def records(self):
+        stop_logging() # Drains the queue
+        return [json.loads(line) for line in self.stream.getvalue().splitlines()]
+
+    def test_request_logs_are_json(self):
+        client = self.create_app(LOG_LEVEL='INFO', LOG_LEVELS='app.routes=DEBUG').test_client()
+        client.get('/api/state?mode=Classic')
+        client.get('/more-games')
+        logging.getLogger('app.stats').debug('not shown')
+        records = self.records()
+        messages = [record['message'] for record in records]
+        self.assertIn('Created new player UUID', messages)
+        self.assertIn('more_games: Rendering more_games.html', messages)
+        self.assertNotIn('not shown', messages)
+        new_player = records[messages.index('Created new player UUID')]
+        self.assertEqual(new_player['level'], 'INFO')
+        self.assertRegex(new_player['player_uuid'], r'^[0-9a-f-]{36}$')
+
+    def test_levels_and_sampling(self):
+        client = self.create_app(LOG_LEVEL='DEBUG', LOG_DEBUG_SAMPLE_RATE=0.5).test_client()
+        for _ in range(4):
+            client.get('/?mode=Classic') # Debug line for every view, rendered once
+        index_records = [record for record in self.records() if record['message'] == 'index']
+        self.assertEqual(len(index_records), 2)
+        self.assertEqual(index_records[0]['sampled'], 2)
+        self.assertEqual(index_records[0]['mode'], 'Classic')
+
+        self.app_context.pop()
+        self.create_app(LOG_LEVEL='WARNING').test_client().get('/?mode=Classic')
+        routes_records = [record for record in self.records() if record['logger'] == 'app.routes']
+        self.assertEqual([(record['level'], record['message']) for record in routes_records], [('ERROR', 'index: No riddle found')])
+
+
+if __name__ == '__main__':
+    unittest.main()
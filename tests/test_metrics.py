@@ -0,0 +1,86 @@
+import re
+import unittest
+from app import create_app, db
+from app.days import current_day_number
+from app.metrics import metrics, Histogram
+from app.models import Riddle
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+    RIDDLE_SOURCE = 'table'
+
+
+def sample(text, name, **labels):
+    """The value of one sample in the exposition text."""
+    label_text = ','.join(f'{key}="{value}"' for key, value in labels.items())
+    match = re.search(rf'^{re.escape(name)}{re.escape("{" + label_text + "}" if labels else "")} (\S+)$', text, re.M)
+    return float(match.group(1)) if match else None
+
+
+class TestHistogram(unittest.TestCase):
+    def test_render(self):
+        histogram = Histogram('latency_seconds', 'Latency.', (0.1, 1), ('endpoint',))
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value, 'a"b')
+        lines = []
+        histogram.render(lines)
+        self.assertEqual(lines, [
+            '# HELP latency_seconds Latency.',
+            '# TYPE latency_seconds histogram',
+            'latency_seconds_bucket{endpoint="a\\"b",le="0.1"} 2',
+            'latency_seconds_bucket{endpoint="a\\"b",le="1"} 3',
+            'latency_seconds_bucket{endpoint="a\\"b",le="+Inf"} 4',
+            'latency_seconds_sum{endpoint="a\\"b"} 3.65',
+            'latency_seconds_count{endpoint="a\\"b"} 4',
+        ])
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        db.session.add(Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=current_day_number(), game_mode='Classic'))
+        db.session.commit()
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def test_requests_are_recorded(self):
+        self.client.get('/?mode=Classic')
+        self.client.get('/api/state?mode=Classic')
+        for letter in 'rz':
+            self.client.post('/guess', json={'guess': letter})
+        self.client.get('/nope')
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        self.assertTrue(response.cache_control.no_store)
+        text = response.get_data(as_text=True)
+
+        self.assertEqual(sample(text, 'emojile_request_duration_seconds_count', endpoint='main.make_guess'), 2)
+        self.assertEqual(sample(text, 'emojile_requests_total', endpoint='main.index', status='200'), 1)
+        self.assertEqual(sample(text, 'emojile_requests_total', endpoint='none', status='404'), 1)
+        self.assertGreater(sample(text, 'emojile_request_sql_queries_sum', endpoint='main.get_state'), 0)
+        self.assertEqual(sample(text, 'emojile_template_render_seconds_count', template='classic_game.html'), 1)
+        self.assertEqual(sample(text, 'emojile_session_cookie_bytes_count'), 5)
+        self.assertGreater(sample(text, 'emojile_session_cookie_bytes_sum'), 0) # The guesses sent the cookie
+        self.assertEqual(sample(text, 'emojile_page_cache_requests_total', result='miss'), 1)
+        self.assertNotIn('endpoint="metrics"', text)
+
+    def test_disabled(self):
+        app = create_app(type('NoMetricsConfig', (TestConfig,), {'METRICS_ENABLED': False}))
+        self.assertEqual(app.test_client().get('/metrics').status_code, 404)
+        metrics.enabled = True
+
+
+if __name__ == '__main__':
+    unittest.main()
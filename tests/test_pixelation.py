@@ -0,0 +1,163 @@
+import hashlib
+import io
+import json
+import re
+import shutil
+import tempfile
+import unittest
+from app import create_app, db
+from app.days import current_day_number
+from app.models import Riddle
+from app.pixelation import pixelator, block_average, level_for, EmojiPixelator, FULL_LEVEL, LEVEL_SIZES
+from config import Config
+
+try:
+    from PIL import Image, ImageFont
+    TEST_FONT = ImageFont.load_default(size=100) # Scalable when Pillow has FreeType
+except (ImportError, TypeError, AttributeError):
+    Image = TEST_FONT = None
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+
+
+class TestLevels(unittest.TestCase):
+    def test_level_for(self):
+        self.assertEqual([level_for(n, False, 3) for n in range(5)], [0, 1, 2, FULL_LEVEL, FULL_LEVEL])
+        self.assertEqual(level_for(0, True, 3), FULL_LEVEL)
+
+
+@unittest.skipUnless(TEST_FONT is not None, 'needs Pillow with FreeType')
+class TestPixelator(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.pixelator = EmojiPixelator(cache_dir=self.cache_dir, font=TEST_FONT, font_id='test')
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def test_block_average(self):
+        image = Image.new('RGBA', (256, 256), (0, 0, 0, 0))
+        image.paste((200, 100, 50, 255), (0, 0, 128, 256)) # Left half opaque
+        averaged = block_average(image, 2)
+        self.assertEqual(averaged.size, (2, 2))
+        self.assertEqual(averaged.getpixel((0, 0)), (200, 100, 50, 255))
+        self.assertEqual(averaged.getpixel((1, 0)), (0, 0, 0, 0))
+        edge = block_average(image.crop((64, 0, 192, 128)).resize((256, 256), Image.NEAREST), 1)
+        self.assertEqual(edge.getpixel((0, 0)), (200, 100, 50, 128)) # Color isn't darkened by the transparent half
+
+    def test_levels_are_rendered_once_and_cached(self):
+        pngs = self.pixelator.render_levels('A')
+        sizes = [Image.open(io.BytesIO(png)).size for png in pngs]
+        self.assertEqual(sizes, [(size, size) for size in LEVEL_SIZES])
+
+        png, key = self.pixelator.get_png('A', 1)
+        self.assertEqual(png, pngs[1])
+        self.assertEqual(self.pixelator.renders, 1)
+        self.assertRegex(key, r'^[0-9a-f]{64}$')
+        self.assertNotEqual(key, self.pixelator.cache_key('B', 1))
+        self.assertNotEqual(key, EmojiPixelator(font_id='other').cache_key('A', 1))
+
+        # Byte-identical on every render
+        fresh = EmojiPixelator(cache_dir=tempfile.mkdtemp(), font=TEST_FONT, font_id='test')
+        try:
+            self.assertEqual(fresh.get_png('A', 1)[0], png)
+        finally:
+            shutil.rmtree(fresh.cache_dir)
+
+
+@unittest.skipUnless(TEST_FONT is not None, 'needs Pillow with FreeType')
+class TestPixelatedEndpoint(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        today = current_day_number()
+        db.session.add_all([
+            Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=today, game_mode='Pixelated'),
+            Riddle(emoji='🌙', name='Moon', category='Travel & Places', day_number=today - 1, game_mode='Pixelated'),
+            Riddle(emoji='⭐', name='Star', category='Travel & Places', day_number=today + 1, game_mode='Pixelated'),
+        ])
+        db.session.commit()
+        self.ids = {r.name: r.id for r in Riddle.query.all()}
+        self.cache_dir = tempfile.mkdtemp()
+        pixelator.cache_dir = self.cache_dir
+        pixelator.use_font(TEST_FONT, font_id='test')
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        pixelator.font = pixelator.font_id = None
+        db.session.remove()
+        self.app_context.pop()
+        shutil.rmtree(self.cache_dir)
+
+    def image(self, name, level, **kwargs):
+        return self.client.get(f'/api/pixelated/{self.ids[name]}/{level}.png', **kwargs)
+
+    def test_page_has_image_urls_not_the_emoji(self):
+        html = self.client.get('/?mode=Pixelated').get_data(as_text=True)
+        config = json.loads(re.search(r'<script id="game-config-data" type="application/json">(.*?)</script>', html, re.S).group(1))
+        self.assertIsNone(config['emoji'])
+        self.assertEqual(len(config['pixelatedImageUrls']), 4)
+        for level, url in enumerate(config['pixelatedImageUrls']):
+            self.assertRegex(url, rf'^/api/pixelated/{self.ids["Rocket"]}/{level}\.png\?v=[0-9a-f]{{12}}$')
+        self.assertNotIn('\\ud83d\\ude80', html)
+        response = self.client.get(config['pixelatedImageUrls'][0])
+        self.assertGreaterEqual(response.cache_control.max_age, 30 * 24 * 3600) # Versioned: kept for a year
+        self.assertTrue(self.image('Rocket', 0).cache_control.must_revalidate) # Unversioned: revalidated
+
+    def test_levels_follow_the_players_guesses(self):
+        response = self.image('Rocket', 0)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'image/png')
+        self.assertTrue(response.cache_control.public)
+        self.assertEqual(self.image('Rocket', 0, headers={'If-None-Match': response.headers['ETag']}).status_code, 304)
+        self.assertEqual(self.image('Rocket', 1).status_code, 403)
+        self.assertEqual(self.client.get(f'/api/get-emoji/{self.ids["Rocket"]}').status_code, 403)
+
+        self.client.get('/api/state?mode=Pixelated')
+        self.client.post('/guess', json={'guess': 'z'})
+        response = self.image('Rocket', 1)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.cache_control.private)
+        self.assertEqual(self.image('Rocket', 2).status_code, 403)
+
+        for letter in 'xq':
+            self.client.post('/guess', json={'guess': letter})
+        self.assertEqual(self.image('Rocket', FULL_LEVEL).status_code, 200)
+        response = self.client.get(f'/api/get-emoji/{self.ids["Rocket"]}')
+        self.assertEqual(response.get_json(), {'emoji': '🚀'})
+        self.assertTrue(response.cache_control.private)
+
+    def test_etag_is_not_derived_from_the_emoji(self):
+        response = self.image('Rocket', 0)
+        etag = response.headers['ETag'].strip('"')
+        derivable = {pixelator.cache_key(emoji, 0)[:20] for emoji in ('🚀', '🌙', '⭐')}
+        derivable |= {hashlib.new(name, response.data).hexdigest()[:20] for name in ('sha1', 'sha256')}
+        self.assertNotIn(etag, derivable)
+        self.assertEqual(self.image('Rocket', 0).headers['ETag'], response.headers['ETag'])
+        self.app.config['SECRET_KEY'] = 'another secret'
+        self.assertNotEqual(self.image('Rocket', 0).headers['ETag'], response.headers['ETag'])
+
+    def test_other_days(self):
+        self.assertEqual(self.image('Moon', FULL_LEVEL).status_code, 200)
+        self.assertEqual(self.image('Star', 0).status_code, 403)
+        self.assertEqual(self.image('Rocket', 9).status_code, 404)
+        self.assertEqual(self.client.get('/api/pixelated/999999/0.png').status_code, 404)
+
+    def test_unavailable_falls_back_to_the_canvas(self):
+        pixelator.font = None
+        self.assertEqual(self.image('Rocket', 0).status_code, 404)
+        html = self.client.get('/?mode=Pixelated').get_data(as_text=True)
+        config = json.loads(re.search(r'<script id="game-config-data" type="application/json">(.*?)</script>', html, re.S).group(1))
+        self.assertIsNone(config['pixelatedImageUrls'])
+        self.assertRegex(config['pixelationWorkerUrl'], r'/emoji_renderer(\.[0-9a-f]{12})?\.js$') # Pixelates in the browser
+        self.assertEqual(self.client.get(f'/api/get-emoji/{self.ids["Rocket"]}').get_json(), {'emoji': '🚀'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,202 @@
+import shutil
+import tempfile
+import unittest
+from app import create_app, db, riddle_repository
+from app.days import current_day_number
+from app.game_state import get_game_state_store
+from app.models import Riddle
+from app.pixelation import pixelator
+from config import Config
+from query_budget import QueryBudgetMixin, QueryCounter
+
+try:
+    from PIL import ImageFont
+    TEST_FONT = ImageFont.load_default(size=100) # Scalable when Pillow has FreeType
+except (ImportError, TypeError, AttributeError):
+    TEST_FONT = None
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    DEPLOY_VERSION = 'test'
+
+
+# SQL statements each endpoint may issue, per scenario. Raise a budget only together with the
+# change that needs the extra query, and lower it when a query goes away.
+QUERY_BUDGETS = {
+    'main.index': {
+        'cold riddle cache': 1, # Today's riddles, loaded once per worker
+        'first visit': 0,
+    },
+    'main.get_state': {
+        'first visit': 1, # The player's stats
+        'returning player': 1,
+        'game over': 1,
+    },
+    'main.make_guess': {
+        'mid-game guess': 0,
+        'rejected guess': 0,
+        'final guess': 1, # The stats upsert; the response's stats are computed from its result
+        'game-over replay': 0,
+    },
+    'main.get_emoji': {
+        "today's riddle": 0,
+        'archive riddle': 1, # Not in the riddle cache yet
+        'archive riddle, cached': 0,
+    },
+    'main.pixelated_image': {
+        'first visit': 0,
+        'mid-game guess': 0,
+    },
+    'main.more_games': {
+        'first visit': 0,
+    },
+    'main.asset': {
+        'unknown file': 0,
+    },
+    'metrics': {
+        'scrape': 0,
+    },
+}
+
+# With GAME_STATE_BACKEND='sql' the game state is a row too: loaded on every request that
+# needs it, inserted on the first visit and updated after each guess.
+SQL_STATE_QUERY_BUDGETS = {
+    'main.get_state': {
+        'first visit': 4,
+        'returning player': 2,
+        'game over': 2,
+    },
+    'main.make_guess': {
+        'mid-game guess': 3,
+        'rejected guess': 1,
+        'final guess': 4,
+        'game-over replay': 1,
+    },
+    'main.pixelated_image': {
+        'mid-game guess': 1,
+    },
+}
+
+
+class QueryBudgetTests(QueryBudgetMixin):
+    backend = None
+    budget_overrides = {}
+
+    def setUp(self):
+        config = type('BudgetConfig', (TestConfig,), {'GAME_STATE_BACKEND': self.backend})
+        self.app = create_app(config)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        today = current_day_number()
+        db.session.add_all([
+            Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=today, game_mode='Classic'),
+            Riddle(emoji='🌙', name='Moon', category='Travel & Places', day_number=today - 1, game_mode='Classic'),
+            Riddle(emoji='⭐', name='Star', category='Travel & Places', day_number=today, game_mode='Pixelated'),
+        ])
+        db.session.commit()
+        self.ids = {r.name: r.id for r in Riddle.query.all()}
+        riddle_repository.get_for_day('Classic', today) # A worker that has served today already
+        store = get_game_state_store()
+        if hasattr(store, 'prune_interval_seconds'):
+            store.prune_interval_seconds = float('inf') # The periodic prune isn't part of any request's budget
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def budget(self, endpoint, scenario):
+        return self.budget_overrides.get(endpoint, {}).get(scenario, QUERY_BUDGETS[endpoint][scenario])
+
+    def within_budget(self, endpoint, scenario, method, *args, **kwargs):
+        response = self.assertQueryBudget(self.budget(endpoint, scenario), method, *args, **kwargs)
+        self.assertLess(response.status_code, 500)
+        return response
+
+    def guess(self, scenario, **body):
+        return self.within_budget('main.make_guess', scenario, self.client.post, '/guess', json=body).get_json()
+
+    def test_every_route_has_a_budget(self):
+        endpoints = {rule.endpoint for rule in self.app.url_map.iter_rules() if rule.endpoint != 'static'}
+        self.assertEqual(endpoints - set(QUERY_BUDGETS), set())
+
+    def test_index(self):
+        riddle_repository.clear()
+        self.within_budget('main.index', 'cold riddle cache', self.client.get, '/?mode=Classic')
+        self.within_budget('main.index', 'first visit', self.app.test_client().get, '/?mode=Classic')
+
+    def test_game_won(self):
+        self.within_budget('main.get_state', 'first visit', self.client.get, '/api/state?mode=Classic')
+        self.within_budget('main.get_state', 'returning player', self.client.get, '/api/state?mode=Classic')
+        self.assertTrue(self.guess('mid-game guess', guess='r')['is_correct'])
+        self.assertEqual(self.guess('rejected guess', guess='r')['error'], 'Letter already guessed.')
+        self.guess('mid-game guess', guesses=['o', 'c', 'k'], delta=True)
+        self.assertTrue(self.guess('final guess', guesses=['e', 't'], delta=True)['is_win'])
+        self.assertIn('error', self.guess('game-over replay', guess='a'))
+        self.assertTrue(self.within_budget('main.get_state', 'game over', self.client.get, '/api/state?mode=Classic').get_json()['game_over'])
+
+    def test_game_lost(self):
+        self.client.get('/api/state?mode=Classic')
+        self.guess('mid-game guess', guess='x', delta=True)
+        self.guess('mid-game guess', guess='q')
+        data = self.guess('final guess', guess='z')
+        self.assertTrue(data['game_over'])
+        self.assertFalse(data['is_win'])
+        self.guess('game-over replay', guesses=['a'], delta=True)
+
+    def test_get_emoji(self):
+        self.client.get('/api/state?mode=Classic')
+        self.client.post('/guess', json={'guesses': ['x', 'q', 'z']})
+        self.within_budget('main.get_emoji', "today's riddle", self.client.get, f"/api/get-emoji/{self.ids['Rocket']}")
+        self.within_budget('main.get_emoji', 'archive riddle', self.client.get, f"/api/get-emoji/{self.ids['Moon']}")
+        self.within_budget('main.get_emoji', 'archive riddle, cached', self.client.get, f"/api/get-emoji/{self.ids['Moon']}")
+
+    @unittest.skipUnless(TEST_FONT is not None, 'needs Pillow with FreeType')
+    def test_pixelated_image(self):
+        cache_dir = tempfile.mkdtemp()
+        pixelator.cache_dir = cache_dir
+        pixelator.use_font(TEST_FONT, font_id='test')
+        try:
+            url = f"/api/pixelated/{self.ids['Star']}"
+            self.client.get('/?mode=Pixelated')
+            self.within_budget('main.pixelated_image', 'first visit', self.client.get, f'{url}/0.png')
+            self.client.get('/api/state?mode=Pixelated')
+            self.client.post('/guess', json={'guess': 'z'})
+            response = self.within_budget('main.pixelated_image', 'mid-game guess', self.client.get, f'{url}/1.png')
+            self.assertEqual(response.status_code, 200)
+        finally:
+            pixelator.font = pixelator.font_id = None
+            shutil.rmtree(cache_dir)
+
+    def test_static_pages(self):
+        self.within_budget('main.more_games', 'first visit', self.client.get, '/more-games')
+        self.within_budget('main.asset', 'unknown file', self.client.get, '/assets/missing.js')
+        self.within_budget('metrics', 'scrape', self.client.get, '/metrics')
+
+
+class TestCookieStateBudgets(QueryBudgetTests, unittest.TestCase):
+    backend = 'cookie'
+
+    def test_over_budget_lists_the_statements(self):
+        with self.assertRaises(AssertionError) as caught:
+            self.assertQueryBudget(0, self.client.get, '/api/state?mode=Classic')
+        self.assertIn('1 SQL statements, over the budget of 0:', str(caught.exception))
+        self.assertIn('1. SELECT player_stats.player_uuid', str(caught.exception))
+
+    def test_counter_without_queries(self):
+        with QueryCounter() as counter:
+            self.client.get('/more-games')
+        self.assertEqual(len(counter), 0)
+        self.assertEqual(counter.report(), '  (none)')
+
+
+class TestSQLStateBudgets(QueryBudgetTests, unittest.TestCase):
+    backend = 'sql'
+    budget_overrides = SQL_STATE_QUERY_BUDGETS
+
+
+if __name__ == '__main__':
+    unittest.main()
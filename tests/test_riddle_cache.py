@@ -0,0 +1,62 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db, riddle_repository
+from app.days import current_day_number
+from app.models import Riddle
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    RIDDLE_CACHE_ARCHIVE_SIZE = 2
+
+
+class TestRiddleRepository(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+        self.today = current_day_number()
+        for day in range(self.today - 3, self.today + 1):
+            db.session.add(Riddle(emoji='🚀', name='Rocket', category='Travel & Places', day_number=day, game_mode='Classic'))
+            db.session.add(Riddle(emoji='🍎', name='Red Apple', category='Food & Drink', day_number=day, game_mode='Pixelated'))
+        db.session.commit()
+        self.queries = []
+        event.listen(db.engine, 'before_cursor_execute', self._count_query)
+
+    def tearDown(self):
+        event.remove(db.engine, 'before_cursor_execute', self._count_query)
+        db.session.remove()
+        self.app_context.pop()
+
+    def _count_query(self, conn, cursor, statement, *args):
+        self.queries.append(statement)
+
+    def test_today_is_loaded_once_for_all_modes(self):
+        classic = riddle_repository.get_for_day('Classic', self.today)
+        pixelated = riddle_repository.get_for_day('Pixelated', self.today)
+        self.assertEqual(classic.name, 'Rocket')
+        self.assertEqual(pixelated.name, 'Red Apple')
+        self.assertIs(riddle_repository.get_by_id(classic.id), classic)
+        self.assertEqual(len(self.queries), 1)
+
+    def test_archive_lookups_are_bounded(self):
+        old = [riddle_repository.get_for_day('Classic', day) for day in range(self.today - 3, self.today)]
+        self.assertEqual([r.day_number for r in old], list(range(self.today - 3, self.today)))
+        query_count = len(self.queries)
+        # The two most recent archive entries are still cached, the oldest one was evicted
+        riddle_repository.get_by_id(old[-1].id)
+        riddle_repository.get_for_day('Classic', self.today - 2)
+        self.assertEqual(len(self.queries), query_count)
+        riddle_repository.get_for_day('Classic', self.today - 3)
+        self.assertEqual(len(self.queries), query_count + 1)
+
+    def test_missing_riddle(self):
+        self.assertIsNone(riddle_repository.get_for_day('Classic', self.today + 5))
+        self.assertIsNone(riddle_repository.get_by_id(12345))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db, riddle_repository
+from app.days import current_day_number
+from app.models import Riddle
+from app.scheduler import day_assignments, emoji_index, schedule_rows, scheduled_riddle_id, slot_for_riddle_id
+from config import Config
+
+
+class TestScheduler(unittest.TestCase):
+    def test_modes_never_share_an_emoji(self):
+        for catalog_size, num_modes in [(7, 2), (7, 7), (100, 3)]:
+            for day_number in range(-catalog_size, 3 * catalog_size):
+                picks = day_assignments(day_number, 'seed', catalog_size, num_modes)
+                self.assertEqual(len(set(picks)), num_modes)
+                self.assertEqual(picks[1], emoji_index(1, day_number, 'seed', catalog_size, num_modes))
+
+    def test_each_mode_cycles_through_the_catalog(self):
+        for cycle in range(3):
+            days = range(cycle * 50, (cycle + 1) * 50)
+            self.assertEqual(sorted(emoji_index(1, day, 'seed', 50, 2) for day in days), list(range(50)))
+
+    def test_deterministic_per_seed(self):
+        first = [emoji_index(0, day, 'a', 900, 2) for day in range(30)]
+        self.assertEqual(first, [emoji_index(0, day, 'a', 900, 2) for day in range(30)])
+        self.assertNotEqual(first, [emoji_index(0, day, 'b', 900, 2) for day in range(30)])
+
+    def test_riddle_ids(self):
+        self.assertEqual(slot_for_riddle_id(scheduled_riddle_id(1, 531)), (1, 531))
+
+    def test_schedule_rows_scale(self):
+        entries = [{'emoji': str(i), 'name': f'Emoji {i}', 'category': 'Test'} for i in range(10000)]
+        modes = [f'Mode {i}' for i in range(40)]
+        rows = list(schedule_rows(entries, modes, 'seed', range(10000)))
+        self.assertEqual(len(rows), 400000)
+        self.assertEqual(len({row['id'] for row in rows}), len(rows))
+        first_day = [row['emoji'] for row in rows[:40]]
+        self.assertEqual(len(set(first_day)), 40)
+
+    def test_too_small_catalog(self):
+        with self.assertRaises(ValueError):
+            emoji_index(0, 0, 'seed', 1, 2)
+
+
+class ScheduleConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    RIDDLE_SOURCE = 'schedule'
+
+
+class TestScheduledRiddles(unittest.TestCase):
+    def test_riddles_without_queries(self):
+        app = create_app(ScheduleConfig)
+        queries = []
+        with app.app_context():
+            event.listen(db.engine, 'before_cursor_execute', lambda *args: queries.append(args[2]))
+            today = current_day_number()
+            classic = riddle_repository.get_for_day('Classic', today)
+            pixelated = riddle_repository.get_for_day('Pixelated', today)
+            self.assertNotEqual(classic.emoji, pixelated.emoji)
+            self.assertEqual(riddle_repository.get_by_id(pixelated.id), pixelated)
+            self.assertEqual(riddle_repository.get_by_id(scheduled_riddle_id(0, today - 10)).day_number, today - 10)
+        self.assertEqual(queries, [])
+
+    def test_future_riddles_are_not_served(self):
+        client = create_app(ScheduleConfig).test_client()
+        today = current_day_number()
+        self.assertEqual(client.get(f'/api/get-emoji/{scheduled_riddle_id(0, today)}').status_code, 200)
+        self.assertEqual(client.get(f'/api/get-emoji/{scheduled_riddle_id(0, today + 1)}').status_code, 404)
+
+
+class TestInitDb(unittest.TestCase):
+    def test_init_db_materializes_the_schedule(self):
+        app = create_app(ScheduleConfig)
+        result = app.test_cli_runner().invoke(args=['main', 'init-db', '--days', '30'])
+        self.assertIn('Successfully committed 60 riddles', result.output)
+        with app.app_context():
+            self.assertEqual(Riddle.query.count(), 60)
+            computed = riddle_repository.get_for_day('Pixelated', 17)
+            stored = db.session.get(Riddle, computed.id)
+            self.assertEqual((stored.emoji, stored.day_number, stored.game_mode), (computed.emoji, 17, 'Pixelated'))
+
+    def test_extend_schedule_appends_days(self):
+        app = create_app(ScheduleConfig)
+        runner = app.test_cli_runner()
+        runner.invoke(args=['main', 'init-db', '--days', '10'])
+        with app.app_context():
+            before = {riddle.id: riddle.emoji for riddle in Riddle.query.all()}
+            # Pixelated fell behind: it has to catch up without clashing with Classic
+            Riddle.query.filter(Riddle.game_mode == 'Pixelated', Riddle.day_number >= 6).delete()
+            db.session.commit()
+
+        result = runner.invoke(args=['main', 'extend-schedule', '--days', '5'])
+        self.assertIn('Added 14 riddles for day_numbers 6-14', result.output)
+        with app.app_context():
+            riddles = Riddle.query.all()
+            self.assertEqual(len(riddles), 30)
+            for riddle in riddles:
+                if riddle.day_number < 10 and riddle.game_mode == 'Classic':
+                    self.assertEqual(before[riddle.id], riddle.emoji) # Untouched
+                self.assertEqual(slot_for_riddle_id(riddle.id)[1], riddle.day_number)
+            for day_number in range(15):
+                emojis = [riddle.emoji for riddle in riddles if riddle.day_number == day_number]
+                self.assertEqual(len(set(emojis)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from datetime import timedelta
+from flask.json.tag import TaggedJSONSerializer
+from app.days import utc_today
+from app.session_codec import CompactSessionSerializer
+
+
+class TestCompactSessionSerializer(unittest.TestCase):
+    def setUp(self):
+        self.serializer = CompactSessionSerializer(['Classic', 'Pixelated'], window_days=2)
+        self.today = utc_today()
+
+    def state(self, guesses, game_over=False, is_win=False):
+        return {'riddle_id': 42, 'guesses': guesses, 'game_over': game_over, 'is_win': is_win}
+
+    def test_round_trip(self):
+        session_data = {
+            'player_uuid': '6f1c1f0e-8a43-4c4e-9d55-0f0e6b6b2a10',
+            'active_state_mode': 'Pixelated',
+            'active_state_date_iso': self.today.isoformat(),
+            'game_states_by_day_mode': {
+                self.today.isoformat(): {
+                    'Classic': self.state(['r', 'x', 'a'], game_over=True, is_win=True), # Kept in play order
+                    'Pixelated': self.state(['z']),
+                },
+            },
+            '_flashes': [('info', 'hello')],
+        }
+        payload = self.serializer.dumps(session_data)
+        self.assertLess(len(payload), len(TaggedJSONSerializer().dumps(session_data)) / 2)
+        self.assertEqual(self.serializer.loads(payload), session_data)
+
+    def test_old_days_are_dropped(self):
+        old_iso = (self.today - timedelta(days=2)).isoformat()
+        session_data = {'game_states_by_day_mode': {old_iso: {'Classic': self.state(['a'])}}}
+        self.assertEqual(self.serializer.loads(self.serializer.dumps(session_data)), {})
+
+    def test_unknown_modes_and_legacy_cookies(self):
+        session_data = {'game_states_by_day_mode': {self.today.isoformat(): {'Mashup': self.state(['b', 'a'])}}}
+        self.assertEqual(self.serializer.loads(self.serializer.dumps(session_data)), session_data)
+        legacy = TaggedJSONSerializer().dumps({'player_uuid': 'abc'}).encode('utf-8')
+        self.assertEqual(self.serializer.loads(legacy), {'player_uuid': 'abc'})
+
+
+if __name__ == '__main__':
+    unittest.main()
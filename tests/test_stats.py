@@ -0,0 +1,125 @@
+import threading
+import unittest
+from unittest import mock
+from datetime import date, datetime, timedelta, timezone
+from app import create_app, db
+from app.models import PlayerStats
+from app.routes import get_player_stats_dict, update_player_stats
+from app.stats import upsert_player_stats, _update_player_stats_orm, stats_to_dict, stats_writer
+from config import Config
+
+
+class TestConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+# (is_win, incorrect guesses, days after the first game)
+GAMES = [(True, 1, 0), (False, 3, 1), (True, 0, 1), (True, 2, 2), (True, 0, 5), (False, 3, 6), (True, 1, 7)]
+
+
+class TestStatsUpsert(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        self.app_context.pop()
+
+    def play(self, record, player_uuid):
+        first_day = date(2025, 6, 1)
+        row = None
+        for is_win, incorrect, day_offset in GAMES:
+            game_date = first_day + timedelta(days=day_offset)
+            played_at = datetime.combine(game_date, datetime.min.time(), tzinfo=timezone.utc) + timedelta(hours=12)
+            row = record(player_uuid, 'Classic', is_win, incorrect, game_date, played_at)
+            db.session.commit()
+        return stats_to_dict(row)
+
+    def test_upsert_matches_read_modify_write(self):
+        upserted = self.play(upsert_player_stats, 'upsert')
+        expected = self.play(_update_player_stats_orm, 'orm')
+        self.assertEqual(upserted, expected)
+        self.assertEqual(upserted['total_games'], 7)
+        self.assertEqual((upserted['current_play_streak'], upserted['longest_play_streak']), (3, 3))
+        self.assertEqual((upserted['current_correct_streak'], upserted['longest_correct_streak']), (1, 3))
+        self.assertEqual(stats_to_dict(db.session.get(PlayerStats, ('upsert', 'Classic'))), upserted)
+
+
+class WriteBehindConfig(TestConfig):
+    STATS_WRITE_BEHIND = True
+    STATS_FLUSH_INTERVAL_SECONDS = 3600
+    STATS_FLUSH_MAX_ATTEMPTS = 2
+
+
+class TestStatsWriteBehind(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(WriteBehindConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self):
+        stats_writer.flush()
+        db.session.remove()
+        self.app_context.pop()
+
+    def test_reads_include_pending_games(self):
+        upsert_player_stats('player', 'Classic', True, 2, date(2025, 6, 1))
+        db.session.commit()
+        update_player_stats('player', 'Classic', False, 3, date(2025, 6, 2))
+        stats = get_player_stats_dict('player', 'Classic')
+        self.assertEqual((stats['total_games'], stats['avg_incorrect']), (2, 2.5))
+        self.assertEqual(db.session.get(PlayerStats, ('player', 'Classic')).total_games, 1)
+
+        self.assertEqual(stats_writer.flush(), 1)
+        db.session.expire_all()
+        self.assertEqual(stats_to_dict(db.session.get(PlayerStats, ('player', 'Classic'))), get_player_stats_dict('player', 'Classic'))
+        self.assertEqual(db.session.get(PlayerStats, ('player', 'Classic')).total_games, 2)
+
+    def test_reads_during_a_flush_count_each_game_once(self):
+        update_player_stats('player', 'Classic', True, 1, date(2025, 6, 1))
+        totals = []
+
+        def read():
+            with self.app.app_context():
+                totals.append(get_player_stats_dict('player', 'Classic')['total_games'])
+                db.session.remove()
+
+        readers = []
+        commit = db.session.commit
+
+        def commit_then_read():
+            commit()
+            # A read that arrives right after the batch is committed, before the flush is done
+            reader = threading.Thread(target=read)
+            reader.start()
+            readers.append(reader)
+            reader.join(5)
+            self.assertFalse(reader.is_alive()) # Not blocked by the flush
+
+        with mock.patch.object(db.session, 'commit', commit_then_read):
+            self.assertEqual(stats_writer.flush(), 1)
+        self.assertEqual(totals, [1])
+
+    def test_results_that_keep_failing_are_dropped(self):
+        def upsert(player_uuid, *args):
+            if player_uuid == 'poison':
+                raise ValueError('bad row')
+            return upsert_player_stats(player_uuid, *args)
+
+        update_player_stats('poison', 'Classic', True, 1, date(2025, 6, 1))
+        update_player_stats('player', 'Classic', True, 1, date(2025, 6, 1))
+        with mock.patch('app.stats.upsert_player_stats', upsert), self.assertLogs('app.stats', 'ERROR'):
+            self.assertEqual([stats_writer.flush() for _ in range(2)], [0, 0]) # Retried as a batch
+            self.assertEqual(stats_writer.flush(), 1) # Then one by one
+            self.assertEqual(stats_writer.flush(), 0)
+        self.assertEqual(db.session.get(PlayerStats, ('player', 'Classic')).total_games, 1)
+        self.assertIsNone(db.session.get(PlayerStats, ('poison', 'Classic')))
+
+
+if __name__ == '__main__':
+    unittest.main()